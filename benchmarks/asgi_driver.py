@@ -0,0 +1,170 @@
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def make_scope(
+    method: str,
+    path: str,
+    query_string: bytes = b"",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+    client: Tuple[str, int] = ("127.0.0.1", 50000),
+) -> Dict[str, Any]:
+    """
+    Builds a minimal HTTP ASGI scope, equivalent to what uvicorn hands the application.
+    """
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("ascii"),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": list(headers),
+        "client": client,
+        "server": ("127.0.0.1", 8000),
+    }
+
+
+async def call(
+    app,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    query_string: bytes = b"",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+    client: Tuple[str, int] = ("127.0.0.1", 50000),
+) -> Tuple[int, bytes]:
+    """
+    Drives a single request through an ASGI application in-process, without any transport in between.
+
+    Returns:
+        Tuple[int, bytes]: The response status and the concatenated response body.
+    """
+    headers = list(headers)
+    if body:
+        headers.append((b"content-length", str(len(body)).encode("ascii")))
+    scope = make_scope(method, path, query_string, headers, client)
+    sent = False
+    status = 0
+    chunks: List[bytes] = []
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def summarize(
+    name: str,
+    latencies: List[float],
+    elapsed: float,
+    statuses: Optional[Dict[int, int]] = None,
+) -> Dict[str, Any]:
+    """
+    Turns raw per-request latencies (seconds) into requests/sec and latency percentiles (milliseconds).
+    """
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "requests": len(ordered),
+        "rps": len(ordered) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "statuses": {str(code): count for code, count in sorted((statuses or {}).items())},
+    }
+
+
+async def run_load(
+    name: str,
+    send_request: Callable[[int], Awaitable[int]],
+    requests: int,
+    concurrency: int = 1,
+    warmup: int = 0,
+) -> Dict[str, Any]:
+    """
+    Calls `send_request(i)` `requests` times from `concurrency` concurrent tasks, where `i` numbers the request
+    (warm-up requests included, so factories can generate unique payloads), and summarizes the latencies and
+    response statuses.
+    """
+    counter = 0
+
+    def next_index() -> int:
+        nonlocal counter
+        counter += 1
+        return counter - 1
+
+    for _ in range(warmup):
+        await send_request(next_index())
+
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    per_task = max(1, requests // concurrency)
+
+    async def worker():
+        for _ in range(per_task):
+            started = time.perf_counter()
+            status = await send_request(next_index())
+            latencies.append(time.perf_counter() - started)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(name, latencies, time.perf_counter() - started, statuses)
+
+
+async def measure(
+    name: str,
+    app,
+    method: str,
+    path: str,
+    requests: int = 20000,
+    concurrency: int = 1,
+    expect_status: Optional[int] = 200,
+    warmup: int = 200,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Sends `requests` identical requests through `app` from `concurrency` concurrent tasks and summarizes them.
+    """
+
+    async def send_request(_: int) -> int:
+        status, _body = await call(app, method, path, **kwargs)
+        if expect_status is not None and status != expect_status:
+            raise RuntimeError(f"{method} {path} returned {status}, expected {expect_status}")
+        return status
+
+    return await run_load(name, send_request, requests, concurrency, warmup)
+
+
+def print_table(results: Iterable[Dict[str, Any]]) -> None:
+    print(f"{'benchmark':<44}{'rps':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for r in results:
+        print(
+            f"{r['name']:<44}{r['rps']:>12.0f}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}"
+        )
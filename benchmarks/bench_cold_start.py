@@ -0,0 +1,109 @@
+"""
+Measures cold start: the time from exec'ing a uvicorn process to its first successful GET /hello, and to the
+first successful GET /openapi.json (which needs every route loaded), with eager and lazy route loading.
+
+    python -m benchmarks.bench_cold_start --runs 5
+    python -m benchmarks.bench_cold_start --app benchmarks.fake_server:app
+
+The default app needs a reachable DATABASE_URL, since startup connects before serving when routes load eagerly.
+The fake app needs no database, but it imports prisma up-front and so understates what lazy loading saves.
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _status(port: int, path: str) -> Optional[int]:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request("GET", path)
+        return connection.getresponse().status
+    except OSError:
+        return None
+    finally:
+        connection.close()
+
+
+def cold_start(app: str, env: Dict[str, str], timeout: float) -> Dict[str, float]:
+    """
+    Starts one server process and polls it until both /hello and /openapi.json have answered 200.
+
+    Returns:
+        Dict[str, float]: Seconds from exec to the first 200 for each path.
+    """
+    port = _free_port()
+    pending = ["/hello", "/openapi.json"]
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            app,
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, **env},
+    )
+    try:
+        while pending and time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"{app} exited with status {server.returncode}")
+            path = pending[0]
+            if _status(port, path) == 200:
+                timings[path] = time.perf_counter() - started
+                pending.pop(0)
+            else:
+                time.sleep(0.002)
+        if pending:
+            raise RuntimeError(f"{app} did not answer {pending} within {timeout}s")
+        return timings
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--app", default="project.server:app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    variants = [
+        ("eager", {"LAZY_ROUTES": "false"}),
+        ("lazy + background warm-up", {"LAZY_ROUTES": "true", "LAZY_ROUTES_WARM_UP": "true"}),
+        ("lazy, load on first hit", {"LAZY_ROUTES": "true", "LAZY_ROUTES_WARM_UP": "false"}),
+    ]
+    print(f"{'variant':<32}{'first /hello ms':>18}{'first /openapi.json ms':>24}")
+    for name, env in variants:
+        runs: List[Dict[str, float]] = [
+            cold_start(args.app, env, args.timeout) for _ in range(args.runs)
+        ]
+        hello = statistics.median(run["/hello"] for run in runs) * 1000
+        openapi = statistics.median(run["/openapi.json"] for run in runs) * 1000
+        print(f"{name:<32}{hello:>18.0f}{openapi:>24.0f}")
+
+
+if __name__ == "__main__":
+    main()
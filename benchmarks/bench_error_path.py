@@ -0,0 +1,69 @@
+"""
+Measures throughput while the database is down, when every request fails and takes the shared error path:
+logging a full traceback for every failure vs. the sampled, rate-limited reporter in project/errors.py.
+Log records go to a temporary file, as they would to a log file or collector in production.
+
+    python -m benchmarks.bench_error_path --requests 5000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+
+import prisma.errors
+import project.errors
+import project.settings
+from benchmarks.asgi_driver import call, print_table, run_load
+from benchmarks.fake_server import app, client
+from benchmarks.suite import _request, _token
+
+
+async def main(requests: int, concurrency: int) -> None:
+    reporters = [
+        ("trace every error", project.errors.ErrorReporter(0, 0)),
+        (
+            "rate-limited traces",
+            project.errors.ErrorReporter(
+                project.settings.ERROR_TRACE_INTERVAL_SECONDS,
+                project.settings.ERROR_MAX_TRACES_PER_MINUTE,
+            ),
+        ),
+    ]
+    token = _token(1)
+    results = []
+    async with app.router.lifespan_context(app):
+        client.failure = prisma.errors.PrismaError("Can't reach database server at `db:5432`")
+        for name, reporter in reporters:
+            project.errors.reporter = reporter
+
+            async def send_request(i: int) -> int:
+                status, _ = await call(
+                    app, **_request("GET", "/api/user/profile", json_body={"token": token})
+                )
+                return status
+
+            results.append(
+                await run_load(
+                    f"{name} GET /api/user/profile", send_request, requests, concurrency, 50
+                )
+            )
+            results[-1]["reporter"] = reporter.stats()
+        client.failure = None
+    print_table(results)
+    for result in results:
+        print(f"{result['name']}: statuses {result['statuses']}, reporter {result['reporter']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    with tempfile.NamedTemporaryFile("w", suffix=".log") as log_file:
+        handler = logging.FileHandler(log_file.name)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+        )
+        logging.basicConfig(level=logging.INFO, handlers=[handler], force=True)
+        asyncio.run(main(args.requests, args.concurrency))
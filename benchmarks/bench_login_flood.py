@@ -0,0 +1,109 @@
+"""
+Measures GET /hello latency while POST /api/login is flooded with wrong passwords from many client addresses
+against a few accounts (credential stuffing), with and without the per-client token buckets in
+project/rate_limit.py. The targeted accounts get a production-cost bcrypt hash, so every admitted attempt costs
+what it would in production.
+
+    python -m benchmarks.bench_login_flood --requests 5000 --flood-concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+from typing import Dict
+
+# Import the app without the limiter so it can be wrapped explicitly for the limited variant.
+os.environ["AUTH_RATE_LIMIT_ENABLED"] = "false"
+
+import bcrypt  # noqa: E402
+import project.rate_limit  # noqa: E402
+import project.settings  # noqa: E402
+from benchmarks.asgi_driver import call, measure, print_table  # noqa: E402
+from benchmarks.fake_server import app, client  # noqa: E402
+from benchmarks.suite import _request  # noqa: E402
+
+TARGETED_USERS = 5
+
+CLIENT_ADDRESSES = 1000
+
+
+def limited(inner):
+    return project.rate_limit.AdmissionControlMiddleware(
+        inner,
+        paths=["/api/login", "/api/register"],
+        per_ip=project.rate_limit.TokenBucketLimiter(
+            project.settings.AUTH_RATE_LIMIT_IP_PER_MINUTE / 60,
+            project.settings.AUTH_RATE_LIMIT_IP_BURST,
+            project.settings.AUTH_RATE_LIMIT_MAX_KEYS,
+            project.settings.AUTH_RATE_LIMIT_SHARDS,
+        ),
+        per_username=project.rate_limit.TokenBucketLimiter(
+            project.settings.AUTH_RATE_LIMIT_USERNAME_PER_MINUTE / 60,
+            project.settings.AUTH_RATE_LIMIT_USERNAME_BURST,
+            project.settings.AUTH_RATE_LIMIT_MAX_KEYS,
+            project.settings.AUTH_RATE_LIMIT_SHARDS,
+        ),
+    )
+
+
+async def flood(target, concurrency: int, stop: asyncio.Event, statuses: Dict[int, int]) -> None:
+    counter = 0
+
+    async def attacker() -> None:
+        nonlocal counter
+        while not stop.is_set():
+            counter += 1
+            request = _request(
+                "POST",
+                "/api/login",
+                query={
+                    "username": f"user{counter % TARGETED_USERS + 1}@example.com",
+                    "password": "wrong-password",
+                },
+            )
+            address = counter % CLIENT_ADDRESSES
+            status, _ = await call(
+                target, **request, client=(f"10.0.{address // 256}.{address % 256}", 40000)
+            )
+            statuses[status] = statuses.get(status, 0) + 1
+            # Yield even when the response never suspended (a 429), as separate connections would.
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(attacker() for _ in range(concurrency)))
+
+
+async def main(requests: int, concurrency: int, flood_concurrency: int) -> None:
+    production_hash = bcrypt.hashpw(b"not-the-flood-password", bcrypt.gensalt(rounds=12)).decode("utf-8")
+    for user_id in range(1, TARGETED_USERS + 1):
+        row = client.tables["User"].rows[user_id]
+        client.tables["User"].update(row, {"password": production_hash})
+
+    results = []
+    flood_statuses = {}
+    async with app.router.lifespan_context(app):
+        results.append(await measure("GET /hello, idle", app, "GET", "/hello", requests, concurrency))
+        for name, target in (("no limiter", app), ("token buckets", limited(app))):
+            stop = asyncio.Event()
+            statuses: Dict[int, int] = {}
+            flooding = asyncio.create_task(flood(target, flood_concurrency, stop, statuses))
+            await asyncio.sleep(0.5)
+            results.append(
+                await measure(
+                    f"GET /hello, login flood ({name})", target, "GET", "/hello", requests, concurrency
+                )
+            )
+            stop.set()
+            await flooding
+            flood_statuses[name] = statuses
+    print_table(results)
+    for name, statuses in flood_statuses.items():
+        print(f"login flood ({name}): statuses {dict(sorted(statuses.items()))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--flood-concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.flood_concurrency))
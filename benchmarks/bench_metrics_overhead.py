@@ -0,0 +1,59 @@
+"""
+Measures the per-request cost of MetricsMiddleware on GET /hello, both through the FastAPI route and through
+the fast lane (where the middleware is the dominant remaining cost).
+
+    python -m benchmarks.bench_metrics_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+
+# Import the app bare so each variant can be wrapped explicitly.
+os.environ["HELLO_FAST_LANE"] = "false"
+os.environ["METRICS_ENABLED"] = "false"
+
+import project.fast_lane  # noqa: E402
+import project.getHelloWorld_service  # noqa: E402
+import project.metrics  # noqa: E402
+from benchmarks.asgi_driver import measure, print_table  # noqa: E402
+from project.server import app  # noqa: E402
+
+
+async def main(requests: int) -> None:
+    fast_app = project.fast_lane.FastLaneMiddleware(
+        app,
+        responses=project.fast_lane.constant_routes(
+            [
+                (
+                    "/hello",
+                    project.getHelloWorld_service.getHelloWorld(
+                        project.getHelloWorld_service.HelloWorldRequestModel()
+                    ),
+                )
+            ]
+        ),
+    )
+    route_kwargs = dict(body=b"{}", headers=[(b"content-type", b"application/json")])
+    variants = [
+        ("route", app, route_kwargs),
+        ("route + metrics", project.metrics.MetricsMiddleware(app), route_kwargs),
+        ("fast lane", fast_app, {}),
+        ("fast lane + metrics", project.metrics.MetricsMiddleware(fast_app), {}),
+    ]
+    results = []
+    for name, variant, kwargs in variants:
+        results.append(
+            await measure(f"{name} GET /hello", variant, "GET", "/hello", requests, 1, **kwargs)
+        )
+    print_table(results)
+    for base, instrumented in ((results[0], results[1]), (results[2], results[3])):
+        overhead_us = (instrumented["mean_ms"] - base["mean_ms"]) * 1000
+        print(f"{instrumented['name']}: +{overhead_us:.2f} us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
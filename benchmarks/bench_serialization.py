@@ -0,0 +1,93 @@
+"""
+Compares FastAPI's default response handling (revalidate against response_model, then jsonable_encoder)
+with TypedResponseRoute (project/fast_serialization.py) for each route that returns a typed service response,
+against the in-memory database.
+
+    python -m benchmarks.bench_serialization --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+
+# Build both variants explicitly from the plain routes.
+os.environ["FAST_SERIALIZATION"] = "false"
+os.environ["HELLO_FAST_LANE"] = "false"
+os.environ["METRICS_ENABLED"] = "false"
+
+import project.fast_serialization  # noqa: E402
+import project.routes  # noqa: E402
+from benchmarks.asgi_driver import call, print_table, run_load  # noqa: E402
+from benchmarks.fake_server import BENCH_DOCS, BENCH_USERS  # noqa: E402
+from benchmarks.suite import _request, scenarios  # noqa: E402
+from fastapi import APIRouter, FastAPI  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+
+ROUTES = [
+    "GET /api/docs?limit=50",
+    "GET /api/user/profile",
+    "GET /api/hello-world",
+    "POST /api/docs",
+    "PUT /api/docs/{docId}",
+    "POST /api/docs/bulk",
+]
+
+
+def build(route_class: type) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    for route in project.routes.router.routes:
+        router.add_api_route(
+            route.path,
+            route.endpoint,
+            response_model=route.response_model,
+            status_code=route.status_code,
+            methods=route.methods,
+            response_class=route.response_class,
+        )
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def main(requests: int, concurrency: int) -> None:
+    selected = [
+        scenario for scenario in scenarios(BENCH_USERS, BENCH_DOCS) if scenario[0] in ROUTES
+    ]
+    selected.insert(
+        1,
+        (
+            "GET /api/docs?limit=1000",
+            lambda i: _request("GET", "/api/docs", {"limit": 1000}, json_body={}),
+        ),
+    )
+    variants = [
+        ("fastapi", build(APIRoute)),
+        ("typed", build(project.fast_serialization.TypedResponseRoute)),
+    ]
+    results = []
+    await project.routes.startup()
+    try:
+        for name, factory in selected:
+            for variant, app in variants:
+
+                async def send_request(i: int, app=app, factory=factory) -> int:
+                    status, _ = await call(app, **factory(i))
+                    return status
+
+                results.append(
+                    await run_load(f"{variant:<8}{name}", send_request, requests, concurrency, 50)
+                )
+    finally:
+        await project.routes.shutdown()
+    print_table(results)
+    for plain, typed in zip(results[::2], results[1::2]):
+        print(f"{plain['name'][8:]:<36} {typed['rps'] / plain['rps'] - 1:+.0%} requests/sec")
+    print(f"typed responses: {project.fast_serialization.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,123 @@
+"""
+Measures throughput on one machine as project.launcher scales from one worker up. Load comes from several client
+processes over keep-alive connections, so the load generator is not the bottleneck on a single core.
+
+    python -m benchmarks.bench_workers --workers 1 2 4 --seconds 10
+    python -m benchmarks.bench_workers --path /hello --clients 4 --connections 32
+
+Leave cores for the clients: on a small machine, worker counts near the core count measure contention with the
+load generator rather than the launcher.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.asgi_driver import percentile
+from benchmarks.bench_cold_start import _free_port, _status
+
+
+def _client(port: int, path: str, connections: int, seconds: float) -> Tuple[int, List[float]]:
+    import httpx
+
+    async def run() -> Tuple[int, List[float]]:
+        latencies: List[float] = []
+        errors = 0
+        deadline = time.perf_counter() + seconds
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+        ) as client:
+
+            async def worker() -> None:
+                nonlocal errors
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    response = await client.get(path)
+                    if response.status_code == 200:
+                        latencies.append(time.perf_counter() - started)
+                    else:
+                        errors += 1
+
+            await asyncio.gather(*(worker() for _ in range(connections)))
+        return errors, latencies
+
+    return asyncio.run(run())
+
+
+def measure(workers: int, app: str, path: str, clients: int, connections: int, seconds: float) -> Dict:
+    port = _free_port()
+    launcher = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "project.launcher",
+            "--app",
+            app,
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ.copy(),
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while _status(port, "/health") != 200:
+            if launcher.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"launcher with {workers} workers did not become ready")
+            time.sleep(0.1)
+        with multiprocessing.Pool(clients) as pool:
+            started = time.perf_counter()
+            results = pool.starmap(
+                _client, [(port, path, connections, seconds)] * clients
+            )
+            elapsed = time.perf_counter() - started
+    finally:
+        launcher.send_signal(signal.SIGTERM)
+        launcher.wait(timeout=60)
+    latencies = sorted(latency for _, client_latencies in results for latency in client_latencies)
+    return {
+        "workers": workers,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "errors": sum(errors for errors, _ in results),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--app", default="benchmarks.fake_server:app")
+    parser.add_argument("--path", default="/api/hello-world")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=2, help="load-generating processes")
+    parser.add_argument("--connections", type=int, default=32, help="connections per client process")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    results = [
+        measure(workers, args.app, args.path, args.clients, args.connections, args.seconds)
+        for workers in args.workers
+    ]
+    print(f"{'workers':>8}{'rps':>12}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}{'scaling':>9}")
+    for result in results:
+        scaling = result["rps"] / results[0]["rps"] if results[0]["rps"] else 0.0
+        print(
+            f"{result['workers']:>8}{result['rps']:>12.0f}{result['p50_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['errors']:>8}{scaling:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Measures POST /api/questions and POST /api/docs throughput against the latency added by micro-batched writes,
+for several batch windows. The in-memory database charges a round trip per query and a commit flush per
+transaction (or per write outside one), one flush at a time as with a single WAL.
+
+    python -m benchmarks.bench_write_batching --windows 0 1 2 5 10 --concurrency 64
+    python -m benchmarks.bench_write_batching --csv batching.csv
+
+Window 0 means batching disabled. With --csv the rows are also written out for plotting throughput against
+p50 / p99 latency.
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+
+os.environ.setdefault("BENCH_DB_LATENCY_MS", "0.5")
+os.environ.setdefault("BENCH_DB_COMMIT_MS", "2")
+
+import project.write_batcher  # noqa: E402
+from benchmarks.asgi_driver import call, print_table, run_load  # noqa: E402
+from benchmarks.fake_server import app, client  # noqa: E402
+from benchmarks.suite import _request, _token  # noqa: E402
+
+
+def routes():
+    token = _token(1)
+    return [
+        (
+            "POST /api/questions",
+            lambda i: _request(
+                "POST",
+                "/api/questions",
+                json_body={"token": token, "title": f"Question {i}", "content": "How?"},
+            ),
+        ),
+        (
+            "POST /api/docs",
+            lambda i: _request(
+                "POST",
+                "/api/docs",
+                {"endpoint": f"/batched/{i}", "method": "GET", "description": "Benchmark entry."},
+                json_body={"request": {}, "response": {"ok": "bool"}},
+            ),
+        ),
+    ]
+
+
+async def main(windows, requests: int, concurrency: int, max_items: int, csv_path) -> None:
+    batcher = project.write_batcher.get_batcher()
+    results = []
+    offset = 0
+    async with app.router.lifespan_context(app):
+        for name, factory in routes():
+            for window_ms in windows:
+                batcher.enabled = window_ms > 0
+                batcher.window_seconds = window_ms / 1000
+                batcher.max_items = max_items
+                batches_before, items_before = batcher.batches, batcher.items
+                commits_before = client.commits
+
+                async def send_request(i: int, factory=factory, offset=offset) -> int:
+                    status, _ = await call(app, **factory(offset + i))
+                    return status
+
+                label = f"window {window_ms:g} ms" if window_ms > 0 else "no batching"
+                result = await run_load(f"{name} ({label})", send_request, requests, concurrency, 0)
+                offset += requests
+                batches = batcher.batches - batches_before
+                result.update(
+                    route=name,
+                    window_ms=window_ms,
+                    avg_batch=(batcher.items - items_before) / batches if batches else 1.0,
+                    commits=client.commits - commits_before,
+                )
+                results.append(result)
+    print_table(results)
+    for result in results:
+        print(
+            f"{result['name']}: {result['commits']} commits, average batch {result['avg_batch']:.1f}, "
+            f"statuses {result['statuses']}"
+        )
+    if csv_path:
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["route", "window_ms", "rps", "p50_ms", "p99_ms", "avg_batch", "commits"])
+            for r in results:
+                writer.writerow(
+                    [
+                        r["route"],
+                        r["window_ms"],
+                        f"{r['rps']:.1f}",
+                        f"{r['p50_ms']:.3f}",
+                        f"{r['p99_ms']:.3f}",
+                        f"{r['avg_batch']:.2f}",
+                        r["commits"],
+                    ]
+                )
+        print(f"wrote {csv_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 1, 2, 5, 10])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-items", type=int, default=64)
+    parser.add_argument("--csv", dest="csv_path")
+    args = parser.parse_args()
+    asyncio.run(main(args.windows, args.requests, args.concurrency, args.max_items, args.csv_path))
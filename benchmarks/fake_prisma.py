@@ -0,0 +1,463 @@
+"""
+An in-memory stand-in for the Prisma query engine, used to benchmark the service without Postgres.
+
+The generated model actions (`User.prisma().find_unique(...)` etc.) all funnel into `client._execute`, so
+this module swaps the registered client for `InMemoryPrisma`, which answers those calls from Python dicts.
+Everything above that seam (actions, model parsing, services, routes) is the real code. An optional
+per-call latency approximates a database round trip, and an optional commit latency the WAL flush every
+committed write waits for: paid by each write outside a transaction and once per transaction, one commit at a
+time.
+"""
+
+import asyncio
+import copy
+import functools
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import prisma
+import prisma.client
+import prisma.errors
+
+UNIQUE_KEYS: Dict[str, List[Tuple[str, ...]]] = {
+    "User": [("email",)],
+    "APIDocumentation": [("endpoint", "method")],
+}
+
+TIMESTAMPED = {"Question", "Answer"}
+
+WRITE_METHODS = {"create", "create_many", "update", "upsert", "delete", "delete_many", "update_many"}
+
+
+def _record_not_found(message: str) -> prisma.errors.RecordNotFoundError:
+    return prisma.errors.RecordNotFoundError({"user_facing_error": {"message": message}})
+
+
+def _unique_violation(model: str, fields: Tuple[str, ...]) -> prisma.errors.UniqueViolationError:
+    return prisma.errors.UniqueViolationError(
+        {
+            "user_facing_error": {
+                "message": f"Unique constraint failed on the fields: {fields}",
+                "meta": {"target": list(fields), "model": model},
+            }
+        }
+    )
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, prisma.Json):
+        return copy.deepcopy(value.data)
+    return value
+
+
+def _compare(value: Any, operator: str, operand: Any) -> bool:
+    if operator == "equals":
+        return value == _plain(operand)
+    if operator == "not":
+        if isinstance(operand, dict):
+            return not _match_field(value, operand)
+        return value != operand
+    if operator == "in":
+        return value in operand
+    if operator == "not_in":
+        return value not in operand
+    if value is None:
+        return False
+    if operator == "lt":
+        return value < operand
+    if operator == "lte":
+        return value <= operand
+    if operator == "gt":
+        return value > operand
+    if operator == "gte":
+        return value >= operand
+    if operator == "contains":
+        return operand in value
+    if operator == "startswith":
+        return value.startswith(operand)
+    if operator == "endswith":
+        return value.endswith(operand)
+    if operator == "mode":
+        return True
+    raise NotImplementedError(f"Unsupported filter operator: {operator}")
+
+
+def _match_field(value: Any, condition: Dict[str, Any]) -> bool:
+    return all(_compare(value, op, operand) for op, operand in condition.items())
+
+
+def matches(row: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "AND":
+            conditions = condition if isinstance(condition, list) else [condition]
+            if not all(matches(row, c) for c in conditions):
+                return False
+        elif key == "OR":
+            if not any(matches(row, c) for c in condition):
+                return False
+        elif key == "NOT":
+            conditions = condition if isinstance(condition, list) else [condition]
+            if any(matches(row, c) for c in conditions):
+                return False
+        elif key not in row and isinstance(condition, dict):
+            # Compound unique input, e.g. {"endpoint_method": {"endpoint": ..., "method": ...}}.
+            if not all(row.get(field) == value for field, value in condition.items()):
+                return False
+        elif isinstance(condition, dict):
+            if not _match_field(row.get(key), condition):
+                return False
+        elif row.get(key) != condition:
+            return False
+    return True
+
+
+def _order(rows: List[Dict[str, Any]], order_by: Any) -> List[Dict[str, Any]]:
+    if not order_by:
+        return sorted(rows, key=lambda row: row["id"])
+    keys: List[Tuple[str, str]] = []
+    for part in order_by if isinstance(order_by, list) else [order_by]:
+        keys.extend(part.items())
+    for field, direction in reversed(keys):
+        rows = sorted(rows, key=lambda row: row[field], reverse=direction == "desc")
+    return rows
+
+
+class Table:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.next_id = 1
+
+    def _check_unique(self, candidate: Dict[str, Any], ignore_id: Optional[int] = None) -> None:
+        for fields in UNIQUE_KEYS.get(self.name, []):
+            key = tuple(candidate.get(field) for field in fields)
+            for row in self.rows.values():
+                if row["id"] != ignore_id and tuple(row.get(f) for f in fields) == key:
+                    raise _unique_violation(self.name, fields)
+
+    def _normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for field, value in data.items():
+            if isinstance(value, dict) and "connect" in value:
+                values[f"{field}Id"] = value["connect"]["id"]
+            else:
+                values[field] = _plain(value)
+        return values
+
+    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        row = self._normalize(data)
+        row.setdefault("id", self.next_id)
+        self.next_id = max(self.next_id, row["id"]) + 1
+        if self.name in TIMESTAMPED:
+            now = datetime.now(timezone.utc)
+            row.setdefault("createdAt", now)
+            row.setdefault("updatedAt", now)
+        self._check_unique(row)
+        self.rows[row["id"]] = row
+        return row
+
+    def find(self, where: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [row for row in self.rows.values() if matches(row, where)]
+
+    def update(self, row: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        updated = {**row, **self._normalize(data)}
+        if self.name in TIMESTAMPED:
+            updated["updatedAt"] = datetime.now(timezone.utc)
+        self._check_unique(updated, ignore_id=row["id"])
+        self.rows[row["id"]] = updated
+        return updated
+
+
+class InMemoryBatch:
+    """
+    Mirrors Prisma's `batch_()`: queued writes are applied together when the context exits.
+    """
+
+    def __init__(self, client: "InMemoryPrisma") -> None:
+        self._client = client
+        self._queued: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def __getattr__(self, instance_name: str) -> Any:
+        model = self._client.models_by_instance.get(instance_name)
+        if model is None:
+            raise AttributeError(instance_name)
+        batch = self
+
+        def queue(method: str):
+            def add(**arguments: Any) -> None:
+                if method == "upsert":
+                    data = arguments.pop("data")
+                    arguments["create"] = data.get("create")
+                    arguments["update"] = data.get("update")
+                batch._queued.append((model, method, arguments))
+
+            return add
+
+        return SimpleNamespace(
+            **{
+                name: queue(name)
+                for name in ("create", "update", "upsert", "delete", "delete_many", "update_many")
+            }
+        )
+
+    async def commit(self) -> None:
+        queued, self._queued = self._queued, []
+        await self._client._sleep()
+        for model, method, arguments in queued:
+            self._client._apply(model, method, arguments)
+        await self._client._commit()
+
+    async def __aenter__(self) -> "InMemoryBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc is None:
+            await self.commit()
+
+
+class InMemoryTransactionClient:
+    """
+    The client handed out inside a transaction: writes skip the per-write commit, which the transaction pays
+    once when it exits.
+    """
+
+    def __init__(self, client: "InMemoryPrisma") -> None:
+        self._client = client
+
+    def is_transaction(self) -> bool:
+        return True
+
+    async def _execute(self, **kwargs: Any) -> Any:
+        return await self._client._execute(in_transaction=True, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+class InMemoryTransaction:
+    def __init__(self, client: "InMemoryPrisma") -> None:
+        self._client = client
+
+    async def __aenter__(self) -> InMemoryTransactionClient:
+        await self._client._sleep()
+        return InMemoryTransactionClient(self._client)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._client._sleep()
+        if exc is None:
+            await self._client._commit()
+
+
+class InMemoryPrisma:
+    """
+    A drop-in for the generated `Prisma` client backed by dicts. It implements `_execute` (the seam every
+    generated model action goes through) plus the client methods the service calls directly.
+    """
+
+    def __init__(self, latency: float = 0.0, commit_latency: float = 0.0) -> None:
+        self.latency = latency
+        self.commit_latency = commit_latency
+        self.commits = 0
+        self._commit_lock = asyncio.Lock()
+        self.tables: Dict[str, Table] = {}
+        self.models_by_instance: Dict[str, str] = {}
+        self.queries = 0
+        # When set, every query raises this exception instead, simulating a database outage.
+        self.failure: Optional[BaseException] = None
+        self._connected = False
+        for model in ("User", "Question", "Answer", "APIDocumentation"):
+            self.tables[model] = Table(model)
+            self.models_by_instance[model.lower()] = model
+
+    async def _sleep(self) -> None:
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure is not None:
+            raise copy.copy(self.failure)
+
+    async def _commit(self) -> None:
+        self.commits += 1
+        if self.commit_latency:
+            async with self._commit_lock:
+                await asyncio.sleep(self.commit_latency)
+
+    async def connect(self, timeout: Any = None) -> None:
+        self._connected = True
+
+    async def disconnect(self, timeout: Any = None) -> None:
+        self._connected = False
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def is_transaction(self) -> bool:
+        return False
+
+    async def query_raw(self, query: str, *args: Any, model: Any = None) -> List[Dict[str, Any]]:
+        await self._sleep()
+        return [{"ok": 1}]
+
+    async def execute_raw(self, query: str, *args: Any) -> int:
+        await self._sleep()
+        return 0
+
+    async def get_metrics(self, format: str = "json", *, global_labels: Any = None) -> Any:
+        if format == "prometheus":
+            return ""
+        return SimpleNamespace(counters=[], gauges=[], histograms=[])
+
+    def batch_(self) -> InMemoryBatch:
+        return InMemoryBatch(self)
+
+    def tx(self, **kwargs: Any) -> InMemoryTransaction:
+        return InMemoryTransaction(self)
+
+    async def _execute(
+        self,
+        *,
+        method: str,
+        arguments: Dict[str, Any],
+        model: Any = None,
+        root_selection: Optional[List[str]] = None,
+        in_transaction: bool = False,
+    ) -> Any:
+        await self._sleep()
+        result = self._apply(model.__name__, method, arguments)
+        if method in WRITE_METHODS and not in_transaction:
+            await self._commit()
+        return {"data": {"result": result}}
+
+    def _apply(self, model: str, method: str, arguments: Dict[str, Any]) -> Any:
+        table = self.tables[model]
+        where = arguments.get("where")
+        if method == "create":
+            return dict(table.create(arguments["data"]))
+        if method == "create_many":
+            count = 0
+            for data in arguments["data"]:
+                try:
+                    table.create(data)
+                    count += 1
+                except prisma.errors.UniqueViolationError:
+                    if not arguments.get("skipDuplicates"):
+                        raise
+            return {"count": count}
+        if method == "find_unique":
+            rows = table.find(where)
+            return dict(rows[0]) if rows else None
+        if method in ("find_many", "find_first"):
+            rows = _order(table.find(where), arguments.get("order_by"))
+            rows = rows[arguments.get("skip") or 0 :]
+            if arguments.get("take") is not None:
+                rows = rows[: arguments["take"]]
+            if method == "find_first":
+                return dict(rows[0]) if rows else None
+            return [dict(row) for row in rows]
+        if method == "update":
+            rows = table.find(where)
+            if not rows:
+                raise _record_not_found("Record to update not found.")
+            return dict(table.update(rows[0], arguments["data"]))
+        if method == "upsert":
+            rows = table.find(where)
+            if rows:
+                return dict(table.update(rows[0], arguments["update"]))
+            return dict(table.create(arguments["create"]))
+        if method == "delete":
+            rows = table.find(where)
+            if not rows:
+                raise _record_not_found("Record to delete does not exist.")
+            return dict(table.rows.pop(rows[0]["id"]))
+        if method == "delete_many":
+            rows = table.find(where)
+            for row in rows:
+                del table.rows[row["id"]]
+            return {"count": len(rows)}
+        if method == "update_many":
+            rows = table.find(where)
+            for row in rows:
+                table.update(row, arguments["data"])
+            return {"count": len(rows)}
+        if method == "count":
+            return {"_count": {"_all": len(table.find(where))}}
+        if method == "group_by":
+            groups: Dict[Tuple[Any, ...], int] = {}
+            for row in table.find(where):
+                key = tuple(row.get(field) for field in arguments["by"])
+                groups[key] = groups.get(key, 0) + 1
+            return [
+                {**dict(zip(arguments["by"], key)), "_count": {"_all": count}}
+                for key, count in groups.items()
+            ]
+        raise NotImplementedError(f"{model}.{method} is not supported by the in-memory stand-in")
+
+
+def install(latency: float = 0.0, commit_latency: float = 0.0) -> InMemoryPrisma:
+    """
+    Routes every model action and the server's shared client to a fresh in-memory database. Must run before
+    `project.server` is imported. The stand-in is instrumented like the real client unless
+    QUERY_INSTRUMENTATION_ENABLED is off.
+    """
+    import project.database
+    import project.query_instrumentation
+    import project.settings
+
+    client = InMemoryPrisma(latency=latency, commit_latency=commit_latency)
+    if project.settings.QUERY_INSTRUMENTATION_ENABLED:
+        client._execute = functools.partial(  # type: ignore[method-assign]
+            project.query_instrumentation.execute, client._execute
+        )
+    prisma.client.get_client = lambda: client
+    prisma.get_client = lambda: client
+    project.database.create_client = lambda: client
+    return client
+
+
+def seed(
+    client: InMemoryPrisma,
+    users: int = 100,
+    docs: int = 500,
+    questions: int = 200,
+    answers_per_question: int = 5,
+    password_hash: str = "",
+) -> None:
+    """
+    Fills the in-memory database deterministically, so ids are predictable for the benchmark scenarios.
+    """
+    for i in range(1, users + 1):
+        client.tables["User"].create(
+            {"email": f"user{i}@example.com", "password": password_hash, "role": "User"}
+        )
+    for i in range(1, docs + 1):
+        client.tables["APIDocumentation"].create(
+            {
+                "endpoint": f"/api/resource{i}",
+                "method": "GET",
+                "description": f"Fetches resource number {i} and its related metadata.",
+                "request": {},
+                "response": {"id": "int", "name": "str"},
+            }
+        )
+    answer_id = 1
+    for i in range(1, questions + 1):
+        client.tables["Question"].create(
+            {
+                "title": f"Question {i}",
+                "content": "How do I call the hello endpoint?",
+                "authorId": (i % users) + 1,
+            }
+        )
+        for _ in range(answers_per_question):
+            client.tables["Answer"].create(
+                {
+                    "content": "Send a GET request to /hello.",
+                    "questionId": i,
+                    "authorId": (answer_id % users) + 1,
+                }
+            )
+            answer_id += 1
+
@@ -0,0 +1,44 @@
+"""
+`project.server:app` wired to the in-memory database stand-in and seeded with benchmark data.
+
+    uvicorn benchmarks.fake_server:app
+
+Configured through BENCH_DB_LATENCY_MS (simulated per-query latency), BENCH_DB_COMMIT_MS (simulated commit
+flush), BENCH_USERS and BENCH_DOCS.
+"""
+
+import os
+
+import bcrypt
+from benchmarks import fake_prisma
+
+# Every benchmark request comes from one client, which the login token buckets would turn into 429s; the suite
+# measures the routes themselves (benchmarks/bench_login_flood.py covers the limiter).
+os.environ.setdefault("AUTH_RATE_LIMIT_ENABLED", "false")
+# Match the seeded hashes' cost, so startup skips calibration and logins do not rehash.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# A route that starts issuing more queries than its declared budget (an N+1) fails its benchmark with 500s.
+os.environ.setdefault("QUERY_BUDGET_ENFORCE", "true")
+
+BENCH_PASSWORD = "benchmark-password"
+
+BENCH_USERS = int(os.getenv("BENCH_USERS", "100"))
+
+BENCH_DOCS = int(os.getenv("BENCH_DOCS", "500"))
+
+client = fake_prisma.install(
+    latency=float(os.getenv("BENCH_DB_LATENCY_MS", "0")) / 1000,
+    commit_latency=float(os.getenv("BENCH_DB_COMMIT_MS", "0")) / 1000,
+)
+
+# A low cost factor keeps the seeding fast; login benchmarks measure the request path, not bcrypt tuning.
+fake_prisma.seed(
+    client,
+    users=BENCH_USERS,
+    docs=BENCH_DOCS,
+    password_hash=bcrypt.hashpw(
+        BENCH_PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)
+    ).decode("utf-8"),
+)
+
+from project.server import app  # noqa: E402,F401
@@ -0,0 +1,361 @@
+"""
+Load-test and benchmark suite covering every route in project/server.py.
+
+Runs against the in-memory database stand-in (benchmarks/fake_prisma.py), so no external services are needed.
+By default requests are driven straight through the ASGI app in-process; --socket starts a real uvicorn server
+and drives it over HTTP instead.
+
+    python -m benchmarks.suite --requests 2000 --concurrency 16 --save benchmarks/baselines/local.json
+    python -m benchmarks.suite --compare benchmarks/baselines/local.json --max-regression 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import jwt
+import project.auth
+from benchmarks.asgi_driver import call, print_table, run_load
+
+Request = Dict[str, Any]
+Scenario = Tuple[str, Callable[[int], Request]]
+
+BENCH_PASSWORD = "benchmark-password"
+
+
+def _token(user_id: int) -> str:
+    return jwt.encode(
+        {"user_id": user_id, "exp": datetime.now(timezone.utc) + timedelta(hours=1)},
+        project.auth.SECRET_KEY,
+        algorithm=project.auth.ALGORITHM,
+    )
+
+
+def _request(
+    method: str,
+    path: str,
+    query: Optional[Dict[str, Any]] = None,
+    json_body: Any = None,
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> Request:
+    request: Request = {
+        "method": method,
+        "path": path,
+        "query_string": urlencode(query or {}).encode("ascii"),
+        "headers": list(headers or []),
+        "body": b"",
+    }
+    if json_body is not None:
+        request["body"] = json.dumps(json_body).encode("utf-8")
+        request["headers"].append((b"content-type", b"application/json"))
+    return request
+
+
+def scenarios(users: int, docs: int) -> List[Scenario]:
+    """
+    One scenario per route. Factories receive the request number so writes can use unique keys; destructive
+    scenarios come last so they don't skew the reads.
+    """
+    tokens = {user_id: _token(user_id) for user_id in range(1, users + 1)}
+
+    def user(i: int) -> int:
+        return i % users + 1
+
+    def doc(i: int) -> int:
+        return i % docs + 1
+
+    return [
+        ("GET /hello", lambda i: _request("GET", "/hello")),
+        ("GET /health", lambda i: _request("GET", "/health")),
+        ("GET /health/deep", lambda i: _request("GET", "/health/deep")),
+        ("GET /metrics", lambda i: _request("GET", "/metrics")),
+        ("GET /api/hello-world", lambda i: _request("GET", "/api/hello-world", json_body={})),
+        ("GET /api/docs", lambda i: _request("GET", "/api/docs", json_body={})),
+        (
+            "GET /api/docs?limit=50",
+            lambda i: _request(
+                "GET", "/api/docs", {"limit": 50, "after": (i * 50) % docs}, json_body={}
+            ),
+        ),
+        ("GET /api/docs/stream", lambda i: _request("GET", "/api/docs/stream")),
+        (
+            "GET /api/docs/search",
+            lambda i: _request("GET", "/api/docs/search", {"q": f"resource{i % docs + 1} meta"}),
+        ),
+        ("GET /api/questions", lambda i: _request("GET", "/api/questions", {"limit": 20})),
+        (
+            "GET /api/questions/{questionId}/answers",
+            lambda i: _request("GET", f"/api/questions/{i % 200 + 1}/answers", {"limit": 20}),
+        ),
+        ("GET /api/stats", lambda i: _request("GET", "/api/stats")),
+        (
+            "GET /api/stats/questions/{questionId}",
+            lambda i: _request("GET", f"/api/stats/questions/{i % 200 + 1}"),
+        ),
+        ("GET /api/stats/users/{userId}", lambda i: _request("GET", f"/api/stats/users/{user(i)}")),
+        (
+            "GET /api/user/profile",
+            lambda i: _request("GET", "/api/user/profile", json_body={"token": tokens[user(i)]}),
+        ),
+        (
+            "POST /api/login",
+            lambda i: _request(
+                "POST",
+                "/api/login",
+                {"username": f"user{user(i)}@example.com", "password": BENCH_PASSWORD},
+            ),
+        ),
+        (
+            "POST /api/register",
+            lambda i: _request(
+                "POST",
+                "/api/register",
+                {"username": f"bench{i}-{time.monotonic_ns()}@example.com", "password": "pw"},
+            ),
+        ),
+        (
+            "POST /api/docs",
+            lambda i: _request(
+                "POST",
+                "/api/docs",
+                {"endpoint": f"/bench/{i}", "method": "GET", "description": "Benchmark entry."},
+                json_body={"request": {}, "response": {"ok": "bool"}},
+            ),
+        ),
+        (
+            "POST /api/docs/bulk",
+            lambda i: _request(
+                "POST",
+                "/api/docs/bulk",
+                json_body=[
+                    {"endpoint": f"/bulk/{i}/{j}", "method": "GET", "description": "Bulk entry."}
+                    for j in range(50)
+                ],
+            ),
+        ),
+        (
+            "POST /api/questions",
+            lambda i: _request(
+                "POST",
+                "/api/questions",
+                json_body={"token": tokens[user(i)], "title": f"Question {i}", "content": "How?"},
+            ),
+        ),
+        (
+            "POST /api/questions/{questionId}/answers",
+            lambda i: _request(
+                "POST",
+                f"/api/questions/{i % 200 + 1}/answers",
+                json_body={"token": tokens[user(i)], "content": "Like this."},
+            ),
+        ),
+        (
+            "PUT /api/docs/{docId}",
+            lambda i: _request(
+                "PUT",
+                f"/api/docs/{doc(i)}",
+                {
+                    "endpoint": f"/api/resource{doc(i)}",
+                    "method": "GET",
+                    "description": f"Updated description {i}.",
+                },
+                json_body={"request": {}, "response": {"id": "int"}},
+            ),
+        ),
+        (
+            "PUT /api/user/profile",
+            lambda i: _request(
+                "PUT",
+                "/api/user/profile",
+                {
+                    "token": tokens[user(i)],
+                    "email": f"user{user(i)}@example.com",
+                    "password": BENCH_PASSWORD,
+                    "role": "User",
+                },
+            ),
+        ),
+        (
+            # Seeded answer n is written by user n % users + 1.
+            "DELETE /api/answers/{answerId}",
+            lambda i: _request(
+                "DELETE",
+                f"/api/answers/{i % 1000 + 1}",
+                json_body={"token": tokens[(i % 1000 + 1) % users + 1]},
+            ),
+        ),
+        ("DELETE /api/docs/{docId}", lambda i: _request("DELETE", f"/api/docs/{doc(i)}")),
+        (
+            "DELETE /api/user/account",
+            lambda i: _request("DELETE", "/api/user/account", json_body={"token": tokens[user(i)]}),
+        ),
+    ]
+
+
+async def run_in_process(
+    selected: List[Scenario], requests: int, concurrency: int, warmup: int
+) -> List[Dict[str, Any]]:
+    from benchmarks.fake_server import app
+
+    results = []
+    async with app.router.lifespan_context(app):
+        for name, factory in selected:
+
+            async def send_request(i: int, factory=factory) -> int:
+                status, _ = await call(app, **factory(i))
+                return status
+
+            results.append(await run_load(name, send_request, requests, concurrency, warmup))
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_over_socket(
+    selected: List[Scenario], requests: int, concurrency: int, warmup: int
+) -> List[Dict[str, Any]]:
+    import httpx
+
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.fake_server:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ.copy(),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            for _ in range(200):
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.05)
+            else:
+                raise RuntimeError("uvicorn did not become ready")
+
+            results = []
+            for name, factory in selected:
+
+                async def send_request(i: int, factory=factory) -> int:
+                    request = factory(i)
+                    url = request["path"]
+                    if request["query_string"]:
+                        url += "?" + request["query_string"].decode("ascii")
+                    response = await client.request(
+                        request["method"],
+                        url,
+                        content=request["body"] or None,
+                        headers=[(k.decode(), v.decode()) for k, v in request["headers"]],
+                    )
+                    return response.status_code
+
+                results.append(await run_load(name, send_request, requests, concurrency, warmup))
+            return results
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> bool:
+    """
+    Prints throughput and p99 changes against a saved baseline; returns False if any scenario's requests/sec
+    dropped by more than `max_regression` (a fraction).
+    """
+    with open(baseline_path) as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    ok = True
+    print(f"\n{'vs ' + baseline_path:<44}{'rps':>12}{'p99':>10}")
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None or not previous["rps"]:
+            continue
+        rps_change = result["rps"] / previous["rps"] - 1
+        p99_change = result["p99_ms"] / previous["p99_ms"] - 1 if previous["p99_ms"] else 0.0
+        flag = ""
+        if rps_change < -max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{result['name']:<44}{rps_change:>+12.1%}{p99_change:>+10.1%}{flag}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--socket", action="store_true", help="drive a real uvicorn server over HTTP")
+    parser.add_argument("--only", action="append", default=[], help="substring filter on scenario names")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="simulated latency per query")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--save", help="write the results to this baseline JSON file")
+    parser.add_argument("--compare", help="compare the results against this baseline JSON file")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    args = parser.parse_args()
+
+    os.environ["BENCH_DB_LATENCY_MS"] = str(args.db_latency_ms)
+    os.environ["BENCH_USERS"] = str(args.users)
+    os.environ["BENCH_DOCS"] = str(args.docs)
+
+    selected = [
+        scenario
+        for scenario in scenarios(args.users, args.docs)
+        if not args.only or any(part in scenario[0] for part in args.only)
+    ]
+    runner = run_over_socket if args.socket else run_in_process
+    results = asyncio.run(runner(selected, args.requests, args.concurrency, args.warmup))
+    print_table(results)
+    for result in results:
+        unexpected = {code: n for code, n in result["statuses"].items() if not code.startswith("2")}
+        if unexpected:
+            print(f"  {result['name']}: non-2xx responses {unexpected}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(
+                {
+                    "created": datetime.now(timezone.utc).isoformat(),
+                    "mode": "socket" if args.socket else "in-process",
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "db_latency_ms": args.db_latency_ms,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nSaved baseline to {args.save}")
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
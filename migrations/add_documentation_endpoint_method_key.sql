@@ -0,0 +1,26 @@
+-- The unique key on APIDocumentation (endpoint, method) that create_documentation upserts on. New databases get
+-- it from `prisma db push`; on an existing database, run this before deploying the upsert:
+--
+--     psql "$DATABASE_URL" -f migrations/add_documentation_endpoint_method_key.sql
+--
+-- Publishing used to look the entry up and then create it, so concurrent publishes could store the same
+-- (endpoint, method) twice, and the index cannot be built until those duplicates are gone. Of each group the
+-- oldest row (lowest id) is kept: it is the one the old lookup found and kept updating. The table is locked
+-- against writes while the duplicates are removed and the index is built, so none can slip in between; the
+-- catalogue is small, so the lock is brief. The index name is Prisma's default, so a later `prisma db push`
+-- sees no drift.
+
+BEGIN;
+
+LOCK TABLE "APIDocumentation" IN SHARE ROW EXCLUSIVE MODE;
+
+DELETE FROM "APIDocumentation" AS duplicate
+USING "APIDocumentation" AS kept
+WHERE duplicate."endpoint" = kept."endpoint"
+  AND duplicate."method" = kept."method"
+  AND duplicate."id" > kept."id";
+
+CREATE UNIQUE INDEX IF NOT EXISTS "APIDocumentation_endpoint_method_key"
+    ON "APIDocumentation" ("endpoint", "method");
+
+COMMIT;
@@ -0,0 +1,29 @@
+-- Indexes for the query shapes the services issue, as declared in schema.prisma. New databases get them from
+-- `prisma db push`; this script adds them to an existing database without blocking writes:
+--
+--     psql "$DATABASE_URL" -f migrations/add_query_indexes.sql
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction, so run the file with psql (one statement at a
+-- time), not through a tool that wraps it in one. The names are Prisma's defaults, so a later `prisma db push`
+-- sees no drift. `python -m project.query_plans` and tests/test_query_plans.py check that the planner uses
+-- them.
+
+-- Keyset pagination of the question feed (GET /api/questions).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Question_createdAt_id_idx" ON "Question" ("createdAt", "id");
+
+-- A user's questions, and the foreign key check when a user is deleted.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Question_authorId_idx" ON "Question" ("authorId");
+
+-- Keyset pagination of a question's answers (GET /api/questions/{questionId}/answers), deleting a question's
+-- answers, and the questionId foreign key check when a question is deleted.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Answer_questionId_createdAt_id_idx" ON "Answer" ("questionId", "createdAt", "id");
+
+-- A user's answers, and the foreign key check when a user is deleted.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "Answer_authorId_idx" ON "Answer" ("authorId");
+
+-- User (email) lookups use the index of its unique constraint. The APIDocumentation (endpoint, method) unique
+-- index is not created here: existing databases may hold duplicate pairs, so
+-- migrations/add_documentation_endpoint_method_key.sql removes them and adds it. Run that one first.
+
+ANALYZE "Question";
+ANALYZE "Answer";
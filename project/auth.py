@@ -0,0 +1,32 @@
+import jwt
+
+# The key the services verify user tokens with.
+SECRET_KEY = "your-secret-key"
+ALGORITHM = "HS256"
+
+
+def user_id_from_token(token: str) -> int:
+    """
+    Verifies a user's JWT and returns the id of the user it was issued to.
+
+    Args:
+        token (str): The JWT carrying a `user_id` claim.
+
+    Returns:
+        int: The user id.
+
+    Raises:
+        ValueError: If the token is invalid, expired or has no `user_id`.
+
+    Example:
+        user_id_from_token("some.jwt.token")
+        > 1
+    """
+    try:
+        decoded_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.InvalidTokenError:
+        raise ValueError("Invalid or expired token")
+    user_id = decoded_token.get("user_id")
+    if not user_id:
+        raise ValueError("Invalid or expired token")
+    return int(user_id)
@@ -0,0 +1,242 @@
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+
+import prisma
+import prisma.models
+import project.docs_catalogue_cache
+import project.docs_search_index
+import project.query_instrumentation
+import project.single_flight
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidBulkBodyError(ValueError):
+    """
+    Raised when a bulk import body is not a JSON array.
+    """
+
+
+class DocumentationEntry(BaseModel):
+    """
+    A single API documentation entry in a bulk import.
+    """
+
+    endpoint: str
+    method: str
+    description: str
+    request: Dict = {}
+    response: Dict = {}
+
+
+class BulkImportItemResult(BaseModel):
+    """
+    The outcome of importing one entry, identified by its position in the submitted array or stream.
+    """
+
+    index: int
+    success: bool
+    api_doc_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkImportResponse(BaseModel):
+    """
+    The response model for a bulk documentation import, with one result per submitted entry.
+    """
+
+    imported: int
+    failed: int
+    results: List[BulkImportItemResult]
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Splits a streamed NDJSON body into lines without buffering the whole body; blank lines are skipped.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw request body chunks.
+
+    Returns:
+        AsyncIterator[bytes]: One JSON document per line.
+
+    Example:
+        async for line in iter_ndjson(request.stream()):
+            ...
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
+
+
+# Only the array itself is validated up front; each entry is validated on its own, so one malformed entry
+# fails just that entry.
+_ENTRY_ARRAY = TypeAdapter(List[Any])
+
+
+def parse_entry_array(body: bytes) -> List[Any]:
+    """
+    Parses a JSON array body into its raw entries.
+
+    Raises:
+        InvalidBulkBodyError: If the body is not valid JSON or not an array.
+
+    Example:
+        parse_entry_array(b'[{"endpoint": "/hello", "method": "GET", "description": "Says hello."}]')
+        > [{'endpoint': '/hello', 'method': 'GET', 'description': 'Says hello.'}]
+    """
+    try:
+        return _ENTRY_ARRAY.validate_json(body)
+    except ValidationError as e:
+        raise InvalidBulkBodyError(
+            "Expected a JSON array of documentation entries"
+        ) from e
+
+
+async def iter_items(items: List[Any]) -> AsyncIterator[Any]:
+    """
+    Adapts an already parsed JSON array to the async iterable bulk_import_documentation consumes.
+    """
+    for item in items:
+        yield item
+
+
+def _validate(raw: Any) -> DocumentationEntry:
+    if isinstance(raw, (bytes, str)):
+        return DocumentationEntry.model_validate_json(raw)
+    return DocumentationEntry.model_validate(raw)
+
+
+async def _import_chunk(
+    chunk: List[Tuple[int, Any]], results: List[BulkImportItemResult]
+) -> None:
+    entries: Dict[Tuple[str, str], DocumentationEntry] = {}
+    positions: List[Tuple[int, Tuple[str, str]]] = []
+    for index, raw in chunk:
+        try:
+            entry = _validate(raw)
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'entry'}: {err['msg']}"
+                for err in e.errors()
+            )
+            results.append(BulkImportItemResult(index=index, success=False, error=error))
+            continue
+        key = (entry.endpoint, entry.method)
+        # The last entry for an (endpoint, method) pair within a chunk wins, as it would with sequential publishes.
+        entries[key] = entry
+        positions.append((index, key))
+    if not entries:
+        return
+
+    try:
+        # One transaction and one round trip for the whole chunk, then one query to read back the ids.
+        batcher = prisma.get_client().batch_()
+        for entry in entries.values():
+            batcher.apidocumentation.upsert(
+                where={
+                    "endpoint_method": {
+                        "endpoint": entry.endpoint,
+                        "method": entry.method,
+                    }
+                },
+                data={
+                    "create": {
+                        "endpoint": entry.endpoint,
+                        "method": entry.method,
+                        "description": entry.description,
+                        "request": prisma.Json(entry.request),
+                        "response": prisma.Json(entry.response),
+                    },
+                    "update": {
+                        "description": entry.description,
+                        "request": prisma.Json(entry.request),
+                        "response": prisma.Json(entry.response),
+                    },
+                },
+            )
+        await project.query_instrumentation.execute_batch(batcher, "APIDocumentation")
+    except Exception as e:
+        for index, _ in positions:
+            results.append(
+                BulkImportItemResult(index=index, success=False, error=str(e))
+            )
+        return
+    finally:
+        project.docs_catalogue_cache.get_cache().bump()
+        project.single_flight.get_group().forget("APIDocumentation")
+
+    try:
+        stored = await prisma.models.APIDocumentation.prisma().find_many(
+            where={
+                "OR": [
+                    {"endpoint": endpoint, "method": method}
+                    for endpoint, method in entries
+                ]
+            }
+        )
+    except Exception as e:
+        # The chunk is committed: its entries are reported imported, only without their ids, and reach the
+        # search index with its next rebuild.
+        logger.warning(
+            "Reading back %d imported documentation entries failed: %s", len(entries), e
+        )
+        stored = []
+
+    search_index = project.docs_search_index.get_index()
+    for doc in stored:
+        search_index.add(doc)
+    ids = {(doc.endpoint, doc.method): doc.id for doc in stored}
+    for index, key in positions:
+        results.append(
+            BulkImportItemResult(index=index, success=True, api_doc_id=ids.get(key))
+        )
+
+
+async def bulk_import_documentation(
+    entries: AsyncIterable[Any], chunk_size: int = 200
+) -> BulkImportResponse:
+    """
+    Creates or updates many API documentation entries at once. Entries are applied in chunks of `chunk_size`,
+    each chunk as a single batched transaction of upserts on (endpoint, method), so a full catalogue refresh
+    costs two round trips per chunk instead of one or more per entry. A chunk that fails marks all its entries
+    as failed; other chunks are unaffected. If only reading back a committed chunk's ids fails, its entries are
+    reported imported without an `api_doc_id`.
+
+    Args:
+        entries (AsyncIterable[Any]): Entries as dicts (from a JSON array) or raw JSON lines (from NDJSON).
+        chunk_size (int): How many entries to apply per transaction.
+
+    Returns:
+        BulkImportResponse: The per-entry results, ordered by entry position.
+
+    Example:
+        async def entries():
+            yield {"endpoint": "/hello", "method": "GET", "description": "Says hello."}
+        await bulk_import_documentation(entries())
+        > BulkImportResponse(imported=1, failed=0, results=[BulkImportItemResult(index=0, success=True, api_doc_id=1)])
+    """
+    chunk_size = max(1, chunk_size)
+    results: List[BulkImportItemResult] = []
+    chunk: List[Tuple[int, Any]] = []
+    index = 0
+    async for raw in entries:
+        chunk.append((index, raw))
+        index += 1
+        if len(chunk) >= chunk_size:
+            await _import_chunk(chunk, results)
+            chunk = []
+    if chunk:
+        await _import_chunk(chunk, results)
+    results.sort(key=lambda result: result.index)
+    imported = sum(1 for result in results if result.success)
+    return BulkImportResponse(
+        imported=imported, failed=len(results) - imported, results=results
+    )
@@ -0,0 +1,90 @@
+import gzip
+import time
+import zlib
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+# Standard-library codecs by content-coding name, in order of preference when the client rates them equally.
+# Variants are compressed once per payload version, so the highest levels are affordable.
+CODECS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+    "deflate": lambda body: zlib.compress(body, 9),
+}
+
+try:
+    # Python 3.14+
+    from compression import zstd  # type: ignore[import-not-found]
+
+    CODECS = {"zstd": lambda body: zstd.compress(body, level=19), **CODECS}
+except ImportError:
+    pass
+
+
+class CompressedVariant(NamedTuple):
+    body: bytes
+    cpu_seconds: float
+
+
+def compress_variants(
+    body: bytes, encodings: Iterable[str], min_bytes: int
+) -> Dict[str, CompressedVariant]:
+    """
+    Compresses `body` once with each supported encoding. Bodies under `min_bytes`, unknown encodings and
+    variants that come out no smaller than the original are skipped. CPU-bound; run it off the event loop.
+
+    Args:
+        body (bytes): The uncompressed payload.
+        encodings (Iterable[str]): The content codings to produce, e.g. ["gzip", "deflate"].
+        min_bytes (int): The smallest body worth compressing.
+
+    Returns:
+        Dict[str, CompressedVariant]: Each compressed body with the CPU time it took, by encoding.
+
+    Example:
+        compress_variants(catalogue_json, ["gzip"], 1024)
+        > {'gzip': CompressedVariant(body=b'\\x1f\\x8b...', cpu_seconds=0.012)}
+    """
+    variants: Dict[str, CompressedVariant] = {}
+    if len(body) < min_bytes:
+        return variants
+    for encoding in encodings:
+        codec = CODECS.get(encoding)
+        if codec is None or encoding in variants:
+            continue
+        started = time.thread_time()
+        compressed = codec(body)
+        cpu_seconds = time.thread_time() - started
+        if len(compressed) < len(body):
+            variants[encoding] = CompressedVariant(compressed, cpu_seconds)
+    return variants
+
+
+def negotiate(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """
+    Picks the content coding to send from an Accept-Encoding header (RFC 9110 12.5.3): the available encoding
+    with the highest non-zero q-value, ties going to the earlier one in `available`. Returns None to send the
+    payload uncompressed.
+
+    Example:
+        negotiate("gzip;q=0.8, deflate", ["gzip", "deflate"])
+        > 'deflate'
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in available:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
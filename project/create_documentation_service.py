@@ -2,6 +2,10 @@ from typing import Dict
 
 import prisma
 import prisma.models
+import project.docs_catalogue_cache
+import project.docs_search_index
+import project.single_flight
+import project.write_batcher
 from pydantic import BaseModel
 
 
@@ -19,6 +23,7 @@ async def create_documentation(
 ) -> ApiDocsCreateOrUpdateResponse:
     """
     Allows an authorized user to create or update API documentation. The payload should include detailed descriptions for new or updated endpoints handled by HelloWorldHandler and HealthCheckHandler.
+    The single upsert does not report whether the entry was created or updated, so the message covers both.
 
     Args:
         endpoint (str): The endpoint URL being documented.
@@ -39,27 +44,31 @@ async def create_documentation(
         create_documentation(endpoint, method, description, request, response)
         > ApiDocsCreateOrUpdateResponse(message="Documentation created/updated successfully.", api_doc_id=1)
     """
-    existing_doc = await prisma.models.APIDocumentation.prisma().find_first(
-        where={"endpoint": endpoint, "method": method}
-    )
-    if existing_doc:
-        updated_doc = await prisma.models.APIDocumentation.prisma().update(
-            where={"id": existing_doc.id},
-            data={"description": description, "request": request, "response": response},
-        )
-        return ApiDocsCreateOrUpdateResponse(
-            message="Documentation updated successfully.", api_doc_id=updated_doc.id
-        )
-    else:
-        new_doc = await prisma.models.APIDocumentation.prisma().create(
+    # A single upsert on the (endpoint, method) unique key; Prisma runs it as one INSERT ... ON CONFLICT,
+    # so concurrent publishes of the same endpoint converge on one row. With WRITE_BATCHING_ENABLED,
+    # concurrent publishes are committed together in one transaction.
+    doc = await project.write_batcher.get_batcher().submit(
+        lambda client: prisma.models.APIDocumentation.prisma(client).upsert(
+            where={"endpoint_method": {"endpoint": endpoint, "method": method}},
             data={
-                "endpoint": endpoint,
-                "method": method,
-                "description": description,
-                "request": request,
-                "response": response,
-            }
-        )
-        return ApiDocsCreateOrUpdateResponse(
-            message="Documentation created successfully.", api_doc_id=new_doc.id
+                "create": {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "description": description,
+                    "request": prisma.Json(request),
+                    "response": prisma.Json(response),
+                },
+                "update": {
+                    "description": description,
+                    "request": prisma.Json(request),
+                    "response": prisma.Json(response),
+                },
+            },
         )
+    )
+    project.docs_catalogue_cache.get_cache().bump()
+    project.single_flight.get_group().forget("APIDocumentation")
+    project.docs_search_index.get_index().add(doc)
+    return ApiDocsCreateOrUpdateResponse(
+        message="Documentation created/updated successfully.", api_doc_id=doc.id
+    )
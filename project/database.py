@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import os
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import project.query_instrumentation
+import project.settings
+from prisma import Prisma
+
+logger = logging.getLogger(__name__)
+
+
+def pool_database_url(url: Optional[str] = None) -> Optional[str]:
+    """
+    Applies the DB_* pool settings to the Prisma connection URL as query parameters, overriding any values
+    already present. Unset settings leave the engine defaults in place.
+
+    Args:
+        url (Optional[str]): The base URL; defaults to the DATABASE_URL environment variable.
+
+    Returns:
+        Optional[str]: The URL to connect with, or None if there is no URL to rewrite.
+
+    Example:
+        pool_database_url("postgresql://user:pass@db:5432/helloworld")
+        > 'postgresql://user:pass@db:5432/helloworld?connection_limit=10&pool_timeout=10&connect_timeout=5'
+    """
+    url = url or os.getenv("DATABASE_URL")
+    if not url:
+        return None
+    overrides: Dict[str, str] = {}
+    if project.settings.DB_CONNECTION_LIMIT > 0:
+        overrides["connection_limit"] = str(project.settings.DB_CONNECTION_LIMIT)
+    if project.settings.DB_POOL_TIMEOUT_SECONDS >= 0:
+        overrides["pool_timeout"] = f"{project.settings.DB_POOL_TIMEOUT_SECONDS:g}"
+    if project.settings.DB_CONNECT_TIMEOUT_SECONDS >= 0:
+        overrides["connect_timeout"] = f"{project.settings.DB_CONNECT_TIMEOUT_SECONDS:g}"
+    if not overrides:
+        return url
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update(overrides)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class InstrumentedPrisma(Prisma):
+    """
+    The Prisma client with every model action and raw query timed and counted by project.query_instrumentation.
+    `_execute` is the one seam all of them go through; transactions run on copies made with `self.__class__`,
+    so they are instrumented too.
+    """
+
+    async def _execute(self, **kwargs: Any) -> Any:
+        return await project.query_instrumentation.execute(super()._execute, **kwargs)
+
+
+def create_client() -> Prisma:
+    """
+    Creates the shared, auto-registered Prisma client with the configured pool settings, instrumented unless
+    QUERY_INSTRUMENTATION_ENABLED is off.
+    """
+    url = pool_database_url()
+    kwargs = {}
+    if project.settings.DB_CONNECT_TIMEOUT_SECONDS >= 0:
+        kwargs["connect_timeout"] = timedelta(
+            seconds=project.settings.DB_CONNECT_TIMEOUT_SECONDS
+        )
+    client_class = (
+        InstrumentedPrisma if project.settings.QUERY_INSTRUMENTATION_ENABLED else Prisma
+    )
+    return client_class(
+        auto_register=True,
+        datasource={"url": url} if url else None,
+        **kwargs,
+    )
+
+
+async def warm_up(client: Prisma, connections: int) -> None:
+    """
+    Opens `connections` pool connections up front so the first requests after startup don't pay for connection
+    setup. Each probe holds its connection briefly so that concurrent probes cannot all share one connection.
+
+    Args:
+        client (Prisma): A connected client.
+        connections (int): How many connections to open; 0 skips the warm-up.
+    """
+    if connections <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(
+        *(
+            client.query_raw("SELECT 1 AS ok FROM pg_sleep(0.05)")
+            for _ in range(connections)
+        )
+    )
+    logger.info(
+        "Warmed up %d database connections in %.0f ms",
+        connections,
+        (loop.time() - started) * 1000,
+    )
+
@@ -0,0 +1,84 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Collects the keys requested by concurrent `load()` calls during one event loop tick and resolves them with
+    a single call to `batch_load`, caching the results. Create one per request, so the cache never serves data
+    across requests or users.
+
+    Example:
+        users = DataLoader(load_users_by_id)
+        alice, bob = await asyncio.gather(users.load(1), users.load(2))  # one query for both
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: Optional[int] = None,
+    ) -> None:
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._queue: List[K] = []
+        # Strong references to in-flight batches; the event loop only keeps weak ones.
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.batches = 0
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":
+        """
+        The value for `key`, or None if `batch_load` did not return it.
+        """
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[key] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        The values for `keys`, in order, fetched in as few batches as possible.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            task = asyncio.ensure_future(self._resolve(keys[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, keys: List[K]) -> None:
+        self.batches += 1
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                # Drop failed keys from the cache so a later load retries them.
+                future = self._cache.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._cache[key]
+            if not future.done():
+                future.set_result(values.get(key))
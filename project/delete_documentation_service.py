@@ -1,5 +1,8 @@
 import prisma
 import prisma.models
+import project.docs_catalogue_cache
+import project.docs_search_index
+import project.single_flight
 from pydantic import BaseModel
 
 
@@ -34,6 +37,9 @@ async def delete_documentation(docId: int) -> DeleteApiDocResponseModel:
             success=False, message="API documentation not found."
         )
     await prisma.models.APIDocumentation.prisma().delete(where={"id": docId})
+    project.docs_catalogue_cache.get_cache().bump()
+    project.single_flight.get_group().forget("APIDocumentation")
+    project.docs_search_index.get_index().remove(docId)
     return DeleteApiDocResponseModel(
         success=True, message="API documentation deleted successfully."
     )
@@ -0,0 +1,57 @@
+import prisma
+import prisma.models
+import project.auth
+import project.qa_aggregates
+import project.single_flight
+import project.token_cache
+from pydantic import BaseModel
+
+
+class DeleteUserAccountRequest(BaseModel):
+    """
+    Request model for deleting the authenticated user's account. Carries the user's JWT token.
+    """
+
+    token: str
+
+
+class DeleteUserAccountResponse(BaseModel):
+    """
+    Response model confirming the deletion of the user's account.
+    """
+
+    success: bool
+    message: str
+
+
+async def delete_user_account(
+    request: DeleteUserAccountRequest,
+) -> DeleteUserAccountResponse:
+    """
+    Deletes the authenticated user's account. Requires a valid JWT token. Returns a confirmation message upon successful deletion.
+
+    Every cached verification of the user's tokens is dropped, so a deleted user is rejected on their next request.
+
+    Args:
+        request (DeleteUserAccountRequest): Request model for deleting the authenticated user's account. Carries the user's JWT token.
+
+    Returns:
+        DeleteUserAccountResponse: Response model confirming the deletion of the user's account.
+
+    Example:
+        request = DeleteUserAccountRequest(token="some.jwt.token")
+        await delete_user_account(request)
+        > DeleteUserAccountResponse(success=True, message='User account deleted successfully.')
+    """
+    user_id = project.auth.user_id_from_token(request.token)
+    deleted_user = await prisma.models.User.prisma().delete(where={"id": user_id})
+    project.token_cache.get_cache().invalidate_user(user_id)
+    project.single_flight.get_group().forget("User")
+    if not deleted_user:
+        return DeleteUserAccountResponse(
+            success=False, message="User account not found."
+        )
+    project.qa_aggregates.get_aggregates().user_deleted(user_id)
+    return DeleteUserAccountResponse(
+        success=True, message="User account deleted successfully."
+    )
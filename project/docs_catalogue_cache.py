@@ -0,0 +1,200 @@
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import project.compression
+import project.settings
+from pydantic import BaseModel
+
+
+class CatalogueSnapshot:
+    """
+    The serialized API documentation catalogue at one version, ready to be written to the wire, along with
+    its precompressed variants by content coding.
+    """
+
+    __slots__ = ("version", "body", "etag", "loaded_at", "variants")
+
+    def __init__(
+        self,
+        version: int,
+        body: bytes,
+        etag: bytes,
+        loaded_at: float,
+        variants: Dict[str, bytes],
+    ) -> None:
+        self.version = version
+        self.body = body
+        self.etag = etag
+        self.loaded_at = loaded_at
+        self.variants = variants
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], bytes, bytes]:
+        """
+        Picks the representation for an Accept-Encoding header. Each encoding has its own ETag, as RFC 9110
+        requires for different representations of the same resource.
+
+        Returns:
+            Tuple[Optional[str], bytes, bytes]: The content coding (None for identity), the body and the ETag.
+        """
+        encoding = project.compression.negotiate(accept_encoding, self.variants)
+        if encoding is None:
+            return None, self.body, self.etag
+        return encoding, self.variants[encoding], self.etag[:-1] + b"-" + encoding.encode("ascii") + b'"'
+
+
+class DocsCatalogueCache:
+    """
+    A read-through cache of the serialized documentation catalogue keyed by a version counter. Every write to
+    APIDocumentation calls `bump()`, which retires the current snapshot; the next read loads and serializes the
+    catalogue once and every read after that is served from memory.
+
+    Writes made by other replicas are not seen by `bump()`, so snapshots also expire after `ttl_seconds`
+    (0 disables expiry). A reload that finds different content moves to a new version and therefore a new ETag.
+
+    Each snapshot is also compressed once per `encodings` entry (off the event loop), so negotiated responses
+    are ready-made buffers. Bytes saved by serving them and the CPU time spent compressing are counted per
+    encoding.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, encodings: Tuple[str, ...] = (), min_compress_bytes: int = 1024
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.encodings = encodings
+        self.min_compress_bytes = min_compress_bytes
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.compress_seconds: Dict[str, float] = {}
+        self.served: Dict[str, int] = {}
+        self.bytes_saved: Dict[str, int] = {}
+        # Distinguishes versions across processes so one replica's ETag never validates against another's.
+        self._instance = os.urandom(4).hex()
+        self._snapshot: Optional[CatalogueSnapshot] = None
+        self._lock = asyncio.Lock()
+
+    def bump(self) -> None:
+        """
+        Marks the catalogue as changed; call after any create, update or delete of documentation.
+        """
+        self.version += 1
+        self._snapshot = None
+
+    def current(self) -> Optional[CatalogueSnapshot]:
+        """
+        Returns the snapshot for the current version, or None if it has to be (re)loaded.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version:
+            return None
+        if self.ttl_seconds > 0 and time.monotonic() - snapshot.loaded_at > self.ttl_seconds:
+            return None
+        return snapshot
+
+    async def get(self, loader: Callable[[], Awaitable[BaseModel]]) -> CatalogueSnapshot:
+        """
+        Returns the current snapshot, loading it through `loader` at most once per version.
+
+        Args:
+            loader (Callable[[], Awaitable[BaseModel]]): Fetches the full catalogue, e.g. get_api_documentation.
+
+        Returns:
+            CatalogueSnapshot: The serialized catalogue and its ETag.
+
+        Example:
+            snapshot = await get_cache().get(lambda: get_api_documentation(GetApiDocsRequest()))
+            > CatalogueSnapshot(version=3, etag=b'"docs-1a2b3c4d-3"', ...)
+        """
+        snapshot = self.current()
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+        async with self._lock:
+            snapshot = self.current()
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            previous = self._snapshot
+            version = self.version
+            body = (await loader()).model_dump_json().encode("utf-8")
+            # A reload that finds the same content (e.g. after the TTL) keeps the compressed variants.
+            if previous is not None and previous.body == body:
+                variants = previous.variants
+            else:
+                variants = await self._compress(body)
+            if version != self.version:
+                # A write landed while loading; serve this result once but do not cache it.
+                return CatalogueSnapshot(
+                    version, body, self._etag(version), time.monotonic(), variants
+                )
+            if previous is not None and previous.version == version and previous.body != body:
+                self.version += 1
+            snapshot = CatalogueSnapshot(
+                self.version, body, self._etag(self.version), time.monotonic(), variants
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+    async def _compress(self, body: bytes) -> Dict[str, bytes]:
+        if not self.encodings or len(body) < self.min_compress_bytes:
+            return {}
+        compressed = await asyncio.to_thread(
+            project.compression.compress_variants,
+            body,
+            self.encodings,
+            self.min_compress_bytes,
+        )
+        for encoding, variant in compressed.items():
+            self.compress_seconds[encoding] = (
+                self.compress_seconds.get(encoding, 0.0) + variant.cpu_seconds
+            )
+        return {encoding: variant.body for encoding, variant in compressed.items()}
+
+    def record_served(self, snapshot: CatalogueSnapshot, encoding: Optional[str]) -> None:
+        """
+        Counts a full response sent with `encoding` (None for identity) and the bytes its compression saved.
+        """
+        key = encoding or "identity"
+        self.served[key] = self.served.get(key, 0) + 1
+        if encoding is not None:
+            saved = len(snapshot.body) - len(snapshot.variants[encoding])
+            self.bytes_saved[encoding] = self.bytes_saved.get(encoding, 0) + saved
+
+    def stats(self) -> Dict[str, float]:
+        stats: Dict[str, float] = {
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+        snapshot = self._snapshot
+        if snapshot is not None:
+            stats["identity_bytes"] = len(snapshot.body)
+            for encoding, body in snapshot.variants.items():
+                stats[f"{encoding}_bytes"] = len(body)
+        for key, count in self.served.items():
+            stats[f"{key}_served"] = count
+        for encoding, saved in self.bytes_saved.items():
+            stats[f"{encoding}_bytes_saved"] = saved
+        for encoding, seconds in self.compress_seconds.items():
+            stats[f"{encoding}_compress_cpu_seconds"] = seconds
+        return stats
+
+    def _etag(self, version: int) -> bytes:
+        return f'"docs-{self._instance}-{version}"'.encode("ascii")
+
+
+_cache = DocsCatalogueCache(
+    ttl_seconds=project.settings.DOCS_CACHE_TTL_SECONDS,
+    encodings=project.settings.DOCS_COMPRESSION_ENCODINGS,
+    min_compress_bytes=project.settings.DOCS_COMPRESSION_MIN_BYTES,
+)
+
+
+def get_cache() -> DocsCatalogueCache:
+    """
+    Returns the process-wide documentation catalogue cache.
+    """
+    return _cache
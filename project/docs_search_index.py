@@ -0,0 +1,267 @@
+import asyncio
+import heapq
+import logging
+import math
+import re
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import prisma
+import prisma.models
+import project.settings
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of a term depending on the field it occurs in.
+FIELD_WEIGHTS = (("endpoint", 3.0), ("method", 2.0), ("description", 1.0))
+
+# A query token that only prefixes a term scores this fraction of an exact match.
+PREFIX_FACTOR = 0.6
+
+# Query tokens shorter than this only match whole words, so that a letter or two does not expand to most of the
+# index; longer ones also match every term they prefix.
+MIN_PREFIX_LENGTH = 3
+
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lower-cased alphanumeric runs, with camelCase split into words.
+
+    Example:
+        tokenize("GET /api/docs/{docId}")
+        > ['get', 'api', 'docs', 'doc', 'id']
+    """
+    return _TOKEN.findall(_CAMEL.sub(r"\1 \2", text).lower())
+
+
+class DocsSearchHit(BaseModel):
+    """
+    One API documentation entry matching a search, with its relevance score.
+    """
+
+    id: int
+    endpoint: str
+    method: str
+    description: str
+    score: float
+
+
+class DocsSearchIndex:
+    """
+    An inverted index over the endpoint, method and description of every APIDocumentation row. Each term maps
+    to the documents containing it and a field-weighted frequency; the sorted term list supports prefix
+    matching with a binary search. Queries never touch the database.
+
+    `rebuild()` loads the table at startup. The documentation services then keep it current with `add()` and
+    `remove()`. Writes made by other replicas are only picked up by a rebuild, which `search()` schedules in
+    the background once the index is older than `refresh_seconds` (0 disables refreshing).
+    """
+
+    def __init__(self, refresh_seconds: float) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.built_at: Optional[float] = None
+        self.searches = 0
+        self.rebuilds = 0
+        self._docs: Dict[int, Tuple[str, str, str]] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._terms: List[str] = []
+        self._doc_terms: Dict[int, Set[str]] = {}
+        # Writes applied while a rebuild is loading rows, replayed onto the rebuilt index before it goes live.
+        self._pending: Optional[List[Tuple[str, Any]]] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    def _add(self, id: int, endpoint: str, method: str, description: str) -> None:
+        self._remove(id)
+        self._docs[id] = (endpoint, method, description)
+        fields = {"endpoint": endpoint, "method": method, "description": description}
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS:
+            for term in tokenize(fields[field]):
+                weights[term] = weights.get(term, 0.0) + weight
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._terms, term)
+            postings[id] = weight
+        self._doc_terms[id] = set(weights)
+
+    def _remove(self, id: int) -> None:
+        if self._docs.pop(id, None) is None:
+            return
+        for term in self._doc_terms.pop(id):
+            postings = self._postings[term]
+            del postings[id]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+
+    def add(self, doc: Any) -> None:
+        """
+        Indexes a created or updated documentation row (anything with id, endpoint, method and description),
+        replacing its previous entry.
+        """
+        self._add(doc.id, doc.endpoint, doc.method, doc.description)
+        if self._pending is not None:
+            self._pending.append(("add", (doc.id, doc.endpoint, doc.method, doc.description)))
+
+    def remove(self, id: int) -> None:
+        """
+        Drops a deleted documentation row from the index.
+        """
+        self._remove(id)
+        if self._pending is not None:
+            self._pending.append(("remove", id))
+
+    def _replace(self, rows: Iterable[Tuple[int, str, str, str]]) -> None:
+        self._docs, self._postings, self._terms, self._doc_terms = {}, {}, [], {}
+        for row in rows:
+            self._add(*row)
+
+    async def rebuild(self) -> None:
+        """
+        Reloads the whole index from the database.
+        """
+        self._pending = []
+        try:
+            docs = await prisma.models.APIDocumentation.prisma().find_many()
+            pending = self._pending
+            self._replace((doc.id, doc.endpoint, doc.method, doc.description) for doc in docs)
+            for op, arg in pending:
+                if op == "add":
+                    self._add(*arg)
+                else:
+                    self._remove(arg)
+        finally:
+            self._pending = None
+        self.built_at = time.monotonic()
+        self.rebuilds += 1
+
+    def _refresh_in_background(self) -> None:
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            return
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    "Rebuilding the documentation search index failed",
+                    exc_info=task.exception(),
+                )
+
+        self._rebuild_task = asyncio.get_running_loop().create_task(self.rebuild())
+        self._rebuild_task.add_done_callback(log_failure)
+
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """
+        The index terms matching a query token, with their factor: the exact term, plus every term it prefixes
+        once the token is at least MIN_PREFIX_LENGTH characters long.
+        """
+        start = bisect_left(self._terms, token)
+        if len(token) < MIN_PREFIX_LENGTH:
+            if start < len(self._terms) and self._terms[start] == token:
+                return [(token, 1.0)]
+            return []
+        # "{" sorts after every character a term can hold, so this ends the run of terms starting with `token`.
+        end = bisect_left(self._terms, token + "{", start)
+        return [
+            (term, 1.0 if term == token else PREFIX_FACTOR) for term in self._terms[start:end]
+        ]
+
+    def search(self, query: str, limit: int = 20) -> List[DocsSearchHit]:
+        """
+        Ranks the documentation entries that match every token of `query` (each as a whole word or, from
+        MIN_PREFIX_LENGTH characters on, a word prefix), scoring matches by field weight and inverse document
+        frequency.
+
+        Args:
+            query (str): Free text, e.g. "user prof" or "DELETE docs".
+            limit (int): The maximum number of hits to return.
+
+        Returns:
+            List[DocsSearchHit]: The best hits first.
+
+        Example:
+            get_index().search("hello")
+            > [DocsSearchHit(id=1, endpoint='/hello', method='GET', description="Returns 'Hello World'.", ...)]
+        """
+        self.searches += 1
+        if (
+            self.refresh_seconds > 0
+            and self.built_at is not None
+            and time.monotonic() - self.built_at > self.refresh_seconds
+        ):
+            self._refresh_in_background()
+
+        total = len(self._docs)
+        tokens = []
+        for token in dict.fromkeys(tokenize(query)):
+            expansions = [
+                (self._postings[term], factor) for term, factor in self._expand(token)
+            ]
+            if not expansions:
+                return []
+            tokens.append((sum(len(postings) for postings, _ in expansions), expansions))
+        if not tokens:
+            return []
+
+        # The rarest token picks the candidates; the others only need checking against those.
+        tokens.sort(key=lambda item: item[0])
+        scores: Dict[int, float] = {}
+        for postings, factor in tokens[0][1]:
+            idf = math.log(1.0 + total / len(postings))
+            for id, weight in postings.items():
+                score = weight * idf * factor
+                if score > scores.get(id, 0.0):
+                    scores[id] = score
+        for _, expansions in tokens[1:]:
+            weighted = [
+                (postings, math.log(1.0 + total / len(postings)) * factor)
+                for postings, factor in expansions
+            ]
+            narrowed: Dict[int, float] = {}
+            for id, score in scores.items():
+                best = 0.0
+                for postings, scale in weighted:
+                    weight = postings.get(id)
+                    if weight is not None and weight * scale > best:
+                        best = weight * scale
+                if best:
+                    narrowed[id] = score + best
+            if not narrowed:
+                return []
+            scores = narrowed
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        hits = []
+        for id, score in ranked:
+            endpoint, method, description = self._docs[id]
+            hits.append(
+                DocsSearchHit(
+                    id=id,
+                    endpoint=endpoint,
+                    method=method,
+                    description=description,
+                    score=round(score, 4),
+                )
+            )
+        return hits
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "documents": len(self._docs),
+            "terms": len(self._terms),
+            "searches": self.searches,
+            "rebuilds": self.rebuilds,
+        }
+
+
+_index = DocsSearchIndex(project.settings.DOCS_SEARCH_REFRESH_SECONDS)
+
+
+def get_index() -> DocsSearchIndex:
+    return _index
@@ -0,0 +1,182 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Tuple
+
+import project.settings
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[str, str, int]
+
+# Upper bound on distinct signatures tracked at once; the least recently seen are forgotten first.
+MAX_SIGNATURES = 1024
+
+_ERROR_PREFIX = b'{"error":'
+_ERROR_SUFFIX = b"}"
+
+
+def signature(exc: BaseException) -> Signature:
+    """
+    Identifies "the same error" independently of its message, which often embeds ids or timings: the exception
+    type plus the file and line that raised it.
+
+    Example:
+        signature(ValueError("Invalid or expired token"))
+        > ('builtins.ValueError', '/app/project/get_user_profile_service.py', 41)
+    """
+    tb = exc.__traceback__
+    filename, lineno = "", 0
+    while tb is not None:
+        filename, lineno = tb.tb_frame.f_code.co_filename, tb.tb_lineno
+        tb = tb.tb_next
+    cls = type(exc)
+    return f"{cls.__module__}.{cls.__qualname__}", filename, lineno
+
+
+@lru_cache(maxsize=256)
+def error_body(message: str) -> bytes:
+    """
+    The JSON body `{"error": message}`, pre-encoded. Outages tend to produce the same few messages over and
+    over, so the encoded bodies are cached.
+    """
+    return _ERROR_PREFIX + json.dumps(message).encode("utf-8") + _ERROR_SUFFIX
+
+
+class _SignatureState:
+    __slots__ = ("count", "suppressed", "last_logged")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.suppressed = 0
+        self.last_logged = float("-inf")
+
+
+class ErrorReporter:
+    """
+    Logs unhandled exceptions without letting logging become the bottleneck during an outage. Occurrences are
+    grouped by `signature`; a full traceback is written for the first occurrence of a signature and then at
+    most once per `trace_interval_seconds` for it, with a global cap of `max_traces_per_minute` across all
+    signatures. Everything else is only counted, and the next logged trace reports how many were suppressed.
+    """
+
+    def __init__(self, trace_interval_seconds: float, max_traces_per_minute: int) -> None:
+        self.trace_interval_seconds = trace_interval_seconds
+        self.max_traces_per_minute = max_traces_per_minute
+        self._signatures: "OrderedDict[Signature, _SignatureState]" = OrderedDict()
+        self._window_started = time.monotonic()
+        self._window_traces = 0
+        # Guards the bookkeeping so report() is also safe to call from worker threads.
+        self._lock = threading.Lock()
+        self.errors = 0
+        self.traces_logged = 0
+        self.suppressed = 0
+
+    def _should_log(self, state: _SignatureState, now: float) -> bool:
+        if now - state.last_logged < self.trace_interval_seconds:
+            return False
+        if self.max_traces_per_minute <= 0:
+            return True
+        if now - self._window_started >= 60.0:
+            self._window_started = now
+            self._window_traces = 0
+        if self._window_traces >= self.max_traces_per_minute:
+            return False
+        self._window_traces += 1
+        return True
+
+    def report(self, exc: BaseException, message: str = "Error processing request") -> bool:
+        """
+        Records one occurrence of `exc`, logging its traceback if the signature and global budgets allow.
+
+        Returns:
+            bool: True if a traceback was written, False if the occurrence was only counted.
+        """
+        key = signature(exc)
+        now = time.monotonic()
+        with self._lock:
+            self.errors += 1
+            state = self._signatures.get(key)
+            if state is None:
+                state = self._signatures[key] = _SignatureState()
+                if len(self._signatures) > MAX_SIGNATURES:
+                    self._signatures.popitem(last=False)
+            else:
+                self._signatures.move_to_end(key)
+            state.count += 1
+            if not self._should_log(state, now):
+                state.suppressed += 1
+                self.suppressed += 1
+                return False
+            suppressed, state.suppressed = state.suppressed, 0
+            state.last_logged = now
+            self.traces_logged += 1
+        if suppressed:
+            logger.error(
+                "%s (%d similar errors suppressed since the last trace, %d in total)",
+                message,
+                suppressed,
+                state.count,
+                exc_info=exc,
+            )
+        else:
+            logger.error(message, exc_info=exc)
+        return True
+
+    def top(self, n: int = 10) -> Dict[Signature, int]:
+        """
+        The `n` most frequent signatures currently tracked, with their occurrence counts.
+        """
+        with self._lock:
+            counts = [(key, state.count) for key, state in self._signatures.items()]
+        return dict(sorted(counts, key=lambda item: item[1], reverse=True)[:n])
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "errors": self.errors,
+            "traces_logged": self.traces_logged,
+            "suppressed": self.suppressed,
+            "signatures": len(self._signatures),
+        }
+
+
+reporter = ErrorReporter(
+    project.settings.ERROR_TRACE_INTERVAL_SECONDS,
+    project.settings.ERROR_MAX_TRACES_PER_MINUTE,
+)
+
+
+def error_response(
+    exc: BaseException,
+    status_code: int = 500,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Builds the `{"error": str(exc)}` response every route returns on failure, from a pre-encoded body.
+    """
+    return Response(
+        content=error_body(str(exc)),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def internal_error(exc: BaseException) -> Response:
+    """
+    The shared `except Exception` path of the routes: reports `exc` through the rate-limited reporter and
+    returns a 500 response.
+
+    Example:
+        try:
+            res = await some_service(...)
+            return res
+        except Exception as e:
+            return project.errors.internal_error(e)
+    """
+    reporter.report(exc)
+    return error_response(exc)
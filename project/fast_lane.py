@@ -0,0 +1,152 @@
+import hashlib
+from typing import Dict, Iterable, List, Tuple
+
+from pydantic import BaseModel
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class ConstantResponse:
+    """
+    A response whose body never changes, serialized once with its headers and strong ETag precomputed.
+    """
+
+    __slots__ = ("body", "etag", "headers", "not_modified_headers")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        cache_control: str = "no-cache",
+    ) -> None:
+        self.body = body
+        self.etag = b'"' + hashlib.sha256(body).hexdigest()[:32].encode("ascii") + b'"'
+        self.headers: Headers = [
+            (b"content-type", media_type.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("ascii")),
+            (b"etag", self.etag),
+            (b"cache-control", cache_control.encode("latin-1")),
+        ]
+        self.not_modified_headers: Headers = [
+            (b"etag", self.etag),
+            (b"cache-control", cache_control.encode("latin-1")),
+        ]
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "ConstantResponse":
+        """
+        Builds a constant JSON response from an already validated pydantic model.
+
+        Args:
+            model (BaseModel): The payload to serialize once.
+
+        Returns:
+            ConstantResponse: The pre-serialized response.
+
+        Example:
+            ConstantResponse.from_model(HelloWorldResponseModel(message="Hello, World!")).body
+            > b'{"message":"Hello, World!"}'
+        """
+        return cls(model.model_dump_json().encode("utf-8"))
+
+    def matches(self, if_none_match: bytes) -> bool:
+        return etag_matches(if_none_match, self.etag)
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """
+    Checks an If-None-Match header value against an ETag using weak comparison (RFC 9110 13.1.2).
+
+    Args:
+        if_none_match (bytes): The raw header value.
+        etag (bytes): The quoted ETag of the current representation.
+
+    Returns:
+        bool: True if the client already holds this representation.
+
+    Example:
+        etag_matches(b'W/"abc", "def"', b'"abc"')
+        > True
+    """
+    if if_none_match.strip() == b"*":
+        return True
+    for candidate in if_none_match.split(b","):
+        candidate = candidate.strip()
+        if candidate.startswith(b"W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _header(scope: dict, name: bytes) -> bytes | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class FastLaneMiddleware:
+    """
+    Raw ASGI middleware that answers GET/HEAD requests for a fixed set of paths from precomputed bytes,
+    bypassing routing, request parsing, response validation and JSON encoding. Every other request is
+    passed through to the wrapped application untouched.
+    """
+
+    def __init__(self, app, responses: Dict[str, ConstantResponse]) -> None:
+        self.app = app
+        self.responses = dict(responses)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            constant = self.responses.get(scope["path"])
+            if constant is not None:
+                scope["route_template"] = scope["path"]
+                await self.respond(constant, scope, send)
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def respond(constant: ConstantResponse, scope: dict, send) -> None:
+        if_none_match = _header(scope, b"if-none-match")
+        if if_none_match is not None and constant.matches(if_none_match):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": constant.not_modified_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": constant.headers,
+            }
+        )
+        body = b"" if scope["method"] == "HEAD" else constant.body
+        await send({"type": "http.response.body", "body": body})
+
+
+def constant_routes(
+    entries: Iterable[Tuple[str, BaseModel]]
+) -> Dict[str, ConstantResponse]:
+    """
+    Pre-serializes a set of constant route payloads for FastLaneMiddleware.
+
+    Args:
+        entries (Iterable[Tuple[str, BaseModel]]): (path, payload) pairs, first one wins for duplicate paths.
+
+    Returns:
+        Dict[str, ConstantResponse]: The path to response table.
+
+    Example:
+        constant_routes([("/hello", HelloWorldResponseModel(message="Hello, World!"))])
+        > {'/hello': <ConstantResponse>}
+    """
+    responses: Dict[str, ConstantResponse] = {}
+    for path, model in entries:
+        responses.setdefault(path, ConstantResponse.from_model(model))
+    return responses
@@ -0,0 +1,89 @@
+import asyncio
+import functools
+from typing import Any, Callable, Dict
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+_stats = {"fast": 0, "fallback": 0}
+
+# Route options that change what FastAPI's own serialization would output; routes using any of them keep it.
+_DEFAULT_OPTIONS = {
+    "response_model_include": None,
+    "response_model_exclude": None,
+    "response_model_by_alias": True,
+    "response_model_exclude_unset": False,
+    "response_model_exclude_defaults": False,
+    "response_model_exclude_none": False,
+}
+
+
+def _unwrap(value: Any) -> Any:
+    return value.value if isinstance(value, DefaultPlaceholder) else value
+
+
+def _eligible(endpoint: Callable[..., Any], kwargs: Dict[str, Any]) -> bool:
+    model = _unwrap(kwargs.get("response_model"))
+    return (
+        isinstance(model, type)
+        and issubclass(model, BaseModel)
+        and asyncio.iscoroutinefunction(endpoint)
+        and _unwrap(kwargs.get("response_class", JSONResponse)) is JSONResponse
+        and all(
+            _unwrap(kwargs.get(option, default)) == default
+            for option, default in _DEFAULT_OPTIONS.items()
+        )
+    )
+
+
+def _typed_endpoint(
+    endpoint: Callable[..., Any], model: type, status_code: int
+) -> Callable[..., Any]:
+    serializer = model.__pydantic_serializer__
+
+    # functools.wraps keeps the signature FastAPI inspects for parameters (it follows __wrapped__).
+    @functools.wraps(endpoint)
+    async def typed_endpoint(*args: Any, **kwargs: Any) -> Any:
+        res = await endpoint(*args, **kwargs)
+        # Only the exact declared type: a subclass may carry fields the response model would filter out.
+        if type(res) is model:
+            _stats["fast"] += 1
+            return Response(
+                content=serializer.to_json(res),
+                status_code=status_code,
+                media_type="application/json",
+            )
+        _stats["fallback"] += 1
+        return res
+
+    typed_endpoint.typed_response_model = model
+    return typed_endpoint
+
+
+class TypedResponseRoute(APIRoute):
+    """
+    An APIRoute that skips FastAPI's response validation and `jsonable_encoder` pass when the endpoint
+    returns an instance of exactly its `response_model`: services build those models themselves, so they are
+    already valid, and pydantic's serializer writes them straight to JSON bytes. Anything else (a Response,
+    a dict, another model) goes through the usual FastAPI path, as do routes whose options (include/exclude,
+    a custom response class, ...) would change the output.
+
+    Example:
+        router = APIRouter(route_class=TypedResponseRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # include_router() rebuilds routes from their (already wrapped) endpoints.
+        if not hasattr(endpoint, "typed_response_model") and _eligible(endpoint, kwargs):
+            endpoint = _typed_endpoint(
+                endpoint,
+                _unwrap(kwargs["response_model"]),
+                _unwrap(kwargs.get("status_code")) or 200,
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+
+def stats() -> Dict[str, int]:
+    return dict(_stats)
@@ -1,7 +1,9 @@
-from typing import Dict, List
+import json
+from typing import AsyncIterator, Dict, List, Optional
 
 import prisma
 import prisma.models
+import project.single_flight
 from pydantic import BaseModel
 
 
@@ -34,10 +36,33 @@ class ApiDocsResponse(BaseModel):
     documentation: List[APIDocumentation]
 
 
+class ApiDocsPage(ApiDocsResponse):
+    """
+    One page of the API documentation, with the cursor of the next page when more entries follow.
+    """
+
+    next_cursor: Optional[int] = None
+
+
+MAX_PAGE_SIZE = 1000
+
+
+def _to_model(doc: prisma.models.APIDocumentation) -> APIDocumentation:
+    return APIDocumentation(
+        id=doc.id,
+        endpoint=doc.endpoint,
+        method=doc.method,
+        description=doc.description,
+        request=doc.request,
+        response=doc.response,
+    )
+
+
 async def get_api_documentation(request: GetApiDocsRequest) -> ApiDocsResponse:
     """
     Fetches the complete API documentation including requests and responses for all available endpoints.
     This requires consolidating documentation generated by HelloWorldHandler and HealthCheckHandler.
+    Concurrent calls share one database query.
 
     Args:
     request (GetApiDocsRequest): Request model for fetching the API documentation. This endpoint has no input parameters.
@@ -51,18 +76,95 @@ async def get_api_documentation(request: GetApiDocsRequest) -> ApiDocsResponse:
         response = await get_api_documentation(request)
         > ApiDocsResponse(documentation=[APIDocumentation(...), ...])
     """
-    api_docs = await prisma.models.APIDocumentation.prisma().find_many()
+    api_docs = await project.single_flight.get_group().do(
+        project.single_flight.query_key("APIDocumentation", "find_many"),
+        lambda: prisma.models.APIDocumentation.prisma().find_many(),
+    )
     documentation = []
     for doc in api_docs:
-        documentation.append(
-            APIDocumentation(
-                id=doc.id,
-                endpoint=doc.endpoint,
-                method=doc.method,
-                description=doc.description,
-                request=doc.request,
-                response=doc.response,
-            )
-        )
+        documentation.append(_to_model(doc))
     response = ApiDocsResponse(documentation=documentation)
     return response
+
+
+async def _fetch_after(
+    after: Optional[int], take: int
+) -> List[prisma.models.APIDocumentation]:
+    return await prisma.models.APIDocumentation.prisma().find_many(
+        where={"id": {"gt": after}} if after is not None else None,
+        order={"id": "asc"},
+        take=take,
+    )
+
+
+async def get_api_documentation_page(
+    limit: int, after: Optional[int] = None
+) -> ApiDocsPage:
+    """
+    Fetches one page of API documentation using keyset pagination on `id`, so every page costs the same
+    regardless of how deep into the catalogue it is.
+
+    Args:
+        limit (int): The maximum number of entries to return, capped at MAX_PAGE_SIZE.
+        after (Optional[int]): The `next_cursor` of the previous page; omit it for the first page.
+
+    Returns:
+        ApiDocsPage: The page, with `next_cursor` set when more entries follow.
+
+    Example:
+        page = await get_api_documentation_page(limit=50)
+        > ApiDocsPage(documentation=[APIDocumentation(id=1, ...), ...], next_cursor=50)
+        await get_api_documentation_page(limit=50, after=page.next_cursor)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    api_docs = await _fetch_after(after, limit + 1)
+    has_more = len(api_docs) > limit
+    documentation = [_to_model(doc) for doc in api_docs[:limit]]
+    return ApiDocsPage(
+        documentation=documentation,
+        next_cursor=documentation[-1].id if has_more else None,
+    )
+
+
+async def stream_api_documentation(chunk_size: int = 500) -> AsyncIterator[bytes]:
+    """
+    Streams the whole API documentation catalogue as NDJSON, one entry per line. Rows are fetched in keyset
+    chunks of `chunk_size` and written as they arrive, so memory stays constant however large the table is.
+
+    Args:
+        chunk_size (int): How many rows to fetch per database round trip, capped at MAX_PAGE_SIZE.
+
+    Returns:
+        AsyncIterator[bytes]: One chunk of NDJSON lines per database fetch.
+
+    Example:
+        async for chunk in stream_api_documentation(chunk_size=100):
+            print(chunk)
+        > b'{"id":1,"endpoint":"/hello","method":"GET",...}\\n...'
+    """
+    chunk_size = max(1, min(chunk_size, MAX_PAGE_SIZE))
+    after: Optional[int] = None
+    while True:
+        api_docs = await _fetch_after(after, chunk_size)
+        if not api_docs:
+            return
+        lines = []
+        for doc in api_docs:
+            lines.append(
+                json.dumps(
+                    {
+                        "id": doc.id,
+                        "endpoint": doc.endpoint,
+                        "method": doc.method,
+                        "description": doc.description,
+                        "request": doc.request,
+                        "response": doc.response,
+                    },
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
+            )
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+        if len(api_docs) < chunk_size:
+            return
+        after = api_docs[-1].id
@@ -1,6 +1,7 @@
 import jwt
 import prisma
 import prisma.models
+import project.token_cache
 from pydantic import BaseModel
 
 
@@ -22,7 +23,9 @@ class HelloWorldResponse(BaseModel):
 
 async def verify_user(token: str) -> bool:
     """
-    Verifies the user's JWT token to ensure they are authenticated.
+    Verifies the user's JWT token to ensure they are authenticated. Results are cached per token (see
+    project.token_cache), so a token that was already verified costs no database round trip until it expires
+    or its user is deleted.
 
     Args:
         token (str): The JWT token for user authentication.
@@ -35,13 +38,21 @@ async def verify_user(token: str) -> bool:
         verify_user(token)
         > True
     """
+    cache = project.token_cache.get_cache()
+    cached = cache.get(token)
+    if cached is not None:
+        return cached.user_exists
     try:
         decoded_token = jwt.decode(token, "your-secret-key", algorithms=["HS256"])
         user_id = decoded_token.get("user_id")
         if user_id:
+            generation = cache.generation
             user = await prisma.models.User.prisma().find_unique(
                 where={"id": int(user_id)}
             )
+            cache.put(
+                token, decoded_token, int(user_id), user is not None, generation
+            )
             return user is not None
         return False
     except jwt.ExpiredSignatureError:
@@ -0,0 +1,50 @@
+import prisma
+import prisma.enums
+import prisma.models
+import project.auth
+import project.single_flight
+from pydantic import BaseModel
+
+
+class GetUserProfileRequest(BaseModel):
+    """
+    Request model for fetching the authenticated user's profile. Carries the user's JWT token.
+    """
+
+    token: str
+
+
+class UserProfileResponse(BaseModel):
+    """
+    Response model containing the authenticated user's profile information.
+    """
+
+    id: int
+    email: str
+    role: prisma.enums.Role
+
+
+async def get_user_profile(request: GetUserProfileRequest) -> UserProfileResponse:
+    """
+    Retrieves the profile of the authenticated user. Requires a valid JWT token. Returns user profile information.
+    Concurrent reads of the same profile share one database query.
+
+    Args:
+        request (GetUserProfileRequest): Request model for fetching the authenticated user's profile. Carries the user's JWT token.
+
+    Returns:
+        UserProfileResponse: Response model containing the authenticated user's profile information.
+
+    Example:
+        request = GetUserProfileRequest(token="some.jwt.token")
+        await get_user_profile(request)
+        > UserProfileResponse(id=1, email='john.doe', role=<Role.User: 'User'>)
+    """
+    where = {"id": project.auth.user_id_from_token(request.token)}
+    user = await project.single_flight.get_group().do(
+        project.single_flight.query_key("User", "find_unique", where=where),
+        lambda: prisma.models.User.prisma().find_unique(where=where),
+    )
+    if not user:
+        raise ValueError("User not found")
+    return UserProfileResponse(id=user.id, email=user.email, role=user.role)
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+import project.settings
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    # Only for annotations: the fast lane renders the shallow health check before prisma is imported.
+    import prisma
+
+logger = logging.getLogger(__name__)
+
+
+class HealthCheckResponse(BaseModel):
+    """
+    Response model for the shallow health check. It only confirms that the process is serving requests.
+    """
+
+    status: str
+    message: str
+
+
+class DatabaseStatus(BaseModel):
+    """
+    The result of the most recent background probe of the database connection.
+    """
+
+    healthy: bool
+    latency_ms: Optional[float] = None
+    last_success: Optional[datetime] = None
+    last_checked: Optional[datetime] = None
+    last_error: Optional[str] = None
+    consecutive_failures: int = 0
+
+
+class DeepHealthCheckResponse(BaseModel):
+    """
+    Response model for the deep health check, reporting the cached database probe result.
+    """
+
+    status: str
+    database: DatabaseStatus
+
+
+SHALLOW_RESPONSE = HealthCheckResponse(status="ok", message="Hello World")
+
+SHALLOW_BODY = SHALLOW_RESPONSE.model_dump_json().encode("utf-8")
+
+
+def health_check() -> HealthCheckResponse:
+    """
+    This endpoint verifies the operational status of the API. When called, it returns a simple message 'Hello World' indicating the API is operational. It does not interact with any other APIs or databases and should always return a 200 OK status if the service is running.
+
+    Returns:
+        HealthCheckResponse: Response model for the shallow health check. It only confirms that the process is serving requests.
+
+    Example:
+        health_check()
+        > HealthCheckResponse(status='ok', message='Hello World')
+    """
+    return SHALLOW_RESPONSE
+
+
+class DatabaseProbe:
+    """
+    Probes the database from a background task every `interval` seconds and keeps the rendered result, so
+    deep health checks never touch the database themselves no matter how often they are called.
+    """
+
+    def __init__(self, interval: float, timeout: float) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.status = DatabaseStatus(healthy=False, last_error="not probed yet")
+        self.body = self._render()
+        self._checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, client: "prisma.Prisma") -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(client))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def stale(self) -> bool:
+        # A probe loop that stopped reporting is as bad as a failing database.
+        return time.monotonic() - self._checked_at > 3 * self.interval + self.timeout
+
+    @property
+    def healthy(self) -> bool:
+        return self.status.healthy and not self.stale
+
+    async def probe(self, client: "prisma.Prisma") -> None:
+        """
+        Runs one probe and updates the cached status and body.
+        """
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        try:
+            await asyncio.wait_for(client.query_raw("SELECT 1 AS ok"), self.timeout)
+        except Exception as e:
+            self.status = DatabaseStatus(
+                healthy=False,
+                latency_ms=None,
+                last_success=self.status.last_success,
+                last_checked=now,
+                last_error=str(e) or type(e).__name__,
+                consecutive_failures=self.status.consecutive_failures + 1,
+            )
+            if self.status.consecutive_failures == 1:
+                logger.warning("Database health probe failed: %s", self.status.last_error)
+        else:
+            self.status = DatabaseStatus(
+                healthy=True,
+                latency_ms=round((time.perf_counter() - started) * 1000, 3),
+                last_success=now,
+                last_checked=now,
+            )
+        self._checked_at = time.monotonic()
+        self.body = self._render()
+
+    async def _run(self, client: "prisma.Prisma") -> None:
+        while True:
+            await self.probe(client)
+            await asyncio.sleep(self.interval)
+
+    def _render(self) -> bytes:
+        return (
+            DeepHealthCheckResponse(
+                status="ok" if self.status.healthy else "unavailable",
+                database=self.status,
+            )
+            .model_dump_json()
+            .encode("utf-8")
+        )
+
+
+database_probe = DatabaseProbe(
+    interval=project.settings.HEALTH_PROBE_INTERVAL_SECONDS,
+    timeout=project.settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+)
+
+
+def deep_health_check() -> DeepHealthCheckResponse:
+    """
+    Reports the result of the latest background database probe without probing inline.
+
+    Returns:
+        DeepHealthCheckResponse: Response model for the deep health check, reporting the cached database probe result.
+
+    Example:
+        deep_health_check()
+        > DeepHealthCheckResponse(status='ok', database=DatabaseStatus(healthy=True, latency_ms=0.8, ...))
+    """
+    return DeepHealthCheckResponse(
+        status="ok" if database_probe.healthy else "unavailable",
+        database=database_probe.status,
+    )
@@ -0,0 +1,288 @@
+"""
+Production launcher: binds the listening socket once and pre-forks uvicorn workers that share it.
+
+    python -m project.launcher --host 0.0.0.0 --port 8000
+    python -m project.launcher --workers 4 --app benchmarks.fake_server:app
+
+The worker count defaults to WEB_CONCURRENCY, or to the CPUs this process may use (affinity and cgroup quota).
+uvloop and httptools are used when installed. Workers are replaced when they exit; they exit on their own after
+WORKER_MAX_REQUESTS requests (with up to WORKER_MAX_REQUESTS_JITTER more, so they do not all recycle at once) or
+once their resident memory passes WORKER_MAX_MEMORY_MB. DB_CONNECTION_LIMIT is the budget for the whole
+service and is split between the workers. The bcrypt cost is resolved (calibrated if need be) before forking and
+passed to every worker as BCRYPT_ROUNDS.
+
+Signals: SIGTERM / SIGINT shut down gracefully, SIGHUP restarts the workers one at a time, each replacement
+serving before its predecessor is stopped.
+"""
+
+import argparse
+import importlib
+import importlib.util
+import logging
+import math
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import project.password_cost
+import project.settings
+
+logger = logging.getLogger(__name__)
+
+# The Prisma engine's own default pool size per process, used as the service budget when none is configured.
+_ENGINE_DEFAULT_CONNECTIONS = (os.cpu_count() or 1) * 2 + 1
+
+
+def available_cpus() -> int:
+    """
+    Counts the CPUs this process can actually use: its affinity mask, capped by a cgroup v2 CPU quota.
+
+    Example:
+        available_cpus()
+        > 4
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as file:
+            quota, period = file.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+def _fastest(candidates: List[str], fallback: str) -> str:
+    for module in candidates:
+        if importlib.util.find_spec(module) is not None:
+            return module
+    return fallback
+
+
+def connection_share(workers: int) -> int:
+    """
+    Returns each worker's share of the service-wide DB_CONNECTION_LIMIT (at least one connection). Without a
+    configured limit the engine default for a single process is split, so adding workers does not multiply
+    the connections held against the database.
+    """
+    budget = project.settings.DB_CONNECTION_LIMIT or _ENGINE_DEFAULT_CONNECTIONS
+    return max(1, budget // workers)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # Peak rather than current usage, in KiB on Linux; only reached off Linux.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _watch_memory(server: Any, limit_bytes: int, interval: float = 1.0) -> None:
+    while not server.should_exit:
+        if _rss_bytes() > limit_bytes:
+            logger.warning(
+                "Worker %d is over its %d MB memory ceiling, recycling",
+                os.getpid(),
+                limit_bytes // (1024 * 1024),
+            )
+            server.should_exit = True
+            return
+        time.sleep(interval)
+
+
+def _serve(
+    options: Dict[str, Any], sock: socket.socket, env: Dict[str, str], ready: Any
+) -> None:
+    # Runs in the forked worker. The settings are read again after the environment is updated, so the app
+    # sees its share of the connection budget.
+    os.environ.update(env)
+    importlib.reload(project.settings)
+    import uvicorn
+
+    # SIGHUP is meant for the supervisor; uvicorn installs its own SIGTERM / SIGINT handlers.
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    max_requests = options["max_requests"]
+    if max_requests:
+        max_requests += random.randint(0, options["max_requests_jitter"])
+    config = uvicorn.Config(
+        options["app"],
+        loop=options["loop"],
+        http=options["http"],
+        log_level=options["log_level"],
+        limit_max_requests=max_requests or None,
+        timeout_graceful_shutdown=options["graceful_timeout"],
+    )
+    server = uvicorn.Server(config)
+    if options["max_memory_mb"]:
+        threading.Thread(
+            target=_watch_memory,
+            args=(server, options["max_memory_mb"] * 1024 * 1024),
+            daemon=True,
+        ).start()
+
+    def signal_ready() -> None:
+        while not server.started and not server.should_exit:
+            time.sleep(0.05)
+        ready.set()
+
+    threading.Thread(target=signal_ready, daemon=True).start()
+    server.run(sockets=[sock])
+
+
+class Supervisor:
+    """
+    Keeps `workers` worker processes serving `sock`, replacing any that exit, and performs rolling restarts.
+    """
+
+    def __init__(
+        self, options: Dict[str, Any], sock: socket.socket, workers: int, bcrypt_rounds: int
+    ) -> None:
+        self.options = options
+        self.sock = sock
+        self.workers = workers
+        self.context = multiprocessing.get_context("fork")
+        self.processes: List[multiprocessing.process.BaseProcess] = []
+        self.env = {
+            "DB_CONNECTION_LIMIT": str(connection_share(workers)),
+            "DB_WARMUP_CONNECTIONS": str(
+                min(project.settings.DB_WARMUP_CONNECTIONS, connection_share(workers))
+            ),
+            # Resolved once here, so the workers neither calibrate at the same time nor disagree on the cost.
+            "BCRYPT_ROUNDS": str(bcrypt_rounds),
+        }
+        self.stopping = False
+        self.restart_requested = False
+
+    def spawn(self) -> Optional[multiprocessing.process.BaseProcess]:
+        """
+        Starts a worker and waits until it serves requests; returns None if it died during startup.
+        """
+        ready = self.context.Event()
+        process = self.context.Process(
+            target=_serve,
+            args=(self.options, self.sock, self.env, ready),
+            daemon=False,
+        )
+        process.start()
+        while not ready.wait(0.1):
+            if not process.is_alive():
+                logger.error("Worker %s exited during startup (code %s)", process.pid, process.exitcode)
+                return None
+        self.processes.append(process)
+        return process
+
+    def stop(self, process: multiprocessing.process.BaseProcess) -> None:
+        if process.is_alive():
+            os.kill(process.pid, signal.SIGTERM)
+        process.join(self.options["graceful_timeout"] + 5)
+        if process.is_alive():
+            logger.warning("Worker %s did not stop in time, killing it", process.pid)
+            process.kill()
+            process.join()
+        if process in self.processes:
+            self.processes.remove(process)
+
+    def rolling_restart(self) -> None:
+        logger.info("Rolling restart of %d workers", len(self.processes))
+        for old in list(self.processes):
+            if self.stopping:
+                return
+            if self.spawn() is None:
+                logger.error("Aborting rolling restart: a replacement worker failed to start")
+                return
+            self.stop(old)
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_restart)
+        logger.info(
+            "Starting %d workers (loop=%s, http=%s, %s database connections each)",
+            self.workers,
+            self.options["loop"],
+            self.options["http"],
+            self.env["DB_CONNECTION_LIMIT"],
+        )
+        failures = 0
+        while not self.stopping:
+            if self.restart_requested:
+                self.restart_requested = False
+                self.rolling_restart()
+            for process in list(self.processes):
+                if not process.is_alive():
+                    process.join()
+                    self.processes.remove(process)
+                    logger.info("Worker %s exited (code %s), replacing it", process.pid, process.exitcode)
+            while len(self.processes) < self.workers and not self.stopping:
+                if self.spawn() is None:
+                    failures += 1
+                    # Back off instead of fork-looping on a worker that cannot start (e.g. a bad deploy).
+                    time.sleep(min(30.0, 0.5 * 2 ** min(failures, 6)))
+                    break
+                failures = 0
+            time.sleep(0.2)
+        for process in list(self.processes):
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+        for process in list(self.processes):
+            self.stop(process)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        self.stopping = True
+
+    def _handle_restart(self, signum: int, frame: Any) -> None:
+        self.restart_requested = True
+
+
+def bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--app", default="project.server:app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=project.settings.WEB_CONCURRENCY)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s %(message)s"
+    )
+
+    options = {
+        "app": args.app,
+        "loop": _fastest(["uvloop"], "asyncio"),
+        "http": _fastest(["httptools"], "h11"),
+        "log_level": args.log_level,
+        "max_requests": project.settings.WORKER_MAX_REQUESTS,
+        "max_requests_jitter": project.settings.WORKER_MAX_REQUESTS_JITTER,
+        "max_memory_mb": project.settings.WORKER_MAX_MEMORY_MB,
+        "graceful_timeout": project.settings.WORKER_GRACEFUL_TIMEOUT_SECONDS,
+    }
+    bcrypt_rounds = project.password_cost.resolve_rounds()
+    sock = bind(args.host, args.port)
+    Supervisor(options, sock, args.workers or available_cpus(), bcrypt_rounds).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import asyncio
+import importlib
+import logging
+import time
+from types import ModuleType
+from typing import Dict, Optional
+
+import project.errors
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+class RouteLoader:
+    """
+    Loads the module that defines the API routes (and, through its imports, the service modules, prisma, jwt
+    and bcrypt), includes its `router` into the app and runs its `startup()` hook, at most once.
+
+    With eager loading `include()` is called at import time and `load()` from the lifespan. With lazy loading
+    the app starts serving without the routes module; `start_background()` loads it right after the port
+    opens, and `LazyRoutesMiddleware` makes the first request that needs a route wait for it.
+    """
+
+    def __init__(self, app: FastAPI, module_name: str) -> None:
+        self.app = app
+        self.module_name = module_name
+        self.module: Optional[ModuleType] = None
+        self.ready = False
+        self.import_seconds = 0.0
+        self.startup_seconds = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def _include(self, module: ModuleType) -> ModuleType:
+        if self.module is None:
+            self.app.include_router(module.router)
+            self.module = module
+        return self.module
+
+    def include(self) -> ModuleType:
+        """
+        Imports the routes module and includes its router, blocking the caller.
+        """
+        if self.module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self.module_name)
+            self.import_seconds = time.perf_counter() - started
+            self._include(module)
+        return self.module
+
+    async def _load(self) -> None:
+        if self.module is None:
+            started = time.perf_counter()
+            # Importing in a thread keeps the event loop (and the fast lane) responsive meanwhile.
+            module = await asyncio.to_thread(importlib.import_module, self.module_name)
+            self.import_seconds = time.perf_counter() - started
+            self._include(module)
+        started = time.perf_counter()
+        await self.module.startup()
+        self.startup_seconds = time.perf_counter() - started
+        self.ready = True
+        logger.info(
+            "Loaded %s (import %.3fs, startup %.3fs)",
+            self.module_name,
+            self.import_seconds,
+            self.startup_seconds,
+        )
+
+    def _ensure_task(self) -> asyncio.Task:
+        # A failed or cancelled attempt is retried by the next caller.
+        if self._task is None or (self._task.done() and not self.ready):
+            self._task = asyncio.get_running_loop().create_task(self._load())
+        return self._task
+
+    async def load(self) -> None:
+        """
+        Loads the routes and runs their startup hook, or waits for a load already in progress.
+        """
+        if not self.ready:
+            await asyncio.shield(self._ensure_task())
+
+    def start_background(self) -> None:
+        """
+        Starts loading the routes without waiting for it; failures are logged and retried on the next request.
+        """
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    "Background loading of %s failed",
+                    self.module_name,
+                    exc_info=task.exception(),
+                )
+
+        self._ensure_task().add_done_callback(log_failure)
+
+    async def close(self) -> None:
+        task = self._task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self.ready:
+            self.ready = False
+            await self.module.shutdown()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "ready": int(self.ready),
+            "import_seconds": self.import_seconds,
+            "startup_seconds": self.startup_seconds,
+        }
+
+
+class LazyRoutesMiddleware:
+    """
+    Holds HTTP requests until `loader` has loaded the routes, triggering the load if nothing has yet. Requests
+    answered by middleware further out (the fast lane) never reach it. If loading fails the request gets a 503
+    and the next one retries.
+    """
+
+    def __init__(self, app, loader: RouteLoader) -> None:
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "lifespan" and not self.loader.ready:
+            try:
+                await self.loader.load()
+            except Exception as e:
+                project.errors.reporter.report(e, "Loading routes failed")
+                response = project.errors.error_response(e, 503, {"Retry-After": "1"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -1,12 +1,15 @@
+import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
-import bcrypt
 import jwt
 import prisma
 import prisma.models
+import project.password_hashing
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 
 class LoginResponseModel(BaseModel):
     """
@@ -25,7 +28,8 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a plain password against its hashed version.
+    Verify a plain password against its hashed version. The bcrypt check runs on the bounded password pool,
+    so it never blocks the event loop.
 
     Args:
         plain_password (str): The plain text password.
@@ -40,9 +44,7 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
         verify_password(plain_password, hashed_password)
         > True
     """
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-    )
+    return await project.password_hashing.check_password(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -71,9 +73,28 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+async def rehash_password(user_id: int, password: str) -> None:
+    """
+    Replaces a user's stored hash with one at the current bcrypt cost, after a successful login proved the
+    password. Failures are logged and otherwise ignored: the old hash still works, and the next login retries.
+
+    Args:
+        user_id (int): The user whose hash is outdated.
+        password (str): The plain text password the user just logged in with.
+    """
+    try:
+        hashed_password = await project.password_hashing.hash_password(password)
+        await prisma.models.User.prisma().update(
+            where={"id": user_id}, data={"password": hashed_password}
+        )
+    except Exception as e:
+        logger.warning("Could not rehash the password of user %s: %s", user_id, e)
+
+
 async def login_user(username: str, password: str) -> LoginResponseModel:
     """
     Authenticates a user. Expects a username and password, returns a JWT token upon successful authentication.
+    A stored hash with an outdated bcrypt cost (or a password stored before hashing) is replaced on the way.
 
     Args:
         username (str): The username of the user attempting to log in.
@@ -93,6 +114,8 @@ async def login_user(username: str, password: str) -> LoginResponseModel:
         raise ValueError("Invalid username or password")
     if not await verify_password(password, user.password):
         raise ValueError("Invalid username or password")
+    if project.password_hashing.needs_rehash(user.password):
+        await rehash_password(user.id, password)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.email}, expires_delta=access_token_expires
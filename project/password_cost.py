@@ -0,0 +1,193 @@
+"""
+Calibrates the bcrypt cost factor to this machine: the highest cost whose hash still fits in the latency budget
+(BCRYPT_TARGET_MS), never below BCRYPT_MIN_ROUNDS. The result is written to BCRYPT_COST_FILE, which the app
+loads at startup (project.launcher resolves it once, before forking its workers); password hashes with a lower
+cost are upgraded on the user's next successful login.
+
+    python -m project.password_cost
+    python -m project.password_cost --target-ms 400 --output /app/bcrypt_cost.json
+"""
+
+import argparse
+import fcntl
+import json
+import logging
+import os
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import bcrypt
+import project.password_hashing
+import project.settings
+
+logger = logging.getLogger(__name__)
+
+# bcrypt accepts costs 4 to 31; each step doubles the work.
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 20
+
+
+def _hash_seconds(rounds: int, samples: int) -> float:
+    timings = []
+    salt = bcrypt.gensalt(rounds=rounds)
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, min_rounds: int, samples: int = 3) -> Dict[str, Any]:
+    """
+    Times bcrypt at increasing costs and picks the highest one whose median hash time is within `target_ms`.
+
+    Args:
+        target_ms (float): The latency budget for one hash, in milliseconds.
+        min_rounds (int): The lowest cost accepted, even if it exceeds the budget on this machine.
+        samples (int): Hashes timed per cost.
+
+    Returns:
+        Dict[str, Any]: The chosen `rounds`, its measured `hash_ms` and the inputs, ready to be saved.
+
+    Example:
+        calibrate(250, 10)
+        > {'rounds': 12, 'hash_ms': 211.7, 'target_ms': 250, 'min_rounds': 10, ...}
+    """
+    rounds, hash_ms = MIN_BCRYPT_ROUNDS, _hash_seconds(MIN_BCRYPT_ROUNDS, samples) * 1000
+    # Each step doubles the work, so a cost already predicted well over the budget is not worth timing.
+    while rounds < MAX_BCRYPT_ROUNDS:
+        next_ms = hash_ms * 2
+        if rounds + 1 > min_rounds and next_ms > target_ms * 1.5:
+            break
+        measured = _hash_seconds(rounds + 1, samples) * 1000
+        if rounds + 1 > min_rounds and measured > target_ms:
+            break
+        rounds, hash_ms = rounds + 1, measured
+    return {
+        "rounds": rounds,
+        "hash_ms": round(hash_ms, 1),
+        "target_ms": target_ms,
+        "min_rounds": min_rounds,
+        "host": platform.node(),
+        "calibrated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def load(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Reads a saved calibration, or returns None if there is none (or it is unreadable).
+    """
+    try:
+        with open(path) as file:
+            result = json.load(file)
+        int(result["rounds"])
+        return result
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("Ignoring unreadable bcrypt calibration %s: %s", path, e)
+        return None
+
+
+def save(path: str, result: Dict[str, Any]) -> None:
+    """
+    Writes a calibration atomically, so concurrent workers never read a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".tmp") as file:
+        json.dump(result, file, indent=2)
+    os.replace(file.name, path)
+
+
+def calibrate_once(path: str, target_ms: float, min_rounds: int) -> Dict[str, Any]:
+    """
+    Returns the calibration saved at `path`, calibrating and saving it first if there is none. Processes that
+    start together take turns on a lock next to the file, so only the first one calibrates and the others load
+    its result instead of competing for the CPU and overwriting each other's file.
+    """
+    try:
+        lock = open(f"{path}.lock", "a")
+    except OSError as e:
+        logger.warning("Could not lock bcrypt calibration %s: %s", path, e)
+        return calibrate(target_ms, min_rounds)
+    with lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        result = load(path)
+        if result is None:
+            result = calibrate(target_ms, min_rounds)
+            try:
+                save(path, result)
+            except OSError as e:
+                logger.warning("Could not save bcrypt calibration to %s: %s", path, e)
+        return result
+
+
+def resolve_rounds() -> int:
+    """
+    Returns the cost to hash new passwords with: BCRYPT_ROUNDS if set, otherwise the saved calibration,
+    otherwise (with BCRYPT_CALIBRATE_AT_STARTUP) a fresh calibration saved for the next start.
+
+    Example:
+        resolve_rounds()
+        > 12
+    """
+    settings = project.settings
+    if settings.BCRYPT_ROUNDS:
+        return settings.BCRYPT_ROUNDS
+    result = load(settings.BCRYPT_COST_FILE)
+    if result is None and settings.BCRYPT_CALIBRATE_AT_STARTUP:
+        result = calibrate_once(
+            settings.BCRYPT_COST_FILE, settings.BCRYPT_TARGET_MS, settings.BCRYPT_MIN_ROUNDS
+        )
+    if result is None:
+        return project.password_hashing.DEFAULT_ROUNDS
+    return max(int(result["rounds"]), settings.BCRYPT_MIN_ROUNDS)
+
+
+async def configure() -> int:
+    """
+    Sets the cost used for new password hashes at startup, as chosen by `resolve_rounds()`. Under
+    project.launcher it is resolved once before the workers are forked and passed to them as BCRYPT_ROUNDS.
+
+    Returns:
+        int: The cost factor in use.
+    """
+    if project.settings.BCRYPT_ROUNDS:
+        rounds = project.settings.BCRYPT_ROUNDS
+    else:
+        # Reading, or at worst calibrating, blocks; the password pool keeps it off the event loop.
+        rounds = await project.password_hashing.get_pool().run(resolve_rounds)
+    project.password_hashing.set_rounds(rounds)
+    logger.info("Hashing new passwords with bcrypt cost %d", rounds)
+    return rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=project.settings.BCRYPT_TARGET_MS, help="latency budget per hash"
+    )
+    parser.add_argument("--min-rounds", type=int, default=project.settings.BCRYPT_MIN_ROUNDS)
+    parser.add_argument("--samples", type=int, default=3, help="hashes timed per cost")
+    parser.add_argument("--output", default=project.settings.BCRYPT_COST_FILE)
+    parser.add_argument("--dry-run", action="store_true", help="print the result without saving it")
+    args = parser.parse_args()
+
+    result = calibrate(args.target_ms, args.min_rounds, args.samples)
+    print(
+        f"bcrypt cost {result['rounds']}: {result['hash_ms']:.1f} ms per hash "
+        f"(budget {args.target_ms:.0f} ms, minimum cost {args.min_rounds})"
+    )
+    if not args.dry_run:
+        save(args.output, result)
+        print(f"saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
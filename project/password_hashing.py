@@ -0,0 +1,245 @@
+import asyncio
+import hmac
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import bcrypt
+import project.settings
+
+T = TypeVar("T")
+
+# Cost for new hashes until project.password_cost configures the calibrated one at startup.
+DEFAULT_ROUNDS = 12
+
+_rounds = DEFAULT_ROUNDS
+
+_BCRYPT_HASH = re.compile(r"^\$2[abxy]?\$(\d{2})\$[./A-Za-z0-9]{53}$")
+
+
+class PoolSaturatedError(Exception):
+    """
+    Raised when the password pool already holds as many jobs as its workers and queue allow.
+    """
+
+    pass
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> Tuple[float, T]:
+    # time.monotonic() is CLOCK_MONOTONIC, which is shared across processes on Linux, so the start
+    # timestamp is comparable with the submit timestamp even when running in a process pool.
+    started = time.monotonic()
+    return started, fn(*args)
+
+
+def _checkpw(plain_password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(plain_password, hashed_password)
+
+
+def _hashpw(plain_password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(plain_password, bcrypt.gensalt(rounds=rounds))
+
+
+class PasswordWorkerPool:
+    """
+    A bounded pool for CPU-heavy password work. At most `workers` jobs run at once and at most `max_queue`
+    more wait for a worker; anything beyond that is rejected immediately with PoolSaturatedError instead of
+    piling up behind a login burst.
+    """
+
+    def __init__(self, workers: int, max_queue: int, kind: str = "thread") -> None:
+        if kind == "process":
+            self._executor: Executor = ProcessPoolExecutor(max_workers=workers)
+        elif kind == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password"
+            )
+        else:
+            raise ValueError(f"Unknown password pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Runs `fn(*args)` on the pool without blocking the event loop.
+
+        Args:
+            fn (Callable[..., T]): The function to run; must be picklable for a process pool.
+            *args (Any): Positional arguments for `fn`.
+
+        Returns:
+            T: The function's result.
+
+        Raises:
+            PoolSaturatedError: If every worker is busy and the queue is full.
+        """
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PoolSaturatedError("Password pool is saturated, try again later")
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        submitted = time.monotonic()
+        try:
+            job = self._executor.submit(_timed_call, fn, *args)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        # The slot is released when the job itself finishes, not when the caller stops waiting: a cancelled
+        # caller leaves its bcrypt job running, and it must keep counting against the bound until it is done.
+        job.add_done_callback(lambda _: self._release_soon(loop))
+        started, result = await asyncio.wrap_future(job, loop=loop)
+        wait = max(0.0, started - submitted)
+        self.completed += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        return result
+
+    def _release_soon(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Done callbacks run on the executor's threads; the counter belongs to the event loop.
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # The loop is already closed, so nothing is left to admit.
+            pass
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the pool's current metrics.
+
+        Example:
+            get_pool().stats()
+            > {'workers': 4, 'max_queue': 64, 'in_flight': 0, 'queue_depth': 0, 'completed': 12, ...}
+        """
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+            "wait_seconds_avg": (
+                self.wait_seconds_total / self.completed if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[PasswordWorkerPool] = None
+
+
+def get_pool() -> PasswordWorkerPool:
+    """
+    Returns the process-wide password pool, creating it from the PASSWORD_POOL_* settings on first use.
+    """
+    global _pool
+    if _pool is None:
+        _pool = PasswordWorkerPool(
+            workers=project.settings.PASSWORD_POOL_WORKERS,
+            max_queue=project.settings.PASSWORD_POOL_MAX_QUEUE,
+            kind=project.settings.PASSWORD_POOL_KIND,
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def get_rounds() -> int:
+    return _rounds
+
+
+def set_rounds(rounds: int) -> None:
+    global _rounds
+    _rounds = rounds
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """
+    Returns the cost factor of a bcrypt hash, or None if the value is not a bcrypt hash.
+
+    Example:
+        hash_rounds('$2b$12$EIXIzK9E9Lp5b/r9Q5K9De5GQsL9uZw4qe1kDkNOEeD9OH/xOoG8T')
+        > 12
+    """
+    match = _BCRYPT_HASH.match(hashed_password)
+    return int(match.group(1)) if match else None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Whether a stored password should be hashed again with the current cost: it was hashed with a lower cost,
+    or it predates hashing altogether. Hashes are never rewritten to a lower cost, so processes configured with
+    different costs (replicas calibrated on different machines) cannot rewrite one user's hash back and forth.
+    """
+    rounds = hash_rounds(hashed_password)
+    return rounds is None or rounds < _rounds
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a plain password against a bcrypt hash on the password pool. Accounts registered before passwords
+    were hashed still hold the plain password, which is compared in constant time; `needs_rehash` flags them
+    so that the login replaces it with a hash.
+
+    Args:
+        plain_password (str): The plain text password.
+        hashed_password (str): The bcrypt hash.
+
+    Returns:
+        bool: True if the password matches, False otherwise.
+
+    Example:
+        await check_password('secret', '$2b$12$EIXIzK9E9Lp5b/r9Q5K9De5GQsL9uZw4qe1kDkNOEeD9OH/xOoG8T')
+        > True
+    """
+    if hash_rounds(hashed_password) is None:
+        return hmac.compare_digest(
+            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+    return await get_pool().run(
+        _checkpw, plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
+
+async def hash_password(plain_password: str, rounds: Optional[int] = None) -> str:
+    """
+    Hashes a password with bcrypt on the password pool.
+
+    Args:
+        plain_password (str): The plain text password.
+        rounds (Optional[int]): The bcrypt cost factor; defaults to the calibrated cost.
+
+    Returns:
+        str: The bcrypt hash.
+
+    Example:
+        await hash_password('secret')
+        > '$2b$12$...'
+    """
+    hashed = await get_pool().run(
+        _hashpw, plain_password.encode("utf-8"), rounds or _rounds
+    )
+    return hashed.decode("utf-8")
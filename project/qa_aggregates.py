@@ -0,0 +1,233 @@
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import prisma
+import prisma.models
+import project.settings
+
+logger = logging.getLogger(__name__)
+
+
+# A change to one count: the attribute, the key for the per-id counts (None for the totals) and the delta (None
+# drops the key).
+Change = Tuple[str, Optional[int], Optional[int]]
+
+
+class QAAggregates:
+    """
+    Denormalized Q&A counts kept in memory: totals of users, questions and answers, answers per question, and
+    questions and answers per user. Every lookup is a dict access, whatever the table sizes.
+
+    `rebuild()` loads the counts with grouped COUNT queries at startup; the services that create or delete
+    users, questions and answers then apply their deltas. Writes made by other workers or replicas (or directly
+    in the database) are only picked up by a rebuild, which `refresh_if_stale()` schedules in the background
+    once the counts are older than `refresh_seconds` (0 disables refreshing), so every worker converges on the
+    database's counts within that interval. `verify()` recomputes the counts from the database and reports, and
+    optionally repairs, any drift in the worker that serves it.
+    """
+
+    def __init__(self, refresh_seconds: float = 0.0) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.built_at: Optional[float] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        # One log per load in flight: the changes applied here while it reads the database, replayed onto the
+        # loaded counts before they are used.
+        self._loads: List[List[Change]] = []
+        self.users = 0
+        self.questions = 0
+        self.answers = 0
+        self.answers_per_question: Dict[int, int] = {}
+        self.questions_per_user: Dict[int, int] = {}
+        self.answers_per_user: Dict[int, int] = {}
+        self.rebuilds = 0
+
+    @staticmethod
+    def _add(counts: Dict[int, int], key: int, delta: int) -> None:
+        value = counts.get(key, 0) + delta
+        if value > 0:
+            counts[key] = value
+        else:
+            counts.pop(key, None)
+
+    def _apply(self, name: str, key: Optional[int], delta: Optional[int]) -> None:
+        if key is None:
+            setattr(self, name, getattr(self, name) + delta)
+        elif delta is None:
+            getattr(self, name).pop(key, None)
+        else:
+            self._add(getattr(self, name), key, delta)
+
+    def _change(self, *changes: Change) -> None:
+        for change in changes:
+            self._apply(*change)
+        for log in self._loads:
+            log.extend(changes)
+
+    def user_created(self) -> None:
+        self._change(("users", None, 1))
+
+    def user_deleted(self, user_id: int) -> None:
+        self._change(
+            ("users", None, -1),
+            ("questions_per_user", user_id, None),
+            ("answers_per_user", user_id, None),
+        )
+
+    def question_created(self, author_id: int) -> None:
+        self._change(("questions", None, 1), ("questions_per_user", author_id, 1))
+
+    def question_deleted(
+        self, question_id: int, author_id: int, answers_by_author: Dict[int, int]
+    ) -> None:
+        """
+        Records the deletion of a question together with its answers, given as answer counts per author.
+        """
+        changes: List[Change] = [
+            ("questions", None, -1),
+            ("questions_per_user", author_id, -1),
+            ("answers_per_question", question_id, None),
+        ]
+        for answer_author_id, count in answers_by_author.items():
+            changes.append(("answers", None, -count))
+            changes.append(("answers_per_user", answer_author_id, -count))
+        self._change(*changes)
+
+    def answer_created(self, question_id: int, author_id: int) -> None:
+        self._change(
+            ("answers", None, 1),
+            ("answers_per_question", question_id, 1),
+            ("answers_per_user", author_id, 1),
+        )
+
+    def answer_deleted(self, question_id: int, author_id: int) -> None:
+        self._change(
+            ("answers", None, -1),
+            ("answers_per_question", question_id, -1),
+            ("answers_per_user", author_id, -1),
+        )
+
+    async def _load(self) -> "QAAggregates":
+        """
+        Reads every count from the database, then replays onto each the changes applied here after its query
+        started, so that writes finishing during the load are neither lost nor counted twice. Only a write that
+        commits before a query starts but is applied here after it (the moment between a service's write and
+        its call to this class) can still be counted twice.
+        """
+        log: List[Change] = []
+        started: Dict[str, int] = {}
+        loaded = QAAggregates()
+        self._loads.append(log)
+        try:
+            for name, model in (
+                ("users", prisma.models.User),
+                ("questions", prisma.models.Question),
+                ("answers", prisma.models.Answer),
+            ):
+                started[name] = len(log)
+                setattr(loaded, name, await model.prisma().count())
+            for name, model, field in (
+                ("questions_per_user", prisma.models.Question, "authorId"),
+                ("answers_per_question", prisma.models.Answer, "questionId"),
+                ("answers_per_user", prisma.models.Answer, "authorId"),
+            ):
+                started[name] = len(log)
+                counts = getattr(loaded, name)
+                for row in await model.prisma().group_by(by=[field], count=True):
+                    counts[row[field]] = row["_count"]["_all"]
+        finally:
+            self._loads = [other for other in self._loads if other is not log]
+        for index, change in enumerate(log):
+            if index >= started[change[0]]:
+                loaded._apply(*change)
+        return loaded
+
+    def _assign(self, other: "QAAggregates") -> None:
+        self.users = other.users
+        self.questions = other.questions
+        self.answers = other.answers
+        self.answers_per_question = other.answers_per_question
+        self.questions_per_user = other.questions_per_user
+        self.answers_per_user = other.answers_per_user
+
+    async def rebuild(self) -> None:
+        """
+        Recomputes every count from the database. Writes applied while it loads are replayed onto the loaded
+        counts, so it can run while requests are served.
+        """
+        self._assign(await self._load())
+        self.built_at = time.monotonic()
+        self.rebuilds += 1
+
+    def refresh_if_stale(self) -> None:
+        """
+        Schedules a background rebuild once the counts are older than `refresh_seconds`; reads keep being served
+        from the current counts meanwhile.
+        """
+        if (
+            self.refresh_seconds <= 0
+            or self.built_at is None
+            or time.monotonic() - self.built_at <= self.refresh_seconds
+            or (self._rebuild_task is not None and not self._rebuild_task.done())
+        ):
+            return
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error("Rebuilding the Q&A aggregates failed", exc_info=task.exception())
+
+        # In a fresh context, so the rebuild's queries are not charged to the request that triggered it.
+        self._rebuild_task = asyncio.get_running_loop().create_task(
+            self.rebuild(), context=contextvars.Context()
+        )
+        self._rebuild_task.add_done_callback(log_failure)
+
+    async def verify(self, repair: bool = False) -> List[str]:
+        """
+        Compares the in-memory counts with the database.
+
+        Args:
+            repair (bool): Replace the in-memory counts with the database's when they differ.
+
+        Returns:
+            List[str]: One description per differing count; empty when everything matches.
+
+        Example:
+            await get_aggregates().verify()
+            > ['answers_per_question[12]: memory 4, database 5']
+        """
+        actual = await self._load()
+        mismatches = []
+        for name in ("users", "questions", "answers"):
+            if getattr(self, name) != getattr(actual, name):
+                mismatches.append(
+                    f"{name}: memory {getattr(self, name)}, database {getattr(actual, name)}"
+                )
+        for name in ("answers_per_question", "questions_per_user", "answers_per_user"):
+            mine, theirs = getattr(self, name), getattr(actual, name)
+            for key in sorted(set(mine) | set(theirs)):
+                if mine.get(key, 0) != theirs.get(key, 0):
+                    mismatches.append(
+                        f"{name}[{key}]: memory {mine.get(key, 0)}, database {theirs.get(key, 0)}"
+                    )
+        if mismatches and repair:
+            self._assign(actual)
+            self.built_at = time.monotonic()
+        return mismatches
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "users": self.users,
+            "questions": self.questions,
+            "answers": self.answers,
+            "rebuilds": self.rebuilds,
+        }
+
+
+_aggregates = QAAggregates(project.settings.QA_AGGREGATES_REFRESH_SECONDS)
+
+
+def get_aggregates() -> QAAggregates:
+    return _aggregates
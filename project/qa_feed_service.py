@@ -0,0 +1,220 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import prisma
+import prisma.models
+import project.dataloader
+import project.register_user_service
+from pydantic import BaseModel
+
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a `cursor` is not one this service handed out.
+    """
+
+
+class Author(BaseModel):
+    """
+    The public part of a question's or answer's author.
+    """
+
+    id: int
+    email: str
+
+
+class FeedQuestion(project.register_user_service.Question):
+    """
+    A question in the feed, with its author.
+    """
+
+    author: Optional[Author] = None
+
+
+class FeedAnswer(project.register_user_service.Answer):
+    """
+    An answer to a question, with its author.
+    """
+
+    questionId: int
+    author: Optional[Author] = None
+
+
+class QuestionFeedResponse(BaseModel):
+    """
+    One page of questions, newest first. Pass `next_cursor` back as `cursor` to get the next page.
+    """
+
+    questions: List[FeedQuestion]
+    next_cursor: Optional[str] = None
+
+
+class AnswerFeedResponse(BaseModel):
+    """
+    One page of the answers to a question, oldest first. Pass `next_cursor` back as `cursor` to get the next page.
+    """
+
+    answers: List[FeedAnswer]
+    next_cursor: Optional[str] = None
+
+
+async def _load_authors(ids: List[int]) -> Dict[int, Author]:
+    users = await prisma.models.User.prisma().find_many(where={"id": {"in": ids}})
+    return {user.id: Author(id=user.id, email=user.email) for user in users}
+
+
+class FeedLoaders:
+    """
+    The batching loaders for one request. Used as a FastAPI dependency, so each request gets fresh ones and
+    every author referenced while building its response is fetched in a single query.
+    """
+
+    def __init__(self) -> None:
+        self.authors: project.dataloader.DataLoader[int, Author] = (
+            project.dataloader.DataLoader(_load_authors)
+        )
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """
+    An opaque cursor for the keyset position (createdAt, id).
+
+    Example:
+        encode_cursor(datetime(2024, 5, 26, 18, 56, 48, tzinfo=timezone.utc), 42)
+        > 'MjAyNC0wNS0yNlQxODo1Njo0OCswMDowMHw0Mg'
+    """
+    raw = f"{created_at.isoformat()}|{id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError("Invalid cursor")
+
+
+def _after(cursor: Optional[str], descending: bool) -> Dict[str, Any]:
+    """
+    The `where` clause selecting rows strictly past `cursor` in (createdAt, id) order. With an index on
+    (createdAt, id) the database seeks straight to that position, so deep pages cost the same as the first.
+    """
+    if cursor is None:
+        return {}
+    created_at, id = decode_cursor(cursor)
+    op = "lt" if descending else "gt"
+    return {
+        "OR": [
+            {"createdAt": {op: created_at}},
+            {"createdAt": created_at, "id": {op: id}},
+        ]
+    }
+
+
+async def list_questions(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    loaders: Optional[FeedLoaders] = None,
+) -> QuestionFeedResponse:
+    """
+    Lists questions newest first with keyset pagination on (createdAt, id). A page costs two queries whatever
+    its size: one for the questions and one batched lookup of their authors.
+
+    Args:
+        limit (int): The maximum number of questions to return, capped at MAX_PAGE_SIZE.
+        cursor (Optional[str]): The `next_cursor` of the previous page; omit it for the first page.
+        loaders (Optional[FeedLoaders]): The request's loaders; fresh ones are created if omitted.
+
+    Returns:
+        QuestionFeedResponse: The page, with `next_cursor` set when more questions follow.
+
+    Example:
+        page = await list_questions(limit=2)
+        > QuestionFeedResponse(questions=[FeedQuestion(id=200, ..., author=Author(id=1, email='...')), ...],
+        >                      next_cursor='MjAy...')
+        await list_questions(limit=2, cursor=page.next_cursor)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    loaders = loaders or FeedLoaders()
+    rows = await prisma.models.Question.prisma().find_many(
+        where=_after(cursor, descending=True),
+        order=[{"createdAt": "desc"}, {"id": "desc"}],
+        take=limit + 1,
+    )
+    page = rows[:limit]
+    authors = await loaders.authors.load_many([row.authorId for row in page])
+    questions = [
+        FeedQuestion(
+            id=row.id,
+            title=row.title,
+            content=row.content,
+            createdAt=row.createdAt,
+            updatedAt=row.updatedAt,
+            author=author,
+        )
+        for row, author in zip(page, authors)
+    ]
+    return QuestionFeedResponse(
+        questions=questions,
+        next_cursor=(
+            encode_cursor(page[-1].createdAt, page[-1].id) if len(rows) > limit else None
+        ),
+    )
+
+
+async def list_answers(
+    questionId: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    loaders: Optional[FeedLoaders] = None,
+) -> AnswerFeedResponse:
+    """
+    Lists the answers to a question oldest first with keyset pagination on (createdAt, id). A page costs two
+    queries whatever its size: one for the answers and one batched lookup of their authors.
+
+    Args:
+        questionId (int): The question whose answers to list.
+        limit (int): The maximum number of answers to return, capped at MAX_PAGE_SIZE.
+        cursor (Optional[str]): The `next_cursor` of the previous page; omit it for the first page.
+        loaders (Optional[FeedLoaders]): The request's loaders; fresh ones are created if omitted.
+
+    Returns:
+        AnswerFeedResponse: The page, with `next_cursor` set when more answers follow.
+
+    Example:
+        await list_answers(1, limit=20)
+        > AnswerFeedResponse(answers=[FeedAnswer(id=1, questionId=1, ..., author=Author(...)), ...],
+        >                    next_cursor=None)
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    loaders = loaders or FeedLoaders()
+    rows = await prisma.models.Answer.prisma().find_many(
+        where={"questionId": questionId, **_after(cursor, descending=False)},
+        order=[{"createdAt": "asc"}, {"id": "asc"}],
+        take=limit + 1,
+    )
+    page = rows[:limit]
+    authors = await loaders.authors.load_many([row.authorId for row in page])
+    answers = [
+        FeedAnswer(
+            id=row.id,
+            content=row.content,
+            createdAt=row.createdAt,
+            updatedAt=row.updatedAt,
+            questionId=row.questionId,
+            author=author,
+        )
+        for row, author in zip(page, authors)
+    ]
+    return AnswerFeedResponse(
+        answers=answers,
+        next_cursor=(
+            encode_cursor(page[-1].createdAt, page[-1].id) if len(rows) > limit else None
+        ),
+    )
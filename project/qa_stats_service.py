@@ -0,0 +1,136 @@
+from typing import List
+
+import prisma
+import prisma.enums
+import prisma.models
+import project.auth
+import project.qa_aggregates
+from pydantic import BaseModel
+
+
+class QAStatsResponse(BaseModel):
+    """
+    Site-wide totals of users, questions and answers.
+    """
+
+    users: int
+    questions: int
+    answers: int
+
+
+class QuestionStatsResponse(BaseModel):
+    """
+    The number of answers a question has received.
+    """
+
+    questionId: int
+    answers: int
+
+
+class UserStatsResponse(BaseModel):
+    """
+    The number of questions and answers a user has posted.
+    """
+
+    userId: int
+    questions: int
+    answers: int
+
+
+class VerifyAggregatesRequest(BaseModel):
+    """
+    Request model for checking the in-memory aggregates against the database. Requires an Admin's JWT token.
+    """
+
+    token: str
+    repair: bool = False
+
+
+class VerifyAggregatesResponse(BaseModel):
+    """
+    The outcome of checking the in-memory aggregates against the database.
+    """
+
+    consistent: bool
+    repaired: bool
+    mismatches: List[str]
+
+
+def get_qa_stats() -> QAStatsResponse:
+    """
+    Returns the totals of users, questions and answers from the in-memory aggregates, in constant time.
+
+    Example:
+        get_qa_stats()
+        > QAStatsResponse(users=100, questions=200, answers=1000)
+    """
+    aggregates = project.qa_aggregates.get_aggregates()
+    aggregates.refresh_if_stale()
+    return QAStatsResponse(
+        users=aggregates.users,
+        questions=aggregates.questions,
+        answers=aggregates.answers,
+    )
+
+
+def get_question_stats(questionId: int) -> QuestionStatsResponse:
+    """
+    Returns how many answers a question has, in constant time. Unknown questions have no answers.
+
+    Example:
+        get_question_stats(1)
+        > QuestionStatsResponse(questionId=1, answers=5)
+    """
+    aggregates = project.qa_aggregates.get_aggregates()
+    aggregates.refresh_if_stale()
+    return QuestionStatsResponse(
+        questionId=questionId,
+        answers=aggregates.answers_per_question.get(questionId, 0),
+    )
+
+
+def get_user_stats(userId: int) -> UserStatsResponse:
+    """
+    Returns how many questions and answers a user has posted, in constant time.
+
+    Example:
+        get_user_stats(1)
+        > UserStatsResponse(userId=1, questions=2, answers=10)
+    """
+    aggregates = project.qa_aggregates.get_aggregates()
+    aggregates.refresh_if_stale()
+    return UserStatsResponse(
+        userId=userId,
+        questions=aggregates.questions_per_user.get(userId, 0),
+        answers=aggregates.answers_per_user.get(userId, 0),
+    )
+
+
+async def verify_aggregates(
+    request: VerifyAggregatesRequest,
+) -> VerifyAggregatesResponse:
+    """
+    Recomputes the aggregates from the database and reports any count that differs from memory, optionally
+    replacing the in-memory counts. Runs grouped COUNT queries over the whole tables, so it is restricted to
+    Admin users.
+
+    Args:
+        request (VerifyAggregatesRequest): An Admin's JWT token and whether to repair differences.
+
+    Returns:
+        VerifyAggregatesResponse: Whether memory and database agree, and the differing counts if not.
+
+    Example:
+        await verify_aggregates(VerifyAggregatesRequest(token="admin.jwt.token"))
+        > VerifyAggregatesResponse(consistent=True, repaired=False, mismatches=[])
+    """
+    user_id = project.auth.user_id_from_token(request.token)
+    user = await prisma.models.User.prisma().find_unique(where={"id": user_id})
+    if not user or user.role != prisma.enums.Role.Admin:
+        raise PermissionError("Only administrators can verify the aggregates")
+    mismatches = await project.qa_aggregates.get_aggregates().verify(request.repair)
+    return VerifyAggregatesResponse(
+        consistent=not mismatches,
+        repaired=bool(mismatches) and request.repair,
+        mismatches=mismatches,
+    )
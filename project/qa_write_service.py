@@ -0,0 +1,210 @@
+from datetime import datetime
+
+import prisma
+import prisma.models
+import project.auth
+import project.qa_aggregates
+import project.write_batcher
+from pydantic import BaseModel
+
+
+class CreateQuestionRequest(BaseModel):
+    """
+    Request model for posting a question as the authenticated user.
+    """
+
+    token: str
+    title: str
+    content: str
+
+
+class CreateAnswerRequest(BaseModel):
+    """
+    Request model for answering a question as the authenticated user.
+    """
+
+    token: str
+    content: str
+
+
+class DeleteQAContentRequest(BaseModel):
+    """
+    Request model for deleting one of the authenticated user's questions or answers. Carries the user's JWT token.
+    """
+
+    token: str
+
+
+class CreatedQuestion(BaseModel):
+    """
+    The question as stored.
+    """
+
+    id: int
+    title: str
+    content: str
+    createdAt: datetime
+    updatedAt: datetime
+    authorId: int
+
+
+class CreatedAnswer(BaseModel):
+    """
+    The answer as stored.
+    """
+
+    id: int
+    content: str
+    createdAt: datetime
+    updatedAt: datetime
+    questionId: int
+    authorId: int
+
+
+class DeleteQAContentResponse(BaseModel):
+    """
+    Response model confirming the deletion of a question or an answer.
+    """
+
+    success: bool
+    message: str
+
+
+async def create_question(request: CreateQuestionRequest) -> CreatedQuestion:
+    """
+    Posts a question authored by the user the token belongs to.
+
+    Args:
+        request (CreateQuestionRequest): The user's JWT token and the question's title and content.
+
+    Returns:
+        CreatedQuestion: The question as stored.
+
+    Example:
+        await create_question(CreateQuestionRequest(token="some.jwt.token", title="Hi?", content="How do I call /hello?"))
+        > CreatedQuestion(id=201, title='Hi?', content='How do I call /hello?', ..., authorId=1)
+    """
+    author_id = project.auth.user_id_from_token(request.token)
+    question = await project.write_batcher.get_batcher().submit(
+        lambda client: prisma.models.Question.prisma(client).create(
+            data={
+                "title": request.title,
+                "content": request.content,
+                "author": {"connect": {"id": author_id}},
+            }
+        )
+    )
+    project.qa_aggregates.get_aggregates().question_created(author_id)
+    return CreatedQuestion(
+        id=question.id,
+        title=question.title,
+        content=question.content,
+        createdAt=question.createdAt,
+        updatedAt=question.updatedAt,
+        authorId=question.authorId,
+    )
+
+
+async def delete_question(
+    questionId: int, request: DeleteQAContentRequest
+) -> DeleteQAContentResponse:
+    """
+    Deletes one of the user's questions together with its answers, in one transaction.
+
+    Args:
+        questionId (int): The question to delete.
+        request (DeleteQAContentRequest): Carries the user's JWT token; only the author may delete a question.
+
+    Returns:
+        DeleteQAContentResponse: Whether a question was deleted.
+
+    Example:
+        await delete_question(201, DeleteQAContentRequest(token="some.jwt.token"))
+        > DeleteQAContentResponse(success=True, message='Question deleted successfully.')
+    """
+    user_id = project.auth.user_id_from_token(request.token)
+    question = await prisma.models.Question.prisma().find_unique(where={"id": questionId})
+    if not question:
+        return DeleteQAContentResponse(success=False, message="Question not found.")
+    if question.authorId != user_id:
+        raise PermissionError("Only the author can delete this question")
+    async with prisma.get_client().tx() as transaction:
+        answers_by_author = await prisma.models.Answer.prisma(transaction).group_by(
+            by=["authorId"], where={"questionId": questionId}, count=True
+        )
+        await prisma.models.Answer.prisma(transaction).delete_many(
+            where={"questionId": questionId}
+        )
+        await prisma.models.Question.prisma(transaction).delete(where={"id": questionId})
+    project.qa_aggregates.get_aggregates().question_deleted(
+        questionId,
+        question.authorId,
+        {row["authorId"]: row["_count"]["_all"] for row in answers_by_author},
+    )
+    return DeleteQAContentResponse(success=True, message="Question deleted successfully.")
+
+
+async def create_answer(questionId: int, request: CreateAnswerRequest) -> CreatedAnswer:
+    """
+    Answers a question as the user the token belongs to.
+
+    Args:
+        questionId (int): The question being answered.
+        request (CreateAnswerRequest): The user's JWT token and the answer's content.
+
+    Returns:
+        CreatedAnswer: The answer as stored.
+
+    Example:
+        await create_answer(1, CreateAnswerRequest(token="some.jwt.token", content="Send a GET request."))
+        > CreatedAnswer(id=1001, content='Send a GET request.', ..., questionId=1, authorId=1)
+    """
+    author_id = project.auth.user_id_from_token(request.token)
+    answer = await project.write_batcher.get_batcher().submit(
+        lambda client: prisma.models.Answer.prisma(client).create(
+            data={
+                "content": request.content,
+                "question": {"connect": {"id": questionId}},
+                "author": {"connect": {"id": author_id}},
+            }
+        )
+    )
+    project.qa_aggregates.get_aggregates().answer_created(questionId, author_id)
+    return CreatedAnswer(
+        id=answer.id,
+        content=answer.content,
+        createdAt=answer.createdAt,
+        updatedAt=answer.updatedAt,
+        questionId=answer.questionId,
+        authorId=answer.authorId,
+    )
+
+
+async def delete_answer(
+    answerId: int, request: DeleteQAContentRequest
+) -> DeleteQAContentResponse:
+    """
+    Deletes one of the user's answers.
+
+    Args:
+        answerId (int): The answer to delete.
+        request (DeleteQAContentRequest): Carries the user's JWT token; only the author may delete an answer.
+
+    Returns:
+        DeleteQAContentResponse: Whether an answer was deleted.
+
+    Example:
+        await delete_answer(1001, DeleteQAContentRequest(token="some.jwt.token"))
+        > DeleteQAContentResponse(success=True, message='Answer deleted successfully.')
+    """
+    user_id = project.auth.user_id_from_token(request.token)
+    answer = await prisma.models.Answer.prisma().find_unique(where={"id": answerId})
+    if not answer:
+        return DeleteQAContentResponse(success=False, message="Answer not found.")
+    if answer.authorId != user_id:
+        raise PermissionError("Only the author can delete this answer")
+    await prisma.models.Answer.prisma().delete(where={"id": answerId})
+    project.qa_aggregates.get_aggregates().answer_deleted(
+        answer.questionId, answer.authorId
+    )
+    return DeleteQAContentResponse(success=True, message="Answer deleted successfully.")
@@ -0,0 +1,193 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import project.metrics
+import project.settings
+
+logger = logging.getLogger(__name__)
+
+db_query_duration_seconds = project.metrics.registry.histogram(
+    "db_query_duration_seconds",
+    "Prisma query latency by model and action.",
+    ("model", "action"),
+)
+
+db_slow_queries_total = project.metrics.registry.counter(
+    "db_slow_queries_total",
+    "Prisma queries slower than SLOW_QUERY_MS, by model and action.",
+    ("model", "action"),
+)
+
+db_queries_per_request = project.metrics.registry.histogram(
+    "db_queries_per_request",
+    "Prisma queries issued per HTTP request, by route template.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """
+    Raised, with QUERY_BUDGET_ENFORCE, by the query that takes a request past its route's declared budget.
+    """
+
+    pass
+
+
+class RequestQueries:
+    """
+    The queries issued on behalf of one HTTP request.
+    """
+
+    __slots__ = ("scope", "count", "seconds", "finished")
+
+    def __init__(self, scope: Dict[str, Any]) -> None:
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+        # Tasks started during the request inherit it, but their queries after the response are not its own.
+        self.finished = False
+
+    @property
+    def budget(self) -> Optional[int]:
+        # The endpoint is only known once the router has matched the request.
+        return getattr(self.scope.get("endpoint"), "query_budget", None)
+
+    @property
+    def route(self) -> str:
+        return getattr(self.scope.get("route"), "path", None) or "<unmatched>"
+
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+def query_budget(queries: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Declares how many queries one request to the decorated route may issue. Place it below the route
+    decorator. Exceeding the budget is logged, or fails the request with QUERY_BUDGET_ENFORCE.
+
+    Example:
+        @router.get("/api/user/profile")
+        @query_budget(1)
+        async def api_get_get_user_profile(...): ...
+    """
+
+    def declare(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        endpoint.query_budget = queries  # type: ignore[attr-defined]
+        return endpoint
+
+    return declare
+
+
+def _shape(value: Any) -> Any:
+    # Query arguments without their values, so the slow-query log never carries passwords or user content.
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_shape(value[0]), "..."] if len(value) > 1 else [_shape(item) for item in value]
+    return "?"
+
+
+async def execute(
+    execute_query: Callable[..., Awaitable[Any]],
+    *,
+    method: str,
+    arguments: Dict[str, Any],
+    model: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Runs one Prisma query through `execute_query` (the client's own `_execute`), timing it per model and action,
+    logging it if slow, and counting it against the current request and its budget.
+    """
+    return await _measure(
+        getattr(model, "__name__", None) or "<raw>",
+        method,
+        arguments,
+        lambda: execute_query(method=method, arguments=arguments, model=model, **kwargs),
+    )
+
+
+async def execute_batch(batch: Any, model_name: str) -> None:
+    """
+    Commits a `batch_()` of queued writes as one query of action "batch". Batch commits go straight to the
+    query engine rather than through the client's `_execute`, so they have to be measured and counted here.
+
+    Example:
+        batcher = prisma.get_client().batch_()
+        batcher.apidocumentation.upsert(...)
+        await execute_batch(batcher, "APIDocumentation")
+    """
+    await _measure(model_name, "batch", {}, batch.commit)
+
+
+async def _measure(
+    model_name: str,
+    method: str,
+    arguments: Dict[str, Any],
+    run: Callable[[], Awaitable[Any]],
+) -> Any:
+    queries = _current.get()
+    if queries is not None and queries.finished:
+        queries = None
+    if queries is not None:
+        queries.count += 1
+        if project.settings.QUERY_BUDGET_ENFORCE:
+            budget = queries.budget
+            if budget is not None and queries.count > budget:
+                raise QueryBudgetExceeded(
+                    f"{queries.scope.get('method')} {queries.route} exceeded its budget of {budget} "
+                    f"queries with {model_name}.{method}"
+                )
+    started = time.perf_counter()
+    try:
+        return await run()
+    finally:
+        elapsed = time.perf_counter() - started
+        db_query_duration_seconds.observe(elapsed, (model_name, method))
+        if queries is not None:
+            queries.seconds += elapsed
+        if elapsed * 1000 >= project.settings.SLOW_QUERY_MS:
+            db_slow_queries_total.inc((model_name, method))
+            logger.warning(
+                "Slow query %s.%s took %.1f ms%s: %s",
+                model_name,
+                method,
+                elapsed * 1000,
+                f" ({queries.scope.get('method')} {queries.scope.get('path')})" if queries else "",
+                _shape(arguments),
+            )
+
+
+class QueryTrackingMiddleware:
+    """
+    Raw ASGI middleware giving each HTTP request its own query count, recorded per route template once the
+    response is sent. Without QUERY_BUDGET_ENFORCE, requests over their route's budget are logged.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        queries = RequestQueries(scope)
+        token = _current.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            queries.finished = True
+            db_queries_per_request.observe(queries.count, (queries.route,))
+            budget = queries.budget
+            if budget is not None and queries.count > budget:
+                logger.warning(
+                    "%s %s issued %d queries, over its budget of %d",
+                    scope["method"],
+                    queries.route,
+                    queries.count,
+                    budget,
+                )
@@ -0,0 +1,274 @@
+"""
+Checks the query plans of the services' query shapes against a real Postgres: seeds large tables, runs `EXPLAIN`
+for each shape and fails when one reads a seeded table with a sequential scan, i.e. when a query depends on an
+index that is missing (see schema.prisma and migrations/add_query_indexes.sql).
+
+    DATABASE_URL=postgresql://... python -m project.query_plans
+    python -m project.query_plans --questions 500000 --answers-per-question 10 --verbose
+
+Everything runs in one transaction that is rolled back, so the database is left as it was; it still needs the
+schema (`prisma db push`) and should be a local or disposable one, as seeding holds locks until it finishes.
+Exits non-zero when a plan regresses; tests/test_query_plans.py runs the same check under pytest when
+DATABASE_URL is set. Reads of whole tables (the documentation catalogue, the startup counts of qa_aggregates)
+are expected to scan and are not checked.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import timedelta
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+import prisma
+import project.database
+
+# The tables seeded by this check; a sequential scan on any of them fails it.
+LARGE_TABLES = ("User", "Question", "Answer", "APIDocumentation")
+
+_MARKER = "query-plans"
+
+
+class QueryShape(NamedTuple):
+    name: str
+    # The SQL Prisma issues for the shape, with `{placeholders}` filled from the seeded rows.
+    sql: str
+
+
+QUERY_SHAPES = [
+    QueryShape(
+        "login_user: user by email",
+        'SELECT "id", "email", "password", "role" FROM "User" WHERE "email" = {email} LIMIT 1',
+    ),
+    QueryShape(
+        "get_user_profile: user by id",
+        'SELECT "id", "email", "role" FROM "User" WHERE "id" = {user_id} LIMIT 1',
+    ),
+    QueryShape(
+        "qa_feed: batched author lookup",
+        'SELECT "id", "email" FROM "User" WHERE "id" IN ({author_ids})',
+    ),
+    QueryShape(
+        "list_questions: first page",
+        'SELECT * FROM "Question" ORDER BY "createdAt" DESC, "id" DESC LIMIT 21',
+    ),
+    QueryShape(
+        "list_questions: page after cursor",
+        'SELECT * FROM "Question" WHERE ("createdAt" < {created_at} OR ("createdAt" = {created_at} '
+        'AND "id" < {question_id})) ORDER BY "createdAt" DESC, "id" DESC LIMIT 21',
+    ),
+    QueryShape(
+        "list_answers: first page",
+        'SELECT * FROM "Answer" WHERE "questionId" = {question_id} '
+        'ORDER BY "createdAt" ASC, "id" ASC LIMIT 21',
+    ),
+    QueryShape(
+        "delete_question: answer counts by author",
+        'SELECT "authorId", COUNT(*) FROM "Answer" WHERE "questionId" = {question_id} GROUP BY "authorId"',
+    ),
+    QueryShape(
+        "delete_question: delete answers",
+        'DELETE FROM "Answer" WHERE "questionId" = {question_id}',
+    ),
+    QueryShape(
+        "delete_question: foreign key check on Answer.questionId",
+        'SELECT 1 FROM ONLY "Answer" x WHERE "questionId" = {question_id} FOR KEY SHARE OF x',
+    ),
+    QueryShape(
+        "delete_user_account: foreign key check on Question.authorId",
+        'SELECT 1 FROM ONLY "Question" x WHERE "authorId" = {user_id} FOR KEY SHARE OF x',
+    ),
+    QueryShape(
+        "delete_user_account: foreign key check on Answer.authorId",
+        'SELECT 1 FROM ONLY "Answer" x WHERE "authorId" = {user_id} FOR KEY SHARE OF x',
+    ),
+    QueryShape(
+        "create_documentation: upsert by (endpoint, method)",
+        'SELECT "id" FROM "APIDocumentation" WHERE "endpoint" = {endpoint} AND "method" = \'GET\' LIMIT 1',
+    ),
+    QueryShape(
+        "bulk_import_documentation: stored entries",
+        'SELECT * FROM "APIDocumentation" WHERE ("endpoint" = {endpoint} AND "method" = \'GET\') '
+        'OR ("endpoint" = {other_endpoint} AND "method" = \'GET\')',
+    ),
+    QueryShape(
+        "get_api_documentation_page: keyset page",
+        'SELECT * FROM "APIDocumentation" WHERE "id" > {doc_id} ORDER BY "id" ASC LIMIT 500',
+    ),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+async def seed(
+    transaction: prisma.Prisma, users: int, questions: int, answers_per_question: int, docs: int
+) -> Dict[str, str]:
+    """
+    Inserts the rows the plans are checked against and refreshes the planner statistics. Returns the SQL
+    literals the query shapes are filled with, all pointing at seeded rows.
+    """
+    await transaction.execute_raw(
+        f'INSERT INTO "User" ("email", "password", "role") '
+        f"SELECT '{_MARKER}-' || i || '@example.com', 'x', 'User'::\"Role\" "
+        f"FROM generate_series(1, {users}) AS i"
+    )
+    [row] = await transaction.query_raw(
+        f'SELECT MIN("id") AS first FROM "User" WHERE "email" LIKE \'{_MARKER}-%\''
+    )
+    first_user = int(row["first"])
+    await transaction.execute_raw(
+        f'INSERT INTO "Question" ("title", "content", "createdAt", "updatedAt", "authorId") '
+        f"SELECT '{_MARKER}', 'content', now() - i * interval '1 second', now(), {first_user} + i % {users} "
+        f"FROM generate_series(1, {questions}) AS i"
+    )
+    [row] = await transaction.query_raw(
+        f'SELECT MIN("id") AS first FROM "Question" WHERE "title" = \'{_MARKER}\''
+    )
+    first_question = int(row["first"])
+    await transaction.execute_raw(
+        f'INSERT INTO "Answer" ("content", "createdAt", "updatedAt", "questionId", "authorId") '
+        f"SELECT '{_MARKER}', now() - i * interval '1 millisecond', now(), "
+        f"{first_question} + i % {questions}, {first_user} + i % {users} "
+        f"FROM generate_series(1, {questions * answers_per_question}) AS i"
+    )
+    await transaction.execute_raw(
+        f'INSERT INTO "APIDocumentation" ("endpoint", "method", "description", "request", "response") '
+        f"SELECT '/{_MARKER}/' || i, 'GET', 'description', '{{}}'::jsonb, '{{}}'::jsonb "
+        f"FROM generate_series(1, {docs}) AS i"
+    )
+    [row] = await transaction.query_raw(
+        f'SELECT MIN("id") AS first FROM "APIDocumentation" WHERE "endpoint" LIKE \'/{_MARKER}/%\''
+    )
+    first_doc = int(row["first"])
+    for table in LARGE_TABLES:
+        await transaction.execute_raw(f'ANALYZE "{table}"')
+
+    question_id = first_question + questions // 2
+    [row] = await transaction.query_raw(
+        f'SELECT "createdAt"::text AS created_at FROM "Question" WHERE "id" = {question_id}'
+    )
+    return {
+        "email": _literal(f"{_MARKER}-{users // 2}@example.com"),
+        "user_id": _literal(first_user + users // 2),
+        "author_ids": ", ".join(_literal(first_user + i) for i in range(0, min(users, 20))),
+        "question_id": _literal(question_id),
+        "created_at": _literal(row["created_at"]),
+        "endpoint": _literal(f"/{_MARKER}/{docs // 2}"),
+        "other_endpoint": _literal(f"/{_MARKER}/{docs // 3 or 1}"),
+        "doc_id": _literal(first_doc + docs // 2),
+    }
+
+
+def scans(plan: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """
+    Yields the (node type, relation) of every node in an `EXPLAIN (FORMAT JSON)` plan that reads a table.
+    """
+    if "Relation Name" in plan:
+        yield plan["Node Type"], plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from scans(child)
+
+
+async def explain(transaction: prisma.Prisma, sql: str) -> Dict[str, Any]:
+    [row] = await transaction.query_raw(f"EXPLAIN (FORMAT JSON) {sql}")
+    output = row["QUERY PLAN"]
+    if isinstance(output, str):
+        output = json.loads(output)
+    return output[0]["Plan"]
+
+
+def sequential_scans(plan: Dict[str, Any]) -> List[str]:
+    """
+    Returns the seeded tables that a plan reads with a sequential scan.
+
+    Example:
+        sequential_scans({"Node Type": "Seq Scan", "Relation Name": "Question"})
+        > ['Question']
+    """
+    return [relation for node, relation in scans(plan) if node == "Seq Scan" and relation in LARGE_TABLES]
+
+
+async def explain_shapes(
+    client: prisma.Prisma, users: int, questions: int, answers_per_question: int, docs: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Seeds the tables through a connected client, explains every query shape and returns the plans by shape name,
+    then rolls everything back.
+
+    Example:
+        await explain_shapes(client, users=10000, questions=100000, answers_per_question=5, docs=10000)
+        > {'login_user: user by email': {'Node Type': 'Limit', ...}, ...}
+    """
+    plans: Dict[str, Dict[str, Any]] = {}
+    try:
+        async with client.tx(max_wait=timedelta(seconds=30), timeout=timedelta(minutes=30)) as transaction:
+            values = await seed(transaction, users, questions, answers_per_question, docs)
+            for shape in QUERY_SHAPES:
+                plans[shape.name] = await explain(transaction, shape.sql.format(**values))
+            raise _Rollback()
+    except _Rollback:
+        pass
+    return plans
+
+
+async def check(
+    users: int, questions: int, answers_per_question: int, docs: int, verbose: bool
+) -> List[str]:
+    """
+    Connects to DATABASE_URL, explains every query shape over the seeded tables, prints each plan's scans and
+    returns the shapes whose plan scans a seeded table sequentially.
+
+    Example:
+        await check(users=10000, questions=100000, answers_per_question=5, docs=10000, verbose=False)
+        > ['delete_user_account: foreign key check on Question.authorId: Seq Scan on Question']
+    """
+    client = project.database.create_client()
+    await client.connect()
+    try:
+        plans = await explain_shapes(client, users, questions, answers_per_question, docs)
+    finally:
+        await client.disconnect()
+
+    failures: List[str] = []
+    for name, plan in plans.items():
+        sequential = sequential_scans(plan)
+        status = "FAIL" if sequential else "ok"
+        print(f"{status:>4}  {name}: " + ", ".join(f"{n} on {r}" for n, r in scans(plan)))
+        if verbose:
+            print(json.dumps(plan, indent=2))
+        failures.extend(f"{name}: Seq Scan on {relation}" for relation in sequential)
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--questions", type=int, default=100000)
+    parser.add_argument("--answers-per-question", type=int, default=5)
+    parser.add_argument("--docs", type=int, default=10000)
+    parser.add_argument("--verbose", action="store_true", help="print every plan in full")
+    args = parser.parse_args()
+
+    failures = asyncio.run(
+        check(args.users, args.questions, args.answers_per_question, args.docs, args.verbose)
+    )
+    if failures:
+        print(f"\n{len(failures)} query shapes scan a large table sequentially:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nall {len(QUERY_SHAPES)} query shapes use an index")
+
+
+if __name__ == "__main__":
+    main()
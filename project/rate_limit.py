@@ -0,0 +1,172 @@
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl
+
+import project.errors
+
+_TOO_MANY_ATTEMPTS = Exception("Too many attempts, please retry later")
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> [tokens, last refill time], least recently used first.
+        self.buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+
+class TokenBucketLimiter:
+    """
+    Per-key token buckets: each key may spend `burst` requests at once and regains `rate_per_second` tokens
+    per second. Keys are spread over `shards` independently locked tables.
+
+    Memory is bounded: each shard holds at most `max_keys // shards` buckets, evicting the least recently
+    used. Buckets that have refilled completely carry no state (a fresh bucket is full), so they are dropped
+    as soon as they reach the old end of their shard.
+    """
+
+    def __init__(
+        self, rate_per_second: float, burst: float, max_keys: int, shards: int = 16
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_keys_per_shard = max(1, max_keys // shards)
+        self._shards = [_Shard() for _ in range(shards)]
+        # A bucket untouched this long is full again.
+        self._refill_seconds = burst / rate_per_second if rate_per_second > 0 else math.inf
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[zlib.crc32(key.encode("utf-8")) % len(self._shards)]
+
+    def acquire(self, key: str, now: Optional[float] = None) -> float:
+        """
+        Takes one token from `key`'s bucket.
+
+        Returns:
+            float: 0.0 if the request is admitted, otherwise the seconds until a token is available.
+        """
+        now = time.monotonic() if now is None else now
+        shard = self._shard(key)
+        with shard.lock:
+            buckets = shard.buckets
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = [self.burst, now]
+                self._collect(buckets, now)
+            else:
+                buckets.move_to_end(key)
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                self.allowed += 1
+                return 0.0
+        self.rejected += 1
+        if self.rate_per_second <= 0:
+            return math.inf
+        return (1.0 - bucket[0]) / self.rate_per_second
+
+    def _collect(self, buckets: "OrderedDict[str, List[float]]", now: float) -> None:
+        while len(buckets) > self.max_keys_per_shard:
+            buckets.popitem(last=False)
+            self.evictions += 1
+        # Drop a few idle (fully refilled) buckets per insert, so idle keys do not linger until the cap.
+        for _ in range(2):
+            oldest = next(iter(buckets.values()))
+            if len(buckets) <= 1 or now - oldest[1] < self._refill_seconds:
+                break
+            buckets.popitem(last=False)
+            self.expired += 1
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "keys": len(self),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    Rate-limits the given paths per client IP and per `username` query parameter before the request reaches
+    the router, so rejected attempts cost no validation, database or bcrypt work. Excess requests get a 429
+    with a Retry-After header.
+
+    Behind `trusted_proxies` proxies the client IP is taken from X-Forwarded-For, counting that many entries
+    from the right: each proxy appends the address it received the request from, so those entries are the
+    only ones a client cannot forge. Requests whose header is shorter did not come through the proxies and are
+    keyed on the connecting address.
+
+    Example:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            paths=["/api/login"],
+            per_ip=TokenBucketLimiter(0.5, 10, max_keys=100000),
+            per_username=TokenBucketLimiter(0.2, 5, max_keys=100000),
+        )
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: Iterable[str],
+        per_ip: TokenBucketLimiter,
+        per_username: TokenBucketLimiter,
+        trusted_proxies: int = 0,
+    ) -> None:
+        self.app = app
+        self.paths = frozenset(paths)
+        self.per_ip = per_ip
+        self.per_username = per_username
+        self.trusted_proxies = max(0, trusted_proxies)
+
+    def _client_ip(self, scope) -> str:
+        if self.trusted_proxies:
+            # Repeated headers are equivalent to one comma-separated list, in order.
+            forwarded = [
+                address.strip()
+                for name, value in scope["headers"]
+                if name == b"x-forwarded-for"
+                for address in value.split(b",")
+            ]
+            if len(forwarded) >= self.trusted_proxies:
+                return forwarded[-self.trusted_proxies].decode("latin-1")
+        client = scope.get("client")
+        return client[0] if client else ""
+
+    def _retry_after(self, scope) -> float:
+        retry_after = self.per_ip.acquire(self._client_ip(scope))
+        if retry_after:
+            return retry_after
+        for name, value in parse_qsl(scope["query_string"].decode("latin-1")):
+            if name == "username":
+                return self.per_username.acquire(value.strip().lower())
+        return 0.0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            retry_after = self._retry_after(scope)
+            if retry_after:
+                response = project.errors.error_response(
+                    _TOO_MANY_ATTEMPTS,
+                    429,
+                    {"Retry-After": str(max(1, math.ceil(min(retry_after, 3600))))},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
@@ -4,6 +4,8 @@ from typing import List
 import prisma
 import prisma.enums
 import prisma.models
+import project.password_hashing
+import project.qa_aggregates
 from pydantic import BaseModel
 
 
@@ -45,6 +47,7 @@ class UserRegistrationResponse(BaseModel):
 async def register_user(username: str, password: str) -> UserRegistrationResponse:
     """
     Creates a new user account. Expects a username and password. If successful, returns a newly created user object.
+    The password is stored as a bcrypt hash with the calibrated cost.
 
     Args:
     username (str): The desired username for the new user.
@@ -57,9 +60,11 @@ async def register_user(username: str, password: str) -> UserRegistrationRespons
         response = await register_user("newuser", "safe_password")
         print(response)
     """
+    hashed_password = await project.password_hashing.hash_password(password)
     new_user = await prisma.models.User.prisma().create(
-        data={"email": username, "password": password, "role": "User"}
+        data={"email": username, "password": hashed_password, "role": "User"}
     )
+    project.qa_aggregates.get_aggregates().user_created()
     registered_user_response = UserRegistrationResponse(
         id=new_user.id,
         email=new_user.email,
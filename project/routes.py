@@ -0,0 +1,686 @@
+from typing import Any, Dict, Optional
+
+import prisma
+import prisma.enums
+import project.bulk_import_documentation_service
+import project.create_documentation_service
+import project.database
+import project.delete_documentation_service
+import project.delete_user_account_service
+import project.docs_catalogue_cache
+import project.docs_search_index
+import project.errors
+import project.fast_lane
+import project.fast_serialization
+import project.get_api_documentation_service
+import project.get_hello_world_service
+import project.get_user_profile_service
+import project.getHelloWorld_service
+import project.health_check_service
+import project.helloWorld_service
+import project.login_user_service
+import project.metrics
+import project.password_cost
+import project.password_hashing
+import project.qa_aggregates
+import project.qa_feed_service
+import project.qa_stats_service
+import project.qa_write_service
+import project.query_instrumentation
+import project.register_user_service
+import project.search_documentation_service
+import project.settings
+import project.single_flight
+import project.token_cache
+import project.update_documentation_service
+import project.update_user_profile_service
+import project.write_batcher
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+
+router = APIRouter(
+    route_class=(
+        project.fast_serialization.TypedResponseRoute
+        if project.settings.FAST_SERIALIZATION
+        else APIRoute
+    )
+)
+
+db_client = project.database.create_client()
+
+
+async def startup() -> None:
+    """
+    Connects to the database, opens the warm-up connections, sets the calibrated bcrypt cost, builds the
+    documentation search index and the Q&A aggregates, and starts the background health probe.
+    """
+    await db_client.connect()
+    await project.database.warm_up(
+        db_client, project.settings.DB_WARMUP_CONNECTIONS
+    )
+    await project.password_cost.configure()
+    await project.docs_search_index.get_index().rebuild()
+    await project.qa_aggregates.get_aggregates().rebuild()
+    project.health_check_service.database_probe.start(db_client)
+
+
+async def shutdown() -> None:
+    await project.health_check_service.database_probe.stop()
+    await db_client.disconnect()
+    project.password_hashing.shutdown_pool()
+
+
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "token_cache",
+        "Verified-token cache",
+        project.token_cache.get_cache().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "password_pool",
+        "bcrypt worker pool",
+        lambda: project.password_hashing.get_pool().stats(),
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "docs_catalogue_cache",
+        "GET /api/docs catalogue cache",
+        project.docs_catalogue_cache.get_cache().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "docs_search_index",
+        "In-memory documentation search index",
+        project.docs_search_index.get_index().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "qa_aggregates",
+        "In-memory Q&A aggregates",
+        project.qa_aggregates.get_aggregates().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "single_flight",
+        "Database reads shared between identical concurrent requests",
+        project.single_flight.get_group().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "write_batcher",
+        "Documentation and Q&A inserts committed in shared transactions",
+        project.write_batcher.get_batcher().stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "fast_serialization_responses",
+        "Typed responses serialized directly vs. through FastAPI",
+        project.fast_serialization.stats,
+    )
+)
+project.metrics.registry.register_collector(
+    project.metrics.stats_collector(
+        "unhandled_errors",
+        "Shared route error path",
+        project.errors.reporter.stats,
+    )
+)
+
+
+@router.get("/health", response_model=project.health_check_service.HealthCheckResponse)
+async def api_get_health_check() -> Response:
+    """
+    This endpoint verifies the operational status of the API. When called, it returns a simple message 'Hello World' indicating the API is operational. It does not interact with any other APIs or databases and should always return a 200 OK status if the service is running.
+    """
+    return Response(
+        content=project.health_check_service.SHALLOW_BODY,
+        media_type="application/json",
+    )
+
+
+@router.get(
+    "/health/deep",
+    response_model=project.health_check_service.DeepHealthCheckResponse,
+)
+async def api_get_deep_health_check() -> Response:
+    """
+    Reports the database status measured by the periodic background probe (latency, last success time, last error). Returns 503 when the last probe failed or probing has stalled. Never queries the database inline.
+    """
+    probe = project.health_check_service.database_probe
+    if probe.healthy:
+        return Response(content=probe.body, media_type="application/json")
+    return Response(
+        content=project.health_check_service.deep_health_check().model_dump_json(),
+        status_code=503,
+        media_type="application/json",
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def api_get_metrics() -> PlainTextResponse:
+    """
+    Exposes request counts and per-route latency histograms, cache and worker pool gauges, and the database connection pool gauges (open, busy and idle connections, acquire-wait histogram) in Prometheus text format.
+    """
+    return PlainTextResponse(
+        project.metrics.registry.render()
+        + await db_client.get_metrics(format="prometheus")
+    )
+
+
+@router.put(
+    "/api/docs/{docId}",
+    response_model=project.update_documentation_service.UpdateAPIDocumentationResponse,
+)
+async def api_put_update_documentation(
+    docId: int,
+    endpoint: str,
+    method: str,
+    description: str,
+    request: Dict[str, Any],
+    response: Dict[str, Any],
+) -> project.update_documentation_service.UpdateAPIDocumentationResponse | Response:
+    """
+    Updates existing documentation by its id. It is critical to provide accurate and updated descriptions for endpoints.
+    """
+    try:
+        res = await project.update_documentation_service.update_documentation(
+            docId, endpoint, method, description, request, response
+        )
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.delete(
+    "/api/user/account",
+    response_model=project.delete_user_account_service.DeleteUserAccountResponse,
+)
+async def api_delete_delete_user_account(
+    request: project.delete_user_account_service.DeleteUserAccountRequest,
+) -> project.delete_user_account_service.DeleteUserAccountResponse | Response:
+    """
+    Deletes the authenticated user's account. Requires a valid JWT token. Returns a confirmation message upon successful deletion.
+    """
+    try:
+        res = await project.delete_user_account_service.delete_user_account(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.put(
+    "/api/user/profile",
+    response_model=project.update_user_profile_service.UpdatedUserProfileResponse,
+)
+@project.query_instrumentation.query_budget(2)
+async def api_put_update_user_profile(
+    token: str, email: str, password: str, role: Optional[prisma.enums.Role] = None
+) -> project.update_user_profile_service.UpdatedUserProfileResponse | Response:
+    """
+    Updates the profile of the authenticated user. Requires a valid JWT token. Accepts updated user profile information and returns the updated profile.
+    Only an Admin may change their role.
+    """
+    try:
+        res = await project.update_user_profile_service.update_user_profile(
+            token, email, password, role
+        )
+        return res
+    except PermissionError as e:
+        return project.errors.error_response(e, 403)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/user/profile",
+    response_model=project.get_user_profile_service.UserProfileResponse,
+)
+@project.query_instrumentation.query_budget(1)
+async def api_get_get_user_profile(
+    request: project.get_user_profile_service.GetUserProfileRequest,
+) -> project.get_user_profile_service.UserProfileResponse | Response:
+    """
+    Retrieves the profile of the authenticated user. Requires a valid JWT token. Returns user profile information.
+    """
+    try:
+        res = await project.get_user_profile_service.get_user_profile(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get("/hello", response_model=project.getHelloWorld_service.HelloWorldResponseModel)
+@project.query_instrumentation.query_budget(0)
+async def api_get_getHelloWorld(
+    request: project.getHelloWorld_service.HelloWorldRequestModel,
+) -> project.getHelloWorld_service.HelloWorldResponseModel | Response:
+    """
+    This endpoint returns a simple 'Hello, World!' message. When a GET request is made to this endpoint, the server responds with a plain text message saying 'Hello, World!'. This is primarily used to test server connectivity and response handling. No additional processing or data is required to be passed with the request.
+    """
+    try:
+        res = project.getHelloWorld_service.getHelloWorld(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.delete(
+    "/api/docs/{docId}",
+    response_model=project.delete_documentation_service.DeleteApiDocResponseModel,
+)
+async def api_delete_delete_documentation(
+    docId: int,
+) -> project.delete_documentation_service.DeleteApiDocResponseModel | Response:
+    """
+    Deletes documentation by its id. This removes outdated or incorrect documentation ensuring only relevant information is available.
+    """
+    try:
+        res = await project.delete_documentation_service.delete_documentation(docId)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/docs", response_model=project.get_api_documentation_service.ApiDocsPage
+)
+@project.query_instrumentation.query_budget(1)
+async def api_get_get_api_documentation(
+    request: project.get_api_documentation_service.GetApiDocsRequest,
+    http_request: Request,
+    limit: Optional[int] = Query(
+        None, ge=1, le=project.get_api_documentation_service.MAX_PAGE_SIZE
+    ),
+    after: Optional[int] = None,
+) -> project.get_api_documentation_service.ApiDocsPage | Response:
+    """
+    Fetches the complete API documentation including requests and responses for all available endpoints. This requires consolidating documentation generated by HelloWorldHandler and HealthCheckHandler.
+
+    Pass `limit` (and then `after` set to the previous page's `next_cursor`) to page through the catalogue instead.
+    Only pages carry `next_cursor`; the full catalogue is returned without it, as before pagination existed.
+    The full catalogue is served from an in-process cache with an ETag; a matching If-None-Match gets a 304.
+    Clients sending Accept-Encoding get a variant compressed once per catalogue version.
+    """
+    try:
+        if limit is not None:
+            res = await project.get_api_documentation_service.get_api_documentation_page(
+                limit, after
+            )
+            return res
+        snapshot = await project.docs_catalogue_cache.get_cache().get(
+            lambda: project.get_api_documentation_service.get_api_documentation(
+                request
+            )
+        )
+        encoding, body, etag = snapshot.select(
+            http_request.headers.get("accept-encoding")
+        )
+        headers = {"ETag": etag.decode("ascii")}
+        if snapshot.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = http_request.headers.get("if-none-match")
+        if if_none_match is not None and project.fast_lane.etag_matches(
+            if_none_match.encode("latin-1"), etag
+        ):
+            return Response(status_code=304, headers=headers)
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        project.docs_catalogue_cache.get_cache().record_served(snapshot, encoding)
+        return Response(content=body, headers=headers, media_type="application/json")
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post(
+    "/api/docs/bulk",
+    response_model=project.bulk_import_documentation_service.BulkImportResponse,
+)
+async def api_post_bulk_import_documentation(
+    http_request: Request,
+) -> project.bulk_import_documentation_service.BulkImportResponse | Response:
+    """
+    Creates or updates many API documentation entries in one call. Accepts a JSON array of entries or, with Content-Type application/x-ndjson, a stream of one entry per line. Returns a result per entry.
+    """
+    try:
+        content_type = http_request.headers.get("content-type", "")
+        if content_type.startswith("application/x-ndjson"):
+            entries = project.bulk_import_documentation_service.iter_ndjson(
+                http_request.stream()
+            )
+        else:
+            entries = project.bulk_import_documentation_service.iter_items(
+                project.bulk_import_documentation_service.parse_entry_array(
+                    await http_request.body()
+                )
+            )
+        res = await project.bulk_import_documentation_service.bulk_import_documentation(
+            entries, project.settings.DOCS_BULK_CHUNK_SIZE
+        )
+        return res
+    except project.bulk_import_documentation_service.InvalidBulkBodyError as e:
+        return project.errors.error_response(e, 400)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/docs/search",
+    response_model=project.search_documentation_service.DocsSearchResponse,
+)
+async def api_get_search_documentation(
+    q: str,
+    limit: int = Query(
+        20, ge=1, le=project.search_documentation_service.MAX_RESULTS
+    ),
+) -> project.search_documentation_service.DocsSearchResponse | Response:
+    """
+    Searches API documentation by endpoint, method and description, with prefix matching and ranked results. Served from an in-memory index, without a database round trip.
+    """
+    try:
+        res = project.search_documentation_service.search_documentation(q, limit)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get("/api/docs/stream")
+async def api_get_stream_api_documentation(
+    chunk_size: int = Query(
+        500, ge=1, le=project.get_api_documentation_service.MAX_PAGE_SIZE
+    ),
+) -> StreamingResponse:
+    """
+    Streams the complete API documentation as NDJSON (one entry per line), fetching rows from the database in chunks as they are written.
+    """
+    return StreamingResponse(
+        project.get_api_documentation_service.stream_api_documentation(chunk_size),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post(
+    "/api/register",
+    response_model=project.register_user_service.UserRegistrationResponse,
+)
+@project.query_instrumentation.query_budget(1)
+async def api_post_register_user(
+    username: str, password: str
+) -> project.register_user_service.UserRegistrationResponse | Response:
+    """
+    Creates a new user account. Expects a username and password. If successful, returns a newly created user object.
+    """
+    try:
+        res = await project.register_user_service.register_user(username, password)
+        return res
+    except project.password_hashing.PoolSaturatedError as e:
+        return project.errors.error_response(e, 503, {"Retry-After": "1"})
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/hello-world",
+    response_model=project.get_hello_world_service.HelloWorldResponse,
+)
+@project.query_instrumentation.query_budget(1)
+async def api_get_get_hello_world(
+    request: project.get_hello_world_service.HelloWorldRequest,
+) -> project.get_hello_world_service.HelloWorldResponse | Response:
+    """
+    Returns a 'Hello World' message. Requires the user to be authenticated. Uses JWT token for user verification.
+    """
+    try:
+        res = await project.get_hello_world_service.get_hello_world(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get("/hello", response_model=project.helloWorld_service.HelloWorldResponse)
+@project.query_instrumentation.query_budget(0)
+async def api_get_helloWorld(
+    request: project.helloWorld_service.HelloWorldRequest,
+) -> project.helloWorld_service.HelloWorldResponse | Response:
+    """
+    This endpoint returns a simple 'hello world' message. It does not require any parameters. The response will be a JSON object with a message key.
+    """
+    try:
+        res = await project.helloWorld_service.helloWorld(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post("/api/login", response_model=project.login_user_service.LoginResponseModel)
+@project.query_instrumentation.query_budget(2)
+async def api_post_login_user(
+    username: str, password: str
+) -> project.login_user_service.LoginResponseModel | Response:
+    """
+    Authenticates a user. Expects a username and password, returns a JWT token upon successful authentication.
+    """
+    try:
+        res = await project.login_user_service.login_user(username, password)
+        return res
+    except project.password_hashing.PoolSaturatedError as e:
+        return project.errors.error_response(e, 503, {"Retry-After": "1"})
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post(
+    "/api/docs",
+    response_model=project.create_documentation_service.ApiDocsCreateOrUpdateResponse,
+)
+async def api_post_create_documentation(
+    endpoint: str, method: str, description: str, request: Dict, response: Dict
+) -> project.create_documentation_service.ApiDocsCreateOrUpdateResponse | Response:
+    """
+    Allows an authorized user to create or update API documentation. The payload should include detailed descriptions for new or updated endpoints handled by HelloWorldHandler and HealthCheckHandler.
+    """
+    try:
+        res = await project.create_documentation_service.create_documentation(
+            endpoint, method, description, request, response
+        )
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/questions",
+    response_model=project.qa_feed_service.QuestionFeedResponse,
+)
+@project.query_instrumentation.query_budget(2)
+async def api_get_list_questions(
+    limit: int = Query(20, ge=1, le=project.qa_feed_service.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    loaders: project.qa_feed_service.FeedLoaders = Depends(
+        project.qa_feed_service.FeedLoaders
+    ),
+) -> project.qa_feed_service.QuestionFeedResponse | Response:
+    """
+    Lists questions newest first, with their authors. Pass the previous page's `next_cursor` as `cursor` to get the next page.
+    """
+    try:
+        res = await project.qa_feed_service.list_questions(limit, cursor, loaders)
+        return res
+    except project.qa_feed_service.InvalidCursorError as e:
+        return project.errors.error_response(e, 400)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/questions/{questionId}/answers",
+    response_model=project.qa_feed_service.AnswerFeedResponse,
+)
+@project.query_instrumentation.query_budget(2)
+async def api_get_list_answers(
+    questionId: int,
+    limit: int = Query(20, ge=1, le=project.qa_feed_service.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    loaders: project.qa_feed_service.FeedLoaders = Depends(
+        project.qa_feed_service.FeedLoaders
+    ),
+) -> project.qa_feed_service.AnswerFeedResponse | Response:
+    """
+    Lists the answers to a question oldest first, with their authors. Pass the previous page's `next_cursor` as `cursor` to get the next page.
+    """
+    try:
+        res = await project.qa_feed_service.list_answers(
+            questionId, limit, cursor, loaders
+        )
+        return res
+    except project.qa_feed_service.InvalidCursorError as e:
+        return project.errors.error_response(e, 400)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post(
+    "/api/questions",
+    response_model=project.qa_write_service.CreatedQuestion,
+)
+@project.query_instrumentation.query_budget(1)
+async def api_post_create_question(
+    request: project.qa_write_service.CreateQuestionRequest,
+) -> project.qa_write_service.CreatedQuestion | Response:
+    """
+    Posts a question as the authenticated user. Requires a valid JWT token.
+    """
+    try:
+        res = await project.qa_write_service.create_question(request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.delete(
+    "/api/questions/{questionId}",
+    response_model=project.qa_write_service.DeleteQAContentResponse,
+)
+async def api_delete_delete_question(
+    questionId: int, request: project.qa_write_service.DeleteQAContentRequest
+) -> project.qa_write_service.DeleteQAContentResponse | Response:
+    """
+    Deletes one of the authenticated user's questions, with its answers. Requires a valid JWT token.
+    """
+    try:
+        res = await project.qa_write_service.delete_question(questionId, request)
+        return res
+    except PermissionError as e:
+        return project.errors.error_response(e, 403)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post(
+    "/api/questions/{questionId}/answers",
+    response_model=project.qa_write_service.CreatedAnswer,
+)
+@project.query_instrumentation.query_budget(1)
+async def api_post_create_answer(
+    questionId: int, request: project.qa_write_service.CreateAnswerRequest
+) -> project.qa_write_service.CreatedAnswer | Response:
+    """
+    Answers a question as the authenticated user. Requires a valid JWT token.
+    """
+    try:
+        res = await project.qa_write_service.create_answer(questionId, request)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.delete(
+    "/api/answers/{answerId}",
+    response_model=project.qa_write_service.DeleteQAContentResponse,
+)
+async def api_delete_delete_answer(
+    answerId: int, request: project.qa_write_service.DeleteQAContentRequest
+) -> project.qa_write_service.DeleteQAContentResponse | Response:
+    """
+    Deletes one of the authenticated user's answers. Requires a valid JWT token.
+    """
+    try:
+        res = await project.qa_write_service.delete_answer(answerId, request)
+        return res
+    except PermissionError as e:
+        return project.errors.error_response(e, 403)
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get("/api/stats", response_model=project.qa_stats_service.QAStatsResponse)
+async def api_get_qa_stats() -> project.qa_stats_service.QAStatsResponse | Response:
+    """
+    Returns the totals of users, questions and answers. Served from in-memory aggregates in constant time.
+    """
+    try:
+        res = project.qa_stats_service.get_qa_stats()
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/stats/questions/{questionId}",
+    response_model=project.qa_stats_service.QuestionStatsResponse,
+)
+async def api_get_question_stats(
+    questionId: int,
+) -> project.qa_stats_service.QuestionStatsResponse | Response:
+    """
+    Returns how many answers a question has. Served from in-memory aggregates in constant time.
+    """
+    try:
+        res = project.qa_stats_service.get_question_stats(questionId)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.get(
+    "/api/stats/users/{userId}",
+    response_model=project.qa_stats_service.UserStatsResponse,
+)
+async def api_get_user_stats(
+    userId: int,
+) -> project.qa_stats_service.UserStatsResponse | Response:
+    """
+    Returns how many questions and answers a user has posted. Served from in-memory aggregates in constant time.
+    """
+    try:
+        res = project.qa_stats_service.get_user_stats(userId)
+        return res
+    except Exception as e:
+        return project.errors.internal_error(e)
+
+
+@router.post(
+    "/api/stats/verify",
+    response_model=project.qa_stats_service.VerifyAggregatesResponse,
+)
+async def api_post_verify_aggregates(
+    request: project.qa_stats_service.VerifyAggregatesRequest,
+) -> project.qa_stats_service.VerifyAggregatesResponse | Response:
+    """
+    Checks the in-memory Q&A aggregates against the database and optionally repairs them. Requires an Admin's JWT token.
+    """
+    try:
+        res = await project.qa_stats_service.verify_aggregates(request)
+        return res
+    except PermissionError as e:
+        return project.errors.error_response(e, 403)
+    except Exception as e:
+        return project.errors.internal_error(e)
@@ -0,0 +1,37 @@
+from typing import List
+
+import project.docs_search_index
+from pydantic import BaseModel
+
+MAX_RESULTS = 100
+
+
+class DocsSearchResponse(BaseModel):
+    """
+    Response model for a documentation search: the matching entries, best first.
+    """
+
+    results: List[project.docs_search_index.DocsSearchHit]
+
+
+def search_documentation(q: str, limit: int = 20) -> DocsSearchResponse:
+    """
+    Searches the endpoint, method and description of every API documentation entry. Each word of the query
+    must match a word of the entry, either whole or, from three characters on, as a prefix. Answered from the
+    in-memory index without a database round trip.
+
+    Args:
+        q (str): The search text, e.g. "user prof".
+        limit (int): The maximum number of results, capped at MAX_RESULTS.
+
+    Returns:
+        DocsSearchResponse: The matching entries with their relevance scores, best first.
+
+    Example:
+        search_documentation("hello")
+        > DocsSearchResponse(results=[DocsSearchHit(id=1, endpoint='/hello', method='GET', ...)])
+    """
+    limit = max(1, min(limit, MAX_RESULTS))
+    return DocsSearchResponse(
+        results=project.docs_search_index.get_index().search(q, limit)
+    )
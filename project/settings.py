@@ -0,0 +1,172 @@
+import os
+
+_TRUTHY = ("1", "true", "yes", "on")
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Reads a boolean flag from the environment.
+
+    Args:
+        name (str): The environment variable to read.
+        default (bool): The value used when the variable is unset or empty.
+
+    Returns:
+        bool: True for '1', 'true', 'yes' or 'on' (case-insensitive), False for anything else.
+
+    Example:
+        env_bool("HELLO_FAST_LANE", True)
+        > True
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Reads an integer setting from the environment.
+
+    Args:
+        name (str): The environment variable to read.
+        default (int): The value used when the variable is unset or empty.
+
+    Returns:
+        int: The parsed value.
+
+    Example:
+        env_int("PASSWORD_POOL_WORKERS", 4)
+        > 4
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: float) -> float:
+    """
+    Reads a float setting from the environment.
+
+    Args:
+        name (str): The environment variable to read.
+        default (float): The value used when the variable is unset or empty.
+
+    Returns:
+        float: The parsed value.
+
+    Example:
+        env_float("HEALTH_PROBE_INTERVAL_SECONDS", 5.0)
+        > 5.0
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+# Serve constant GET responses (e.g. /hello) from pre-serialized bytes.
+HELLO_FAST_LANE = env_bool("HELLO_FAST_LANE", True)
+
+# Bounded worker pool for bcrypt hashing and verification.
+PASSWORD_POOL_KIND = os.getenv("PASSWORD_POOL_KIND", "thread")
+PASSWORD_POOL_WORKERS = env_int("PASSWORD_POOL_WORKERS", min(4, os.cpu_count() or 1))
+PASSWORD_POOL_MAX_QUEUE = env_int("PASSWORD_POOL_MAX_QUEUE", 64)
+
+# In-process cache of verified JWTs and user-existence lookups. Deleting an account only clears the cache of the
+# worker that served the delete: other workers (project.launcher runs one per CPU) and replicas keep accepting
+# the deleted user's token for up to TOKEN_CACHE_TTL_SECONDS, which is therefore the revocation window (0 = no
+# caching).
+TOKEN_CACHE_MAX_SIZE = env_int("TOKEN_CACHE_MAX_SIZE", 10000)
+TOKEN_CACHE_TTL_SECONDS = env_float("TOKEN_CACHE_TTL_SECONDS", 5.0)
+
+# Serialized GET /api/docs catalogue; expiry bounds staleness from writes made by other replicas (0 = never).
+DOCS_CACHE_TTL_SECONDS = env_float("DOCS_CACHE_TTL_SECONDS", 30.0)
+
+# Entries applied per transaction by POST /api/docs/bulk.
+DOCS_BULK_CHUNK_SIZE = env_int("DOCS_BULK_CHUNK_SIZE", 200)
+
+# Prisma connection pool; 0 / -1 keep the engine defaults (connection_limit = num_cpus * 2 + 1).
+DB_CONNECTION_LIMIT = env_int("DB_CONNECTION_LIMIT", 0)
+DB_POOL_TIMEOUT_SECONDS = env_float("DB_POOL_TIMEOUT_SECONDS", -1)
+DB_CONNECT_TIMEOUT_SECONDS = env_float("DB_CONNECT_TIMEOUT_SECONDS", -1)
+# Connections opened during startup, before the app starts serving.
+DB_WARMUP_CONNECTIONS = env_int("DB_WARMUP_CONNECTIONS", DB_CONNECTION_LIMIT or 1)
+
+# Background database probe reported by GET /health/deep.
+HEALTH_PROBE_INTERVAL_SECONDS = env_float("HEALTH_PROBE_INTERVAL_SECONDS", 5.0)
+HEALTH_PROBE_TIMEOUT_SECONDS = env_float("HEALTH_PROBE_TIMEOUT_SECONDS", 2.0)
+
+# Per-route request counts and latency histograms, exposed on GET /metrics.
+METRICS_ENABLED = env_bool("METRICS_ENABLED", True)
+
+# Unhandled route errors: one full traceback per error signature per interval, capped globally (0 = no cap).
+ERROR_TRACE_INTERVAL_SECONDS = env_float("ERROR_TRACE_INTERVAL_SECONDS", 60.0)
+ERROR_MAX_TRACES_PER_MINUTE = env_int("ERROR_MAX_TRACES_PER_MINUTE", 30)
+
+# Load project/routes.py (services, prisma, jwt, bcrypt) on first use or in a background warm-up after startup.
+LAZY_ROUTES = env_bool("LAZY_ROUTES", False)
+LAZY_ROUTES_WARM_UP = env_bool("LAZY_ROUTES_WARM_UP", True)
+
+# Serialize service responses of exactly the declared response_model straight to JSON, skipping revalidation.
+FAST_SERIALIZATION = env_bool("FAST_SERIALIZATION", False)
+
+# In-memory documentation search index; rebuilt in the background once older than this (0 = never).
+DOCS_SEARCH_REFRESH_SECONDS = env_float("DOCS_SEARCH_REFRESH_SECONDS", 300.0)
+
+# In-memory Q&A aggregates; rebuilt in the background once older than this (0 = never), so that every worker
+# picks up the others' writes.
+QA_AGGREGATES_REFRESH_SECONDS = env_float("QA_AGGREGATES_REFRESH_SECONDS", 60.0)
+
+# Token buckets for POST /api/login and /api/register, per client IP and per username (rates per minute).
+AUTH_RATE_LIMIT_ENABLED = env_bool("AUTH_RATE_LIMIT_ENABLED", True)
+AUTH_RATE_LIMIT_IP_PER_MINUTE = env_float("AUTH_RATE_LIMIT_IP_PER_MINUTE", 30.0)
+AUTH_RATE_LIMIT_IP_BURST = env_int("AUTH_RATE_LIMIT_IP_BURST", 10)
+AUTH_RATE_LIMIT_USERNAME_PER_MINUTE = env_float("AUTH_RATE_LIMIT_USERNAME_PER_MINUTE", 10.0)
+AUTH_RATE_LIMIT_USERNAME_BURST = env_int("AUTH_RATE_LIMIT_USERNAME_BURST", 5)
+# Buckets kept per limiter, spread over the shards; least recently used clients are forgotten beyond it.
+AUTH_RATE_LIMIT_MAX_KEYS = env_int("AUTH_RATE_LIMIT_MAX_KEYS", 100000)
+AUTH_RATE_LIMIT_SHARDS = env_int("AUTH_RATE_LIMIT_SHARDS", 16)
+# Proxies in front of the app that append to X-Forwarded-For; clients are keyed on the address the outermost
+# one saw (that many entries from the right). 0 ignores the header and keys on the connecting address.
+AUTH_RATE_LIMIT_TRUSTED_PROXIES = env_int("AUTH_RATE_LIMIT_TRUSTED_PROXIES", 0)
+
+# bcrypt cost for new password hashes: BCRYPT_ROUNDS if non-zero, else the calibration saved by
+# `python -m project.password_cost` (run at startup when missing; once, before forking, under project.launcher),
+# fitted to the per-hash latency budget.
+BCRYPT_ROUNDS = env_int("BCRYPT_ROUNDS", 0)
+BCRYPT_TARGET_MS = env_float("BCRYPT_TARGET_MS", 250.0)
+BCRYPT_MIN_ROUNDS = env_int("BCRYPT_MIN_ROUNDS", 10)
+BCRYPT_COST_FILE = os.getenv("BCRYPT_COST_FILE", "bcrypt_cost.json")
+BCRYPT_CALIBRATE_AT_STARTUP = env_bool("BCRYPT_CALIBRATE_AT_STARTUP", True)
+
+# Identical concurrent reads (documentation catalogue, user profiles) share one in-flight database call.
+SINGLE_FLIGHT_ENABLED = env_bool("SINGLE_FLIGHT_ENABLED", True)
+
+# Content codings precompressed once per GET /api/docs catalogue version, and the smallest body worth compressing.
+DOCS_COMPRESSION_ENCODINGS = tuple(
+    encoding.strip().lower()
+    for encoding in os.getenv("DOCS_COMPRESSION_ENCODINGS", "gzip,deflate").split(",")
+    if encoding.strip()
+)
+DOCS_COMPRESSION_MIN_BYTES = env_int("DOCS_COMPRESSION_MIN_BYTES", 1024)
+
+# python -m project.launcher: worker processes (0 = one per available CPU), and when a worker is recycled
+# (after max requests plus up to the jitter, or past a resident memory ceiling; 0 = never).
+WEB_CONCURRENCY = env_int("WEB_CONCURRENCY", 0)
+WORKER_MAX_REQUESTS = env_int("WORKER_MAX_REQUESTS", 0)
+WORKER_MAX_REQUESTS_JITTER = env_int("WORKER_MAX_REQUESTS_JITTER", 0)
+WORKER_MAX_MEMORY_MB = env_int("WORKER_MAX_MEMORY_MB", 0)
+WORKER_GRACEFUL_TIMEOUT_SECONDS = env_int("WORKER_GRACEFUL_TIMEOUT_SECONDS", 30)
+
+# Commit concurrent documentation and Q&A inserts together: a batch closes after the window or at max items.
+WRITE_BATCHING_ENABLED = env_bool("WRITE_BATCHING_ENABLED", False)
+WRITE_BATCH_WINDOW_MS = env_float("WRITE_BATCH_WINDOW_MS", 2.0)
+WRITE_BATCH_MAX_ITEMS = env_int("WRITE_BATCH_MAX_ITEMS", 64)
+
+# Per-model/action query timing, a slow-query log, and per-request query counts against route budgets;
+# QUERY_BUDGET_ENFORCE fails requests that exceed their budget (for tests and benchmarks, not production).
+QUERY_INSTRUMENTATION_ENABLED = env_bool("QUERY_INSTRUMENTATION_ENABLED", True)
+SLOW_QUERY_MS = env_float("SLOW_QUERY_MS", 200.0)
+QUERY_BUDGET_ENFORCE = env_bool("QUERY_BUDGET_ENFORCE", False)
@@ -0,0 +1,109 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Tuple, TypeVar
+
+import project.settings
+
+T = TypeVar("T")
+
+QueryKey = Tuple[str, str, str]
+
+
+def query_key(model: str, action: str, **arguments: Any) -> QueryKey:
+    """
+    Normalizes a Prisma query into a hashable key: argument order and dict key order do not matter.
+
+    Example:
+        query_key("User", "find_unique", where={"id": 1})
+        > ('User', 'find_unique', '{"where": {"id": 1}}')
+    """
+    return model, action, json.dumps(arguments, sort_keys=True, default=str)
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent reads: while a call for a key is in flight, further callers with the same
+    key await that call instead of starting their own, and all of them get its result (or its exception).
+    Nothing is kept once the call completes, so this only merges overlapping reads and never serves stale data
+    to a read that starts after the result arrived.
+
+    The shared call runs in its own task, so a caller that is cancelled does not cancel it for the others.
+    Results are shared between callers and must not be mutated.
+
+    A write should call `forget(model)` once it has committed: reads already in flight may predate the write,
+    so reads that start afterwards must not join them.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._in_flight: Dict[QueryKey, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.coalesced_by_query: Dict[str, int] = {}
+
+    async def do(self, key: QueryKey, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns the result of `fn()`, sharing it with every concurrent caller using the same `key`.
+
+        Args:
+            key (QueryKey): The normalized query, from `query_key`.
+            fn (Callable[[], Awaitable[T]]): Runs the query; only called if no identical query is in flight.
+
+        Returns:
+            T: The query's result.
+
+        Example:
+            await get_group().do(
+                query_key("User", "find_unique", where={"id": 1}),
+                lambda: prisma.models.User.prisma().find_unique(where={"id": 1}),
+            )
+        """
+        self.calls += 1
+        if not self.enabled:
+            self.executions += 1
+            return await fn()
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            name = f"{key[0]}_{key[1]}"
+            self.coalesced_by_query[name] = self.coalesced_by_query.get(name, 0) + 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(task)
+
+    def _done(self, key: QueryKey, task: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled before it arrived.
+            task.exception()
+
+    def forget(self, model: str) -> None:
+        """
+        Stops later reads of `model` from joining the calls currently in flight.
+        """
+        for key in [key for key in self._in_flight if key[0] == model]:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            **{f"coalesced_{name}": count for name, count in self.coalesced_by_query.items()},
+        }
+
+
+_group = SingleFlight(enabled=project.settings.SINGLE_FLIGHT_ENABLED)
+
+
+def get_group() -> SingleFlight:
+    """
+    Returns the process-wide single-flight group for database reads.
+    """
+    return _group
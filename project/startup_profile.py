@@ -0,0 +1,118 @@
+"""
+Profiles the imports performed when loading the app, using the interpreter's `-X importtime` instrumentation,
+and aggregates them per module or per package.
+
+    python -m project.startup_profile
+    python -m project.startup_profile --by package --top 15
+    LAZY_ROUTES=true python -m project.startup_profile
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    Parses the `import time: self [us] | cumulative | imported package` lines written by `-X importtime`.
+    Nesting is encoded by indentation; `depth` 0 marks imports made directly by the profiled statement.
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+            )
+    return records
+
+
+def package_of(module: str) -> str:
+    """
+    The group a module is reported under with `--by package`: the top-level package, except for this
+    project's own modules, which are reported individually.
+    """
+    parts = module.split(".")
+    if parts[0] == "project":
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def aggregate(records: List[ImportRecord], by: str) -> Dict[str, Dict[str, int]]:
+    """
+    Sums self time and counts modules per group. Per module, the cumulative time is also kept (summing
+    cumulative times across a package would count nested imports twice).
+    """
+    groups: Dict[str, Dict[str, int]] = {}
+    for record in records:
+        key = record.module if by == "module" else package_of(record.module)
+        group = groups.setdefault(key, {"self_us": 0, "cumulative_us": 0, "modules": 0})
+        group["self_us"] += record.self_us
+        group["modules"] += 1
+        if by == "module":
+            group["cumulative_us"] = max(group["cumulative_us"], record.cumulative_us)
+    return groups
+
+
+def profile(module: str) -> List[ImportRecord]:
+    """
+    Imports `module` in a fresh interpreter with `-X importtime`.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(completed.returncode)
+    return parse_importtime(completed.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--module", default="project.server", help="module to import")
+    parser.add_argument("--by", choices=("module", "package"), default="module")
+    parser.add_argument("--top", type=int, default=25, help="rows to print, slowest first")
+    parser.add_argument(
+        "--sort", choices=("self", "cumulative"), default="self", help="column to sort by"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    records = profile(args.module)
+    wall = time.perf_counter() - started
+    groups = aggregate(records, args.by)
+    key = "cumulative_us" if args.sort == "cumulative" and args.by == "module" else "self_us"
+    rows = sorted(groups.items(), key=lambda item: item[1][key], reverse=True)[: args.top]
+
+    total_self = sum(record.self_us for record in records)
+    print(
+        f"import {args.module}: {len(records)} modules, {total_self / 1000:.1f} ms of imports, "
+        f"{wall * 1000:.1f} ms wall clock including interpreter start-up"
+    )
+    print(f"{args.by:<48}{'self ms':>10}{'cumul. ms':>11}{'modules':>9}")
+    for name, group in rows:
+        cumulative = f"{group['cumulative_us'] / 1000:.1f}" if args.by == "module" else "-"
+        print(f"{name:<48}{group['self_us'] / 1000:>10.1f}{cumulative:>11}{group['modules']:>9}")
+
+
+if __name__ == "__main__":
+    main()
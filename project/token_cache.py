@@ -0,0 +1,162 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+import project.settings
+
+
+class VerifiedToken:
+    """
+    The outcome of verifying one JWT: its claims and whether the user it names still exists.
+    """
+
+    __slots__ = ("claims", "user_id", "user_exists", "expires_at")
+
+    def __init__(
+        self,
+        claims: Dict[str, Any],
+        user_id: Optional[int],
+        user_exists: bool,
+        expires_at: float,
+    ) -> None:
+        self.claims = claims
+        self.user_id = user_id
+        self.user_exists = user_exists
+        self.expires_at = expires_at
+
+
+class TokenCache:
+    """
+    An LRU cache of verified tokens, bounded by size and TTL. An entry never outlives its token's `exp` claim,
+    and every entry for a user can be dropped at once when that user is deleted. The cache is per process, so
+    that only reaches the worker that deleted the user; elsewhere the entry lives out its TTL, which bounds how
+    long a deleted user's token is still accepted.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, VerifiedToken]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation so a lookup that raced with a deletion does not re-cache a stale result.
+        self.generation = 0
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        """
+        Looks up a previously verified token.
+
+        Args:
+            token (str): The raw JWT.
+
+        Returns:
+            Optional[VerifiedToken]: The cached verification, or None on a miss or if the entry expired.
+        """
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(token)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        token: str,
+        claims: Dict[str, Any],
+        user_id: Optional[int],
+        user_exists: bool,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Stores a verification result for at most `ttl_seconds`, and never past the token's `exp` claim.
+
+        Args:
+            token (str): The raw JWT.
+            claims (Dict[str, Any]): The decoded, signature-checked claims.
+            user_id (Optional[int]): The user the token names, if any.
+            user_exists (bool): Whether that user was found in the database.
+            generation (Optional[int]): The cache generation read before the database lookup; the result is
+                discarded if an invalidation happened in between.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        lifetime = self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            lifetime = min(lifetime, exp - time.time())
+        if lifetime <= 0 or self.max_size <= 0:
+            return
+        if token in self._entries:
+            self._remove(token)
+        self._entries[token] = VerifiedToken(
+            claims, user_id, user_exists, time.monotonic() + lifetime
+        )
+        if user_id is not None:
+            self._tokens_by_user.setdefault(user_id, set()).add(token)
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drops every cached token for a user, e.g. after the account is deleted.
+
+        Args:
+            user_id (int): The user whose tokens must be re-verified.
+        """
+        self.generation += 1
+        for token in self._tokens_by_user.pop(user_id, set()):
+            self._entries.pop(token, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache's counters.
+
+        Example:
+            get_cache().stats()
+            > {'size': 3, 'max_size': 10000, 'hits': 120, 'misses': 3, 'evictions': 0, 'invalidations': 0}
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is not None and entry.user_id is not None:
+            tokens = self._tokens_by_user.get(entry.user_id)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._tokens_by_user[entry.user_id]
+
+
+_cache = TokenCache(
+    max_size=project.settings.TOKEN_CACHE_MAX_SIZE,
+    ttl_seconds=project.settings.TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+def get_cache() -> TokenCache:
+    """
+    Returns the process-wide verified-token cache.
+    """
+    return _cache
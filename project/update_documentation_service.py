@@ -0,0 +1,65 @@
+from typing import Any, Dict
+
+import prisma
+import prisma.models
+import project.docs_catalogue_cache
+import project.docs_search_index
+import project.single_flight
+from pydantic import BaseModel
+
+
+class UpdateAPIDocumentationResponse(BaseModel):
+    """
+    The response model confirming the update of an API documentation entry.
+    """
+
+    success: bool
+    message: str
+
+
+async def update_documentation(
+    docId: int,
+    endpoint: str,
+    method: str,
+    description: str,
+    request: Dict[str, Any],
+    response: Dict[str, Any],
+) -> UpdateAPIDocumentationResponse:
+    """
+    Updates existing documentation by its id. It is critical to provide accurate and updated descriptions for endpoints.
+
+    Args:
+        docId (int): The unique identifier of the API documentation to be updated.
+        endpoint (str): The endpoint URL being documented.
+        method (str): HTTP method for the endpoint (e.g. GET, POST).
+        description (str): A detailed description of what the endpoint does.
+        request (Dict[str, Any]): The JSON structure representing the request payload for the endpoint.
+        response (Dict[str, Any]): The JSON structure representing the response payload for the endpoint.
+
+    Returns:
+        UpdateAPIDocumentationResponse: The response model confirming the update of an API documentation entry.
+
+    Example:
+        await update_documentation(1, "/hello", "GET", "Returns 'Hello, World!'.", {}, {"message": "Hello, World!"})
+        > UpdateAPIDocumentationResponse(success=True, message='API documentation updated successfully.')
+    """
+    updated_doc = await prisma.models.APIDocumentation.prisma().update(
+        where={"id": docId},
+        data={
+            "endpoint": endpoint,
+            "method": method,
+            "description": description,
+            "request": prisma.Json(request),
+            "response": prisma.Json(response),
+        },
+    )
+    if not updated_doc:
+        return UpdateAPIDocumentationResponse(
+            success=False, message="API documentation not found."
+        )
+    project.docs_catalogue_cache.get_cache().bump()
+    project.single_flight.get_group().forget("APIDocumentation")
+    project.docs_search_index.get_index().add(updated_doc)
+    return UpdateAPIDocumentationResponse(
+        success=True, message="API documentation updated successfully."
+    )
@@ -0,0 +1,60 @@
+from typing import Optional
+
+import prisma
+import prisma.enums
+import prisma.models
+import project.auth
+import project.password_hashing
+import project.single_flight
+from pydantic import BaseModel
+
+
+class UpdatedUserProfileResponse(BaseModel):
+    """
+    Response model containing the user's profile after the update.
+    """
+
+    id: int
+    email: str
+    role: prisma.enums.Role
+
+
+async def update_user_profile(
+    token: str, email: str, password: str, role: Optional[prisma.enums.Role] = None
+) -> UpdatedUserProfileResponse:
+    """
+    Updates the profile of the authenticated user. Requires a valid JWT token. Accepts updated user profile information and returns the updated profile.
+    Only an Admin may change their role; anyone else may only pass the role they already have.
+
+    Args:
+        token (str): The JWT token identifying the user to update.
+        email (str): The new email (username) for the user.
+        password (str): The new password; it is stored as a bcrypt hash.
+        role (Optional[prisma.enums.Role]): The new role; omit it to keep the current one.
+
+    Returns:
+        UpdatedUserProfileResponse: Response model containing the user's profile after the update.
+
+    Raises:
+        ValueError: If the token is invalid or the user does not exist.
+        PermissionError: If a user who is not an Admin asks for a different role.
+
+    Example:
+        await update_user_profile("some.jwt.token", "jane.doe", "new_password")
+        > UpdatedUserProfileResponse(id=1, email='jane.doe', role=<Role.User: 'User'>)
+    """
+    user_id = project.auth.user_id_from_token(token)
+    data = {"email": email}
+    if role is not None:
+        current = await prisma.models.User.prisma().find_unique(where={"id": user_id})
+        if not current:
+            raise ValueError("User not found")
+        if role != current.role and current.role != prisma.enums.Role.Admin:
+            raise PermissionError("Only administrators can change roles")
+        data["role"] = role
+    data["password"] = await project.password_hashing.hash_password(password)
+    user = await prisma.models.User.prisma().update(where={"id": user_id}, data=data)
+    if not user:
+        raise ValueError("User not found")
+    project.single_flight.get_group().forget("User")
+    return UpdatedUserProfileResponse(id=user.id, email=user.email, role=user.role)
@@ -0,0 +1,134 @@
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+import prisma
+import project.settings
+
+T = TypeVar("T")
+
+# A write receives the client to run on: the batch's transaction, or None for the default client.
+Write = Callable[[Optional[prisma.Prisma]], Awaitable[T]]
+
+
+class WriteBatcher:
+    """
+    Collects concurrent writes for up to `window_seconds`, or until `max_items` are waiting, and commits them in
+    one transaction, so a burst of inserts pays for one commit instead of one each. Every caller still gets
+    its own result.
+
+    If any write in a batch fails, the transaction rolls back and each write of the batch is retried in its
+    own transaction, so only the callers whose writes fail see an error. Writes therefore have to be safe to
+    run twice after a rollback, which plain creates and upserts are.
+    """
+
+    def __init__(self, window_seconds: float, max_items: int, enabled: bool = True) -> None:
+        self.window_seconds = window_seconds
+        self.max_items = max(1, max_items)
+        self.enabled = enabled
+        self._pending: List[Tuple[Write[Any], "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.batches = 0
+        self.items = 0
+        self.max_batch = 0
+        self.fallbacks = 0
+
+    async def submit(self, write: Write[T]) -> T:
+        """
+        Runs `write` as part of the next batch and returns its result.
+
+        Args:
+            write (Write[T]): Performs one write on the client it is given, e.g.
+                `lambda client: prisma.models.Question.prisma(client).create(data=...)`.
+
+        Returns:
+            T: What `write` returned.
+
+        Example:
+            question = await get_batcher().submit(
+                lambda client: prisma.models.Question.prisma(client).create(data=data)
+            )
+        """
+        if not self.enabled:
+            return await write(None)
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[T]" = loop.create_future()
+        self._pending.append((write, future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                self.window_seconds, self._flush, context=contextvars.Context()
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        # Callers cancelled while waiting for the window are dropped before anything is written.
+        batch = [(write, future) for write, future in batch if not future.done()]
+        if not batch:
+            return
+        # A batch serves several requests, so it runs outside the context of whichever one flushed it (its
+        # queries are not charged to that request's query budget).
+        task = asyncio.get_running_loop().create_task(
+            self._commit(batch), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _commit(self, batch: List[Tuple[Write[Any], "asyncio.Future[Any]"]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        self.max_batch = max(self.max_batch, len(batch))
+        if len(batch) == 1:
+            await self._run_alone(*batch[0])
+            return
+        try:
+            async with prisma.get_client().tx() as transaction:
+                results = [await write(transaction) for write, _ in batch]
+        except Exception:
+            self.fallbacks += 1
+            await asyncio.gather(*(self._run_alone(write, future) for write, future in batch))
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    async def _run_alone(write: Write[Any], future: "asyncio.Future[Any]") -> None:
+        try:
+            result = await write(None)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "max_batch": self.max_batch,
+            "avg_batch": self.items / self.batches if self.batches else 0.0,
+            "fallbacks": self.fallbacks,
+            "pending": len(self._pending),
+        }
+
+
+_batcher = WriteBatcher(
+    window_seconds=project.settings.WRITE_BATCH_WINDOW_MS / 1000,
+    max_items=project.settings.WRITE_BATCH_MAX_ITEMS,
+    enabled=project.settings.WRITE_BATCHING_ENABLED,
+)
+
+
+def get_batcher() -> WriteBatcher:
+    """
+    Returns the process-wide batcher for documentation and Q&A inserts.
+    """
+    return _batcher
@@ -0,0 +1,40 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def prisma_client():
+    """
+    The shared Prisma client, for tests that need a real Postgres. They are skipped unless DATABASE_URL points
+    at a database with the schema applied (`prisma db push`) and the client has been generated.
+    """
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+    import project.database
+
+    return project.database.create_client()
+
+
+@pytest.fixture
+def database(prisma_client) -> Callable[[Callable[[Any], Awaitable[Any]]], Any]:
+    """
+    Runs `test(client)` on a fresh event loop with the client connected, and returns its result.
+
+    Example:
+        rows = database(lambda client: client.apidocumentation.find_many())
+    """
+
+    def run(test: Callable[[Any], Awaitable[Any]]) -> Any:
+        async def connected() -> Any:
+            await prisma_client.connect()
+            try:
+                return await test(prisma_client)
+            finally:
+                await prisma_client.disconnect()
+
+        return asyncio.run(connected())
+
+    return run
@@ -0,0 +1,60 @@
+import asyncio
+import types
+
+import pytest
+
+prisma_models = pytest.importorskip("prisma.models")
+
+import prisma  # noqa: E402
+import project.bulk_import_documentation_service as bulk  # noqa: E402
+
+
+class FakeBatch:
+    def __init__(self):
+        self.apidocumentation = self
+        self.upserts = 0
+
+    def upsert(self, where, data):
+        self.upserts += 1
+
+
+def _import(monkeypatch, commit, find_many):
+    batch = FakeBatch()
+    monkeypatch.setattr(prisma, "get_client", lambda: types.SimpleNamespace(batch_=lambda: batch))
+    monkeypatch.setattr(bulk.project.query_instrumentation, "execute_batch", commit)
+
+    class Actions:
+        async def find_many(self, where):
+            return await find_many(where)
+
+    monkeypatch.setattr(prisma_models.APIDocumentation, "prisma", lambda: Actions())
+    entries = [
+        {"endpoint": f"/tests/bulk/{i}", "method": "GET", "description": "Imported."} for i in range(3)
+    ]
+    return asyncio.run(bulk.bulk_import_documentation(bulk.iter_items(entries)))
+
+
+def test_a_failed_read_back_still_reports_the_committed_entries(monkeypatch):
+    async def commit(batch, model_name):
+        pass
+
+    async def find_many(where):
+        raise RuntimeError("connection reset")
+
+    response = _import(monkeypatch, commit, find_many)
+
+    assert (response.imported, response.failed) == (3, 0)
+    assert [result.api_doc_id for result in response.results] == [None, None, None]
+
+
+def test_a_failed_commit_fails_the_whole_chunk(monkeypatch):
+    async def commit(batch, model_name):
+        raise RuntimeError("deadlock detected")
+
+    async def find_many(where):
+        raise AssertionError("nothing to read back")
+
+    response = _import(monkeypatch, commit, find_many)
+
+    assert (response.imported, response.failed) == (0, 3)
+    assert {result.error for result in response.results} == {"deadlock detected"}
@@ -0,0 +1,33 @@
+import asyncio
+import uuid
+
+
+def test_concurrent_creates_store_one_row(database):
+    import prisma.models
+    import project.create_documentation_service
+
+    endpoint = f"/tests/concurrent-create/{uuid.uuid4().hex}"
+
+    async def publish_concurrently(client):
+        try:
+            responses = await asyncio.gather(
+                *(
+                    project.create_documentation_service.create_documentation(
+                        endpoint, "GET", f"Version {i}.", {}, {"message": "string"}
+                    )
+                    for i in range(20)
+                )
+            )
+            rows = await prisma.models.APIDocumentation.prisma().find_many(
+                where={"endpoint": endpoint, "method": "GET"}
+            )
+            return responses, rows
+        finally:
+            await prisma.models.APIDocumentation.prisma().delete_many(
+                where={"endpoint": endpoint}
+            )
+
+    responses, rows = database(publish_concurrently)
+
+    assert len(rows) == 1
+    assert {response.api_doc_id for response in responses} == {rows[0].id}
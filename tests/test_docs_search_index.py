@@ -0,0 +1,40 @@
+import types
+
+import pytest
+
+pytest.importorskip("prisma.models")
+
+import project.docs_search_index  # noqa: E402
+
+
+def _index(count: int) -> project.docs_search_index.DocsSearchIndex:
+    index = project.docs_search_index.DocsSearchIndex(refresh_seconds=0)
+    for id in range(count):
+        index.add(
+            types.SimpleNamespace(
+                id=id, endpoint=f"/api/resource{id}", method="GET", description="Reads an item."
+            )
+        )
+    return index
+
+
+def test_prefixes_match_every_term_they_start():
+    hits = _index(500).search("resource49", limit=1000)
+
+    assert {hit.endpoint for hit in hits} == {"/api/resource49"} | {
+        f"/api/resource{id}" for id in range(490, 500)
+    }
+
+
+def test_a_prefix_reaches_terms_sorted_after_many_others():
+    hits = _index(500).search("res", limit=1000)
+
+    assert len(hits) == 500
+
+
+def test_short_tokens_only_match_whole_words():
+    index = _index(3)
+
+    assert index.search("re") == []
+    assert index.search("it") == []
+    assert len(index.search("an item")) == 3
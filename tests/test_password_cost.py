@@ -0,0 +1,44 @@
+import threading
+import time
+
+import project.password_cost
+import project.password_hashing
+
+
+def test_workers_starting_together_calibrate_once(monkeypatch, tmp_path):
+    calibrations = []
+
+    def calibrate(target_ms, min_rounds):
+        calibrations.append(target_ms)
+        time.sleep(0.05)
+        return {"rounds": 11 + len(calibrations), "hash_ms": 200.0}
+
+    monkeypatch.setattr(project.password_cost, "calibrate", calibrate)
+    path = str(tmp_path / "bcrypt_cost.json")
+    results = []
+    workers = [
+        threading.Thread(
+            target=lambda: results.append(project.password_cost.calibrate_once(path, 250.0, 10)["rounds"])
+        )
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(calibrations) == 1
+    assert results == [12, 12, 12, 12]
+    assert project.password_cost.load(path)["rounds"] == 12
+
+
+def test_hashes_are_only_rehashed_to_a_higher_cost(monkeypatch):
+    hashed = "$2b$12$EIXIzK9E9Lp5b/r9Q5K9De5GQsL9uZw4qe1kDkNOEeD9OH/xOoG8T"
+
+    monkeypatch.setattr(project.password_hashing, "_rounds", 13)
+    assert project.password_hashing.needs_rehash(hashed)
+    monkeypatch.setattr(project.password_hashing, "_rounds", 12)
+    assert not project.password_hashing.needs_rehash(hashed)
+    monkeypatch.setattr(project.password_hashing, "_rounds", 11)
+    assert not project.password_hashing.needs_rehash(hashed)
+    assert project.password_hashing.needs_rehash("plain-text-password")
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+prisma_models = pytest.importorskip("prisma.models")
+
+import project.qa_aggregates  # noqa: E402
+
+
+class FakeTables:
+    """
+    Answers the aggregates' COUNT and GROUP BY queries from in-memory rows, running `during` (a write) right
+    after the query named `write_after` has read the tables.
+    """
+
+    def __init__(self, aggregates, write_after: str):
+        self.aggregates = aggregates
+        self.write_after = write_after
+        self.users = [1, 2]
+        self.questions = [(10, 1)]
+        self.answers = [(10, 2)]
+
+    def write(self) -> None:
+        # A new answer by user 1 on question 10 commits, and the service then records it.
+        self.answers.append((10, 1))
+        self.aggregates.answer_created(10, 1)
+
+    def actions(self, table: str):
+        tables = self
+
+        class Actions:
+            async def count(self):
+                result = len(getattr(tables, table))
+                await tables.after(f"{table}.count")
+                return result
+
+            async def group_by(self, by, count):
+                field = by[0]
+                column = 1 if field == "authorId" else 0
+                counts = {}
+                for row in getattr(tables, table):
+                    counts[row[column]] = counts.get(row[column], 0) + 1
+                await tables.after(f"{table}.{field}")
+                return [{field: key, "_count": {"_all": value}} for key, value in counts.items()]
+
+        return lambda: Actions()
+
+    async def after(self, query: str) -> None:
+        if query == self.write_after:
+            self.write()
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize(
+    "write_after",
+    ["users.count", "questions.count", "answers.count", "answers.questionId", "answers.authorId"],
+)
+def test_rebuild_counts_writes_made_during_the_load_once(monkeypatch, write_after):
+    aggregates = project.qa_aggregates.QAAggregates()
+    tables = FakeTables(aggregates, write_after)
+    monkeypatch.setattr(prisma_models.User, "prisma", tables.actions("users"))
+    monkeypatch.setattr(prisma_models.Question, "prisma", tables.actions("questions"))
+    monkeypatch.setattr(prisma_models.Answer, "prisma", tables.actions("answers"))
+
+    asyncio.run(aggregates.rebuild())
+
+    assert (aggregates.users, aggregates.questions, aggregates.answers) == (2, 1, 2)
+    assert aggregates.answers_per_question == {10: 2}
+    assert aggregates.answers_per_user == {1: 1, 2: 1}
+    assert aggregates.questions_per_user == {1: 1}
@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def plans(prisma_client):
+    import project.query_plans
+
+    async def explain():
+        await prisma_client.connect()
+        try:
+            return await project.query_plans.explain_shapes(
+                prisma_client, users=10000, questions=100000, answers_per_question=5, docs=10000
+            )
+        finally:
+            await prisma_client.disconnect()
+
+    return asyncio.run(explain())
+
+
+def test_every_query_shape_is_explained(plans):
+    import project.query_plans
+
+    assert list(plans) == [shape.name for shape in project.query_plans.QUERY_SHAPES]
+
+
+def test_no_query_shape_scans_a_seeded_table_sequentially(plans):
+    import project.query_plans
+
+    regressions = {
+        name: project.query_plans.sequential_scans(plan)
+        for name, plan in plans.items()
+        if project.query_plans.sequential_scans(plan)
+    }
+
+    assert regressions == {}
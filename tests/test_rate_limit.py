@@ -0,0 +1,69 @@
+import uuid
+
+from fastapi.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+import project.rate_limit
+
+
+async def _login(scope, receive, send) -> None:
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+def _client(trusted_proxies: int) -> TestClient:
+    app = project.rate_limit.AdmissionControlMiddleware(
+        _login,
+        paths=["/api/login"],
+        per_ip=project.rate_limit.TokenBucketLimiter(0.001, 3, max_keys=1000),
+        per_username=project.rate_limit.TokenBucketLimiter(1000.0, 1000, max_keys=1000),
+        trusted_proxies=trusted_proxies,
+    )
+    return TestClient(app)
+
+
+def _statuses(client: TestClient, forwarded_for, attempts: int = 10):
+    return [
+        client.post(
+            "/api/login",
+            params={"username": f"user{i}", "password": "guess"},
+            headers={"X-Forwarded-For": forwarded_for(i)},
+        ).status_code
+        for i in range(attempts)
+    ]
+
+
+def test_spoofed_forwarded_for_entries_share_the_proxy_seen_address():
+    # The attacker sends a fresh made-up address each time; the proxy appends the real one on the right.
+    statuses = _statuses(
+        _client(trusted_proxies=1), lambda i: f"{uuid.uuid4().hex}, 203.0.113.7"
+    )
+
+    assert statuses[:3] == [200, 200, 200]
+    assert set(statuses[3:]) == {429}
+
+
+def test_addresses_are_counted_from_the_right_past_each_trusted_proxy():
+    statuses = _statuses(
+        _client(trusted_proxies=2),
+        lambda i: f"{uuid.uuid4().hex}, 203.0.113.7, 10.0.0.{i}",
+    )
+
+    assert set(statuses[3:]) == {429}
+
+
+def test_distinct_clients_behind_the_proxy_get_their_own_buckets():
+    statuses = _statuses(_client(trusted_proxies=1), lambda i: f"198.51.100.{i}")
+
+    assert set(statuses) == {200}
+
+
+def test_headers_that_skipped_the_proxies_fall_back_to_the_connecting_address():
+    statuses = _statuses(_client(trusted_proxies=2), lambda i: f"198.51.100.{i}")
+
+    assert set(statuses[3:]) == {429}
+
+
+def test_forwarded_for_is_ignored_without_trusted_proxies():
+    statuses = _statuses(_client(trusted_proxies=0), lambda i: f"198.51.100.{i}")
+
+    assert set(statuses[3:]) == {429}